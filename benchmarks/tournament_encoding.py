@@ -0,0 +1,96 @@
+"""
+Compare les formats de fichier de tournoi "json" et "binary" (TOURNAMENT_ENCODING) :
+taille sur disque, temps d'encodage, de décodage et de reconstruction du modèle.
+
+Usage (depuis la racine du projet) :
+    python -m benchmarks.tournament_encoding --players 200 --rounds 9
+"""
+import argparse
+import json
+import random
+import string
+import timeit
+
+from controllers.tournament_controller import TournamentController
+from models.player_model import Player
+from models.round_model import Round
+from models.tournament_model import Tournament
+from storage.tournament_codec import decode_tournament, encode_tournament_binary
+from storage.tournament_document import encode_tournament
+from utils.update_ranks import update_ranks
+
+
+def build_tournament(players: int, rounds: int, seed: int) -> Tournament:
+    """
+    Simule un tournoi complet (appariements suisses, résultats aléatoires, snapshots).
+    """
+    rng = random.Random(seed)
+    random.seed(seed)
+    ids = set()
+    while len(ids) < players:
+        ids.add("".join(rng.choices(string.ascii_uppercase, k=2)) + f"{rng.randrange(100000):05d}")
+    tournament = Tournament(
+        tournament_name="BENCHMARK",
+        location="PARIS",
+        start_date="01/01/2025",
+        end_date="02/01/2025",
+        number_of_rounds=rounds,
+        description="Tournoi simulé",
+        list_of_players=[Player(idn) for idn in sorted(ids)],
+    )
+    for number in range(1, rounds + 1):
+        rnd = Round(f"Round {number}")
+        rnd.start_round()
+        rnd.generate_pairings(tournament.list_of_players)
+        for match in rnd.matches:
+            if match.player_2 is not None:
+                match.assign_color()
+                match.apply_result(rng.choice([1, 2, 3]))
+            elif match._snap1 is not None:
+                match.apply_result(0)
+            update_ranks(tournament)
+            match.snapshot()
+        rnd.end_round()
+        tournament.list_of_rounds.append(rnd)
+        tournament.actual_round = number
+    return tournament
+
+
+def best_of(func, repeat: int) -> float:
+    """Meilleur temps (en ms) de `repeat` exécutions de `func`."""
+    return min(timeit.repeat(func, number=1, repeat=repeat)) * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=200)
+    parser.add_argument("--rounds", type=int, default=9)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    data = build_tournament(args.players, args.rounds, args.seed).get_serialized_tournament()
+    json_payload, _ = encode_tournament(data)
+    binary_payload = encode_tournament_binary(data)
+    # Les deux formats doivent restituer exactement le même tournoi
+    assert json.loads(json_payload) == data == decode_tournament(binary_payload)
+
+    print(f"Tournoi simulé : {args.players} joueurs, {args.rounds} rounds\n")
+    print(f"{'':28}{'json':>12}{'binary':>12}")
+    print(f"{'taille (octets)':28}{len(json_payload):>12}{len(binary_payload):>12}")
+    rows = [
+        ("encodage (ms)", lambda: encode_tournament(data), lambda: encode_tournament_binary(data)),
+        ("décodage (ms)", lambda: json.loads(json_payload), lambda: decode_tournament(binary_payload)),
+        (
+            "décodage + modèle (ms)",
+            lambda: TournamentController._build_from_data(json.loads(json_payload)),
+            lambda: TournamentController._build_from_data(decode_tournament(binary_payload)),
+        ),
+    ]
+    for label, json_func, binary_func in rows:
+        print(f"{label:28}{best_of(json_func, args.repeat):>12.2f}{best_of(binary_func, args.repeat):>12.2f}")
+    print(f"\nRatio de taille : {len(json_payload) / len(binary_payload):.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+Compare les fichiers de tournoi avec snapshots complets (schéma 1) et normalisés
+(schéma 2, champs cumulés reconstruits à la lecture) : taille sur disque et temps
+de chargement, aux formats "json" et "binary".
+
+Usage (depuis la racine du projet) :
+    python -m benchmarks.tournament_snapshots --players 500 --rounds 11
+"""
+import argparse
+
+from benchmarks.tournament_encoding import best_of, build_tournament
+from controllers.tournament_controller import TournamentController
+from storage.tournament_codec import decode_tournament, encode_tournament_binary
+from storage.tournament_document import encode_tournament
+from storage.tournament_snapshots import normalize_snapshots
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--players", type=int, default=500)
+    parser.add_argument("--rounds", type=int, default=11)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--seed", type=int, default=1)
+    args = parser.parse_args()
+
+    data = build_tournament(args.players, args.rounds, args.seed).get_serialized_tournament()
+    normalized = normalize_snapshots(data)
+    payloads = {
+        "json complet": encode_tournament(data)[0],
+        "json normalisé": encode_tournament(normalized)[0],
+        "binary complet": encode_tournament_binary(data),
+        "binary normalisé": encode_tournament_binary(normalized),
+    }
+    # Chaque forme doit restituer exactement le même tournoi
+    for payload in payloads.values():
+        assert decode_tournament(payload) == data
+
+    print(f"Tournoi simulé : {args.players} joueurs, {args.rounds} rounds\n")
+    print(f"{'':20}{'taille (octets)':>18}{'décodage (ms)':>16}{'+ modèle (ms)':>16}")
+    for label, payload in payloads.items():
+        decode_ms = best_of(lambda: decode_tournament(payload), args.repeat)
+        model_ms = best_of(lambda: TournamentController._build_from_data(decode_tournament(payload)), args.repeat)
+        print(f"{label:20}{len(payload):>18}{decode_ms:>16.2f}{model_ms:>16.2f}")
+    print()
+    for encoding in ("json", "binary"):
+        ratio = len(payloads[f"{encoding} complet"]) / len(payloads[f"{encoding} normalisé"])
+        print(f"Ratio de taille ({encoding}) : {ratio:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -8,6 +8,103 @@ PLAYERS_FOLDER = os.path.join(BASE_DATA_FOLDER, "players")
 PLAYERS_FILENAME = "{id_input}.json"
 TOURNAMENTS_FOLDER = os.path.join(BASE_DATA_FOLDER, "tournaments")
 
+# Backend de stockage : "json" (fichiers dans data/) ou "sqlite" (base SQLITE_DATABASE)
+STORAGE_BACKEND = "json"
+SQLITE_DATABASE = os.path.join(BASE_DATA_FOLDER, "chess.sqlite3")
+
+# Disposition du stockage des joueurs (backend "json") :
+# - "flat"     : un fichier PLAYERS_FILENAME par joueur dans PLAYERS_FOLDER
+# - "sharded"  : comme "flat", réparti en sous-dossiers selon le début de l'IDN
+#                (ex : AB/12/AB12345.json) pour les très gros registres
+# - "registry" : un fichier de données unique (ajout seul) + un index de hachage sur disque
+# `python main.py migrate-players` déplace les fichiers existants entre "flat" et "sharded".
+PLAYERS_LAYOUT = "flat"
+PLAYERS_REGISTRY_DATA = "registry.dat"
+PLAYERS_REGISTRY_INDEX = "registry.idx"
+REGISTRY_COMPACTION_RATIO = 0.5
+REGISTRY_COMPACTION_MIN_BYTES = 1024 * 1024
+
+# Nombre maximal de profils joueurs gardés en mémoire (cache LRU, disposition "flat")
+PLAYER_CACHE_SIZE = 1024
+
+# Nombre de fichiers joueurs lus en parallèle lors d'un chargement complet (disposition "flat")
+PLAYER_LOAD_WORKERS = 8
+
+# Manifeste des fichiers joueurs (fichier dans PLAYERS_FOLDER, dispositions "flat" et "sharded") :
+# taille, date de modification et profil de chaque fichier, pour ne relire que les fichiers modifiés.
+PLAYERS_MANIFEST = "players.manifest"
+
+# Index de recherche des joueurs par nom (fichier dans PLAYERS_FOLDER, tenu à jour à chaque
+# sauvegarde) et nombre maximal de résultats affichés par recherche.
+PLAYERS_NAME_INDEX = "names.idx"
+PLAYER_SEARCH_LIMIT = 10
+
+# Table des joueurs à enregistrements de taille fixe, mappée en mémoire (dossier dans
+# PLAYERS_FOLDER, un fichier par préfixe d'IDN) : construite par `python main.py build-player-table`,
+# puis tenue à jour à chaque sauvegarde, pour les outils qui lisent des millions de profils.
+PLAYERS_TABLE = "table"
+
+# Version courante du schéma des documents joueurs et tournois (clé "schema_version").
+# Les documents plus anciens sont migrés à la lecture ; `python main.py migrate-schema`
+# réécrit tout le dossier de données avec SCHEMA_MIGRATION_WORKERS processus.
+# Version 2 des tournois : snapshots des matchs enregistrés sans leurs champs cumulés
+# (score du tournoi, adversaires), reconstruits à la lecture.
+PLAYER_SCHEMA_VERSION = 1
+TOURNAMENT_SCHEMA_VERSION = 2
+SCHEMA_MIGRATION_WORKERS = 4
+
+# Import en masse des joueurs (`python main.py import-players`) : nombre de joueurs
+# validés écrits en une seule opération de stockage.
+PLAYER_IMPORT_BATCH_SIZE = 1000
+
+# Journal des tournois (backend "json") : chaque modification est ajoutée à un fichier
+# "<tournoi>.journal" au lieu de réécrire tout le JSON ; le JSON complet (checkpoint) n'est
+# réécrit que tous les JOURNAL_CHECKPOINT_INTERVAL événements.
+TOURNAMENT_JOURNAL = True
+JOURNAL_EXTENSION = ".journal"
+JOURNAL_CHECKPOINT_INTERVAL = 100
+
+# Verrou des tournois (backend "json") : fichier "<tournoi>.lock" verrouillé (fcntl, msvcrt
+# sous Windows) pendant chaque écriture. La révision du tournoi est enregistrée à côté, dans
+# "<tournoi>.revision" (réécrit de façon atomique). Plusieurs terminaux peuvent ainsi saisir
+# les résultats d'un même tournoi : les écritures des autres sont fusionnées.
+TOURNAMENT_LOCK_EXTENSION = ".lock"
+TOURNAMENT_REVISION_EXTENSION = ".revision"
+
+# Format des fichiers de tournoi (backend "json") : "json" (lisible, par défaut) ou "binary"
+# (dictionnaire des IDN, scores sur un octet). Les deux formats sont lus quel que soit ce réglage.
+TOURNAMENT_ENCODING = "json"
+
+# Disposition des tournois (backend "json") :
+# - "file"  : un fichier JSON par tournoi ;
+# - "split" : un dossier par tournoi (en-tête et joueurs, un fichier par round terminé,
+#   un fichier pour le round en cours) : une sauvegarde ne réécrit pas les rounds terminés.
+# `python main.py convert-layout` convertit les tournois existants vers cette disposition.
+TOURNAMENT_LAYOUT = "file"
+
+# Index des offsets écrit avec chaque checkpoint ("<tournoi>.idx") : permet de lire
+# l'en-tête et les joueurs d'un tournoi sans désérialiser ses rounds.
+TOURNAMENT_INDEX_EXTENSION = ".idx"
+
+# Catalogue des tournois (backend "json") : résumé de chaque tournoi, tenu à jour
+# à chaque sauvegarde, pour lister les tournois sans relire leurs fichiers.
+TOURNAMENT_CATALOG = "catalog.manifest"
+
+# Archive des tournois terminés (backend "json") : chaque tournoi y est compressé
+# séparément ("zlib" ou "lzma") pour rester lisible sans décompresser les autres.
+TOURNAMENT_ARCHIVE = "tournaments.archive"
+ARCHIVE_CODEC = "lzma"
+
+# Écriture différée : les sauvegardes complètes des tournois sont écrites par un thread
+# dédié (fichier temporaire + fsync + os.replace), sans bloquer l'interface.
+WRITE_BEHIND = True
+WRITE_BEHIND_QUEUE_SIZE = 32
+
+# Versions précédentes conservées de chaque fichier de tournoi ("<fichier>.1" la plus récente).
+# Chaque fichier porte une somme de contrôle : s'il est corrompu au chargement,
+# la version valide la plus récente est restaurée.
+TOURNAMENT_GENERATIONS = 3
+
 DATE_INPUT_FORMAT = "%d%m%Y"
 DATE_STORAGE_FORMAT = "%d/%m/%Y"
 DATE_LENGTH = 8
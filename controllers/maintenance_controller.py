@@ -0,0 +1,147 @@
+from config import PLAYERS_FOLDER, PLAYERS_LAYOUT, SCHEMA_MIGRATION_WORKERS, TOURNAMENTS_FOLDER, TOURNAMENT_LAYOUT
+from storage.data_export import (
+    GAME_EXPORT_FIELDS,
+    PLAYER_EXPORT_FIELDS,
+    export_rows,
+    iter_game_rows,
+    iter_player_rows
+)
+from storage.player_data import build_player_table, migrate_player_files
+from storage.player_import import import_players
+from storage.schema_migration import migrate_schema
+from storage.tournament_data import archive_finished_tournaments, convert_tournaments_layout
+from storage.write_behind import drain_writes
+from utils.date_helpers import parse_raw_date
+from views.maintenance_view import MaintenanceView
+
+
+class MaintenanceController:
+    """
+    Contrôleur des opérations de maintenance des données, lancées en ligne de commande
+    (voir main.py) plutôt que depuis le menu interactif.
+    """
+
+    @staticmethod
+    def archive_tournaments() -> None:
+        """
+        Range les tournois terminés dans l'archive compressée et affiche le bilan.
+        """
+        report = archive_finished_tournaments(TOURNAMENTS_FOLDER)
+        drain_writes()
+        MaintenanceView.show_archive_report(report)
+
+    @staticmethod
+    def convert_tournaments_layout() -> None:
+        """
+        Convertit les tournois enregistrés vers la disposition configurée (TOURNAMENT_LAYOUT).
+        """
+        converted = convert_tournaments_layout(TOURNAMENTS_FOLDER)
+        MaintenanceView.show_layout_report(converted, TOURNAMENT_LAYOUT)
+
+    @staticmethod
+    def migrate_players() -> None:
+        """
+        Range les fichiers joueurs selon la disposition configurée (PLAYERS_LAYOUT).
+        """
+        report = migrate_player_files(PLAYERS_FOLDER)
+        MaintenanceView.show_players_migration_report(report, PLAYERS_LAYOUT)
+
+    @staticmethod
+    def migrate_schema(workers: int | None = None) -> None:
+        """
+        Met tous les documents joueurs et tournois à la version courante du schéma.
+
+        Args:
+            workers (int | None): Nombre de processus (par défaut : SCHEMA_MIGRATION_WORKERS).
+        """
+        report = migrate_schema(PLAYERS_FOLDER, TOURNAMENTS_FOLDER, workers or SCHEMA_MIGRATION_WORKERS)
+        MaintenanceView.show_schema_migration_report(report)
+
+    @staticmethod
+    def import_players(source: str, rejects_path: str | None = None) -> None:
+        """
+        Importe les joueurs d'un fichier CSV ou NDJSON et affiche le bilan.
+
+        Args:
+            source (str): Le fichier à importer.
+            rejects_path (str | None): Le fichier des lignes rejetées.
+        """
+        try:
+            report = import_players(source, PLAYERS_FOLDER, rejects_path)
+        except (OSError, ValueError) as e:
+            MaintenanceView.show_import_error(source, e)
+            return
+        MaintenanceView.show_import_report(source, report)
+
+    @staticmethod
+    def build_player_table() -> None:
+        """
+        Construit la table des joueurs mappée en mémoire et affiche le nombre de profils écrits.
+        """
+        try:
+            count = build_player_table(PLAYERS_FOLDER)
+        except ValueError as e:
+            MaintenanceView.show_player_table_error(e)
+            return
+        MaintenanceView.show_player_table_report(count)
+
+    @staticmethod
+    def export_players(destination: str, export_format: str | None = None, idns: list[str] | None = None) -> None:
+        """
+        Exporte les profils joueurs (éventuellement filtrés par IDN) en CSV ou NDJSON.
+
+        Args:
+            destination (str): Le fichier à écrire ("-" : sortie standard).
+            export_format (str | None): "csv" ou "ndjson" (par défaut : selon l'extension).
+            idns (list[str] | None): Les joueurs à exporter (tous par défaut).
+        """
+        rows = iter_player_rows(PLAYERS_FOLDER, [idn.strip().upper() for idn in idns or []])
+        MaintenanceController._export(rows, destination, PLAYER_EXPORT_FIELDS, export_format)
+
+    @staticmethod
+    def export_games(
+        destination: str,
+        export_format: str | None = None,
+        tournaments: list[str] | None = None,
+        date_from: str | None = None,
+        date_to: str | None = None,
+        idns: list[str] | None = None,
+    ) -> None:
+        """
+        Exporte les parties de tous les tournois en CSV ou NDJSON, éventuellement
+        filtrées par tournoi, par période (dates JJMMAAAA incluses) ou par joueur.
+
+        Args:
+            destination (str): Le fichier à écrire ("-" : sortie standard).
+            export_format (str | None): "csv" ou "ndjson" (par défaut : selon l'extension).
+            tournaments (list[str] | None): Les tournois à exporter (tous par défaut).
+            date_from (str | None): Première date incluse.
+            date_to (str | None): Dernière date incluse.
+            idns (list[str] | None): Les joueurs dont exporter les parties (tous par défaut).
+        """
+        dates = []
+        for value in (date_from, date_to):
+            parsed = parse_raw_date(value) if value else None
+            if value and parsed is None:
+                MaintenanceView.show_export_error(destination, ValueError(f"date invalide : {value!r}"))
+                return
+            dates.append(parsed)
+        rows = iter_game_rows(
+            TOURNAMENTS_FOLDER,
+            tournaments,
+            dates[0],
+            dates[1],
+            [idn.strip().upper() for idn in idns or []],
+        )
+        MaintenanceController._export(rows, destination, GAME_EXPORT_FIELDS, export_format)
+
+    @staticmethod
+    def _export(rows, destination: str, fields: tuple, export_format: str | None) -> None:
+        """Écrit les lignes d'un export et affiche le bilan (sauf sur la sortie standard)."""
+        try:
+            count = export_rows(rows, destination, fields, export_format)
+        except (OSError, ValueError) as e:
+            MaintenanceView.show_export_error(destination, e)
+            return
+        if destination != "-":
+            MaintenanceView.show_export_report(destination, count)
@@ -4,7 +4,8 @@ from config import DRAW_POINT, TOURNAMENTS_FOLDER, ENTER_FOR_CONTINUE
 from models.match_model import Match
 from models.round_model import Round
 from models.tournament_model import Tournament
-from storage.tournament_data import save_tournament_to_json
+from storage.tournament_data import record_tournament_event
+from storage.tournament_session import tournament_transaction, flush_tournament
 from utils.console import wait_for_enter
 from utils.update_ranks import update_ranks
 from views.match_view import MatchView
@@ -25,6 +26,7 @@ class MatchController:
         2) Applies result (auto-assigns a draw for byes or prompts user)
         3) Finalizes match: shows result, updates snapshots/rankings, persists state,
            and waits for user confirmation.
+        All changes made by the match are persisted in a single write.
 
         Args:
             match:      The Match instance to play.
@@ -32,30 +34,31 @@ class MatchController:
             tournament: Optional Tournament for ranking and persistence.
             filename:   Optional JSON filename for saving tournament.
         """
-        # 1) Pre-match setup
-        MatchController._before_match(current_round, tournament)
-
-        name_lower = match.name.lower()
-        is_bye = "repos" in name_lower
-
-        # 2) Determine and apply result
-        if is_bye:
-            if not match.player_1:
-                RoundView.show_error("Impossible d'identifier le joueur de repos pour ce match.")
-                return
-            if match.match_score_1 is None:
-                MatchController._apply_and_rank(match, DRAW_POINT, tournament)
+        with tournament_transaction(tournament):
+            # 1) Pre-match setup
+            MatchController._before_match(current_round, tournament)
+
+            name_lower = match.name.lower()
+            is_bye = "repos" in name_lower
+
+            # 2) Determine and apply result
+            if is_bye:
+                if not match.player_1:
+                    RoundView.show_error("Impossible d'identifier le joueur de repos pour ce match.")
+                    return
+                if match.match_score_1 is None:
+                    MatchController._apply_and_rank(match, DRAW_POINT, tournament)
+                else:
+                    MatchController._rank_and_snapshot(match, tournament)
             else:
-                MatchController._rank_and_snapshot(match, tournament)
-        else:
-            choice = MatchView.ask_match_result(match)
-            MatchController._apply_and_rank(match, choice, tournament)
+                choice = MatchView.ask_match_result(match)
+                MatchController._apply_and_rank(match, choice, tournament)
 
-        # Intermediate snapshot
-        match.snapshot()
+            # Intermediate snapshot
+            match.snapshot()
 
-        # 3) Post-match finalization
-        MatchController._finalize_match(match, current_round, tournament, filename)
+            # 3) Post-match finalization
+            MatchController._finalize_match(match, current_round, tournament, filename)
 
     @staticmethod
     def _before_match(
@@ -148,23 +151,34 @@ class MatchController:
     @staticmethod
     def _show_and_save_results(
         match: Match,
+        current_round: Round,
         tournament: Optional[Tournament] = None,
         filename: str = None
     ) -> None:
         """
-        Displays the final result of the match and saves the tournament state.
+        Displays the final result of the match and journals it as a
+        "result_recorded" event.
 
         Args:
             match:      The Match whose results to display.
+            current_round: The Round containing the match.
             tournament: Optional Tournament to persist.
             filename:   JSON filename for saving.
         """
         MatchView.show_match_results(match)
         if tournament and filename:
-            save_tournament_to_json(
-                tournament.get_serialized_tournament(),
-                TOURNAMENTS_FOLDER,
-                filename
+            record_tournament_event(
+                tournament, TOURNAMENTS_FOLDER, filename,
+                "result_recorded",
+                {
+                    "round": tournament.list_of_rounds.index(current_round),
+                    "match": current_round.matches.index(match),
+                    "match_data": match.get_serialized_match(),
+                    "players": [
+                        p.get_tournament_data() for p in (match.player_1, match.player_2) if p
+                    ],
+                    "ranks": {p.id_national_chess: p.rank for p in tournament.list_of_players}
+                }
             )
 
     @staticmethod
@@ -176,11 +190,11 @@ class MatchController:
     ) -> None:
         """
         After a match completes (or a bye):
-         1) Show results and save tournament once
+         1) Show results and journal the recorded result
          2) Recompute live rankings
          3) Refresh all snapshots for the current round
-         4) Save tournament again to include updated ranks
-         5) Wait for user to press Enter
+         4) Journal the updated ranks
+         5) Flush pending changes, then wait for user to press Enter
 
         Args:
             match:        The Match just played.
@@ -188,14 +202,18 @@ class MatchController:
             tournament:   Optional Tournament for rank updates and persistence.
             filename:     JSON filename for saving.
         """
-        MatchController._show_and_save_results(match, tournament, filename)
+        MatchController._show_and_save_results(match, current_round, tournament, filename)
         if tournament:
             update_ranks(tournament)
             MatchController._refresh_match_snapshots(current_round, tournament)
             if filename:
-                save_tournament_to_json(
-                    tournament.get_serialized_tournament(),
-                    TOURNAMENTS_FOLDER,
-                    filename
+                record_tournament_event(
+                    tournament, TOURNAMENTS_FOLDER, filename,
+                    "ranks_updated",
+                    {
+                        "round": tournament.list_of_rounds.index(current_round),
+                        "ranks": {p.id_national_chess: p.rank for p in tournament.list_of_players}
+                    }
                 )
+        flush_tournament(tournament)
         wait_for_enter(ENTER_FOR_CONTINUE)
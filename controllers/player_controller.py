@@ -1,6 +1,6 @@
 from config import PLAYERS_FOLDER, ENTER_FOR_CONTINUE
 from models.player_model import Player
-from storage.player_data import load_player_from_json, save_player_to_json
+from storage.player_data import load_player_from_json, player_transaction, save_player_to_json
 from utils.input_manager import get_valid_input
 from utils.input_formatters import format_yes_no
 from utils.input_validators import is_valid_yes_no
@@ -31,13 +31,17 @@ class PlayerController:
         Returns:
             Player: L'objet Player chargé ou créé et mis à jour.
         """
-        try:
-            player = load_player_from_json(PLAYERS_FOLDER, id_national)
-            missing = PlayerController._get_missing_fields(player)
-            PlayerController._handle_existing_player(player, missing, prompt_modify)
-            return player
-        except FileNotFoundError:
-            return PlayerController._create_new_player(id_national)
+        # Les sauvegardes de chaque champ sont regroupées en une seule écriture.
+        # Si la saisie est interrompue, le profil partiel est tout de même écrit :
+        # ses champs manquants seront demandés au prochain chargement.
+        with player_transaction(PLAYERS_FOLDER, commit_on_error=True):
+            try:
+                player = load_player_from_json(PLAYERS_FOLDER, id_national)
+                missing = PlayerController._get_missing_fields(player)
+                PlayerController._handle_existing_player(player, missing, prompt_modify)
+                return player
+            except FileNotFoundError:
+                return PlayerController._create_new_player(id_national)
 
     @staticmethod
     def _handle_existing_player(player: Player, missing: list[str], prompt_modify: bool) -> None:
@@ -125,7 +129,7 @@ class PlayerController:
         Pour chaque nom de champ fourni :
         1. Appelle la méthode PlayerView correspondante.
         2. Assigne la valeur retournée sur l'attribut du joueur.
-        3. Persiste immédiatement le joueur en JSON.
+        3. Persiste le joueur (écriture regroupée si une transaction est ouverte).
 
         Args:
             player (Player): Instance du modèle Player à mettre à jour.
@@ -141,7 +145,7 @@ class PlayerController:
             value = field_map[field]()
             # Mise à jour de l'attribut
             setattr(player, field, value)
-            # Persistance JSON immédiate
+            # Persistance (différée jusqu'à la fin de la transaction en cours)
             save_player_to_json(
                 player.get_serialized_player(),
                 PLAYERS_FOLDER,
@@ -7,7 +7,8 @@ from config import (
     MIN_PLAYERS
 )
 from controllers.match_controller import MatchController
-from storage.tournament_data import save_tournament_to_json
+from storage.tournament_data import record_tournament_event
+from storage.tournament_session import sync_tournament
 from models.match_model import Match
 from models.player_model import Player
 from models.round_model import Round
@@ -68,6 +69,8 @@ class RoundController:
 
         Parcourt les rounds existants ou les crée, exécute chaque match non encore joué,
         affiche le rapport intermédiaire et attend la validation de l'utilisateur.
+        Avant chaque match et chaque appariement, les saisies enregistrées par un autre
+        terminal sont reprises : un match déjà saisi ailleurs n'est pas redemandé.
 
         Args:
             starting_round: Numéro du round de début.
@@ -78,11 +81,13 @@ class RoundController:
             num_rounds: Nombre total de rounds à jouer.
         """
         for rnd_num in range(starting_round, num_rounds + 1):
+            sync_tournament(tournament)
             rnd = RoundController._get_or_create_round(
                 rnd_num, tournament, filename, players, rounds
             )
 
             for match in rnd.matches:
+                sync_tournament(tournament)
                 if RoundController._is_match_completed(match):
                     continue
                 RoundController._execute_match(
@@ -108,7 +113,7 @@ class RoundController:
         Récupère un round existant ou en crée un nouveau.
 
         Si le round existe déjà dans la liste, le retourne. Sinon, génère
-        un nouveau round, le sauvegarde et l'ajoute à tournament.list_of_rounds.
+        un nouveau round, l'ajoute à tournament.list_of_rounds et journalise l'appariement.
 
         Args:
             rnd_num: Numéro du round.
@@ -127,10 +132,15 @@ class RoundController:
         rounds.append(rnd)
         tournament.list_of_rounds = rounds
         tournament.actual_round = rnd_num
-        save_tournament_to_json(
-            tournament.get_serialized_tournament(),
-            TOURNAMENTS_FOLDER,
-            filename
+        record_tournament_event(
+            tournament, TOURNAMENTS_FOLDER, filename,
+            "round_paired",
+            {
+                "index": rnd_num - 1,
+                "round": rnd.get_serialized_round(),
+                "actual_round": rnd_num,
+                "players": [p.get_tournament_data() for p in tournament.list_of_players]
+            }
         )
         return rnd
 
@@ -320,7 +330,7 @@ class RoundController:
         Sauvegarde l'état actuel du tournoi après la fin d'un round.
 
         Met à jour tournament.actual_round et list_of_rounds,
-        puis écrit le JSON.
+        puis journalise la clôture du round.
 
         Args:
             round_number: Numéro du round désormais terminé.
@@ -330,8 +340,13 @@ class RoundController:
         """
         tournament.actual_round = round_number
         tournament.list_of_rounds = rounds
-        save_tournament_to_json(
-            tournament.get_serialized_tournament(),
-            TOURNAMENTS_FOLDER,
-            filename
+        end_time = rounds[round_number - 1].end_time
+        record_tournament_event(
+            tournament, TOURNAMENTS_FOLDER, filename,
+            "round_closed",
+            {
+                "index": round_number - 1,
+                "end_time": end_time.strftime("%d/%m/%Y %H:%M:%S") if end_time else None,
+                "actual_round": round_number
+            }
         )
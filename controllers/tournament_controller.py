@@ -1,7 +1,6 @@
 from __future__ import annotations
-import os
 import datetime
-from typing import Any, Dict, List, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 
 from config import (
     TODAY,
@@ -16,8 +15,9 @@ from models.match_model import Match
 from models.player_model import Player
 from models.round_model import Round
 from models.tournament_model import Tournament
-from storage.player_data import load_player_from_json
-from storage.tournament_data import save_tournament_to_json
+from storage.player_data import lazy_players
+from storage.tournament_data import save_tournament_to_json, record_tournament_event, tournament_exists
+from storage.tournament_session import TournamentSession
 from utils.input_manager import get_valid_input
 from utils.console import clear_screen, wait_for_enter
 from utils.error_messages import invalid_yes_no
@@ -51,7 +51,8 @@ class TournamentController:
     def _create_and_save_new() -> Tuple[Tournament, str]:
         """
         Demande le nom du tournoi, génère un nom de fichier unique,
-        initialise l'objet Tournament et sauvegarde l'état initial.
+        initialise l'objet Tournament, sauvegarde l'état initial
+        et attache au tournoi sa session de persistance.
 
         Returns:
             Tuple contenant l'objet Tournament et le nom du fichier JSON.
@@ -60,7 +61,7 @@ class TournamentController:
         safe = name.strip().replace(' ', '_')
         filename = f"{safe}_{TODAY}.json"
         counter = 2
-        while os.path.exists(os.path.join(TOURNAMENTS_FOLDER, filename)):
+        while tournament_exists(TOURNAMENTS_FOLDER, filename):
             filename = f"{safe}_{TODAY}_{counter}.json"
             counter += 1
         t = Tournament(
@@ -75,6 +76,7 @@ class TournamentController:
             actual_round=0
         )
         save_tournament_to_json(t.get_serialized_tournament(), TOURNAMENTS_FOLDER, filename)
+        t.session = TournamentSession(t, TOURNAMENTS_FOLDER, filename)
         return t, filename
 
     @staticmethod
@@ -96,7 +98,10 @@ class TournamentController:
         ]:
             clear_screen()
             setattr(t, attr, view_fn())
-            save_tournament_to_json(t.get_serialized_tournament(), TOURNAMENTS_FOLDER, filename)
+            record_tournament_event(
+                t, TOURNAMENTS_FOLDER, filename,
+                "tournament_updated", {"fields": {attr: getattr(t, attr)}}
+            )
 
     @staticmethod
     def _confirm_start() -> bool:
@@ -135,7 +140,10 @@ class TournamentController:
             p = TournamentController._ask_unique(players, len(players) + 1, limit)
             players.append(p)
             t.list_of_players = players
-            save_tournament_to_json(t.get_serialized_tournament(), TOURNAMENTS_FOLDER, filename)
+            record_tournament_event(
+                t, TOURNAMENTS_FOLDER, filename,
+                "player_registered", {"player": p.get_tournament_data()}
+            )
         # Phase 2: ajout optionnel
         while True:
             clear_screen()
@@ -155,7 +163,10 @@ class TournamentController:
             p = TournamentController._ask_unique(players, len(players) + 1, limit)
             players.append(p)
             t.list_of_players = players
-            save_tournament_to_json(t.get_serialized_tournament(), TOURNAMENTS_FOLDER, filename)
+            record_tournament_event(
+                t, TOURNAMENTS_FOLDER, filename,
+                "player_registered", {"player": p.get_tournament_data()}
+            )
 
     @staticmethod
     def _ask_unique(existing: List[Player], idx: int, limit: int) -> Player:
@@ -181,13 +192,14 @@ class TournamentController:
             return p
 
     @staticmethod
-    def load_existing_tournament(data: Dict[str, Any], filename: str) -> Any:
+    def load_existing_tournament(data: Dict[str, Any], filename: str, revision: Optional[int] = None) -> Any:
         """
         Prépare un Loader pour reprendre un tournoi existant au lieu de créer un nouveau.
 
         Args:
             data: Contenu JSON du tournoi.
             filename: Nom du fichier JSON.
+            revision: Révision du tournoi lue avant son chargement (voir TournamentSession).
 
         Returns:
             Un objet Loader exposant une méthode resume().
@@ -195,11 +207,11 @@ class TournamentController:
         class Loader:
             @staticmethod
             def resume() -> None:
-                TournamentController._resume_existing(data, filename)
+                TournamentController._resume_existing(data, filename, revision)
         return Loader
 
     @staticmethod
-    def _resume_existing(data: Dict[str, Any], filename: str) -> None:
+    def _resume_existing(data: Dict[str, Any], filename: str, revision: Optional[int] = None) -> None:
         """
         Reprend un tournoi existant :
          1) Reconstruction du modèle
@@ -210,8 +222,10 @@ class TournamentController:
         Args:
             data: Dictionnaire des données JSON.
             filename: Nom du fichier JSON.
+            revision: Révision du tournoi lue avant son chargement.
         """
         t = TournamentController._build_from_data(data)
+        t.session = TournamentSession(t, TOURNAMENTS_FOLDER, filename, revision)
         TournamentController._complete_missing_fields(t, filename)
         if t.actual_round == 0:
             if not TournamentController._before_first_round(t, filename):
@@ -221,7 +235,8 @@ class TournamentController:
     @staticmethod
     def _build_from_data(data: Dict[str, Any]) -> Tournament:
         """
-        Reconstruit un objet Tournament complet depuis les données JSON.
+        Reconstruit un objet Tournament complet depuis les données JSON
+        (à la version courante du schéma, voir storage/schema.py).
 
         Args:
             data: Dictionnaire du JSON chargé.
@@ -231,40 +246,24 @@ class TournamentController:
         """
         t = Tournament(
             tournament_name=data['tournament_name'],
-            location=data.get('location'),
-            start_date=data.get('start_date'),
-            end_date=data.get('end_date'),
-            number_of_rounds=data.get('number_of_rounds'),
-            description=data.get('description'),
+            location=data['location'],
+            start_date=data['start_date'],
+            end_date=data['end_date'],
+            number_of_rounds=data['number_of_rounds'],
+            description=data['description'],
             list_of_players=[],
             list_of_rounds=[],
-            actual_round=data.get('actual_round', 0)
+            actual_round=data['actual_round']
         )
-        for p_data in data.get('list_of_players', []):
-            try:
-                player = load_player_from_json(PLAYERS_FOLDER, p_data['id_national_chess'])
-            except FileNotFoundError:
-                player = Player(
-                    id_national_chess=p_data['id_national_chess'],
-                    first_name=None,
-                    last_name=None,
-                    date_of_birth=p_data.get('date_of_birth'),
-                    tournament_score=p_data.get('tournament_score', 0.0),
-                    rank=p_data.get('rank', 0),
-                    played_with=p_data.get('played_with', [])
-                )
-            else:
-                player.tournament_score = p_data.get('tournament_score', 0.0)
-                player.rank = p_data.get('rank', 0)
-                player.played_with = p_data.get('played_with', [])
-            t.list_of_players.append(player)
-        for r_data in data.get('list_of_rounds', []):
+        # Profils lus au premier affichage d'un nom (un joueur sans profil garde des champs vides)
+        t.list_of_players.extend(lazy_players(data['list_of_players'], PLAYERS_FOLDER))
+        for r_data in data['list_of_rounds']:
             rnd = Round(r_data['round_number'])
-            if r_data.get('start_time'):
+            if r_data['start_time']:
                 rnd.start_time = datetime.datetime.strptime(r_data['start_time'], '%d/%m/%Y %H:%M:%S')
-            if r_data.get('end_time'):
+            if r_data['end_time']:
                 rnd.end_time = datetime.datetime.strptime(r_data['end_time'], '%d/%m/%Y %H:%M:%S')
-            for m_data in r_data.get('matches', []):
+            for m_data in r_data['matches']:
                 name = m_data['name']
                 if 'repos' in name.lower():
                     pid = m_data['player_1']['id_national_chess']
@@ -272,7 +271,7 @@ class TournamentController:
                     match = Match(name, (p, None))
                     match._snap1 = m_data['player_1'].copy()
                     match.match_score_1 = match._snap1['match_score']
-                    match.color_player_1 = match._snap1.get('color')
+                    match.color_player_1 = match._snap1['color']
                     match._snap2 = None
                 else:
                     p1 = next(
@@ -286,8 +285,8 @@ class TournamentController:
                     match._snap2 = m_data['player_2'].copy()
                     match.match_score_1 = m_data['player_1']['match_score']
                     match.match_score_2 = m_data['player_2']['match_score']
-                    match.color_player_1 = m_data['player_1'].get('color')
-                    match.color_player_2 = m_data['player_2'].get('color')
+                    match.color_player_1 = m_data['player_1']['color']
+                    match.color_player_2 = m_data['player_2']['color']
                 rnd.matches.append(match)
             t.list_of_rounds.append(rnd)
         return t
@@ -328,7 +327,10 @@ class TournamentController:
                 t.number_of_rounds = TournamentView.ask_number_of_rounds()
             elif f == 'description':
                 t.description = TournamentView.ask_description(allow_empty=True)
-            save_tournament_to_json(t.get_serialized_tournament(), TOURNAMENTS_FOLDER, filename)
+            record_tournament_event(
+                t, TOURNAMENTS_FOLDER, filename,
+                "tournament_updated", {"fields": {f: getattr(t, f)}}
+            )
 
     @staticmethod
     def _before_first_round(t: Tournament, filename: str) -> None:
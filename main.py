@@ -1,5 +1,59 @@
+import argparse
+
+from controllers.maintenance_controller import MaintenanceController
 from views.main_menu import MenuView
 
+
+def parse_args(argv=None) -> argparse.Namespace:
+    """
+    Lit la ligne de commande : sans argument, le menu interactif est lancé ;
+    une sous-commande lance une opération de maintenance.
+    """
+    parser = argparse.ArgumentParser(description="Gestionnaire de tournois d'échecs")
+    commands = parser.add_subparsers(dest="command")
+    commands.add_parser("archive", help="archive les tournois terminés dans une archive compressée")
+    commands.add_parser("convert-layout", help="convertit les tournois vers la disposition TOURNAMENT_LAYOUT")
+    commands.add_parser("migrate-players", help="range les fichiers joueurs selon la disposition PLAYERS_LAYOUT")
+    migrate_schema = commands.add_parser("migrate-schema", help="met les documents à la version courante du schéma")
+    migrate_schema.add_argument("--workers", type=int, help="nombre de processus (défaut : SCHEMA_MIGRATION_WORKERS)")
+    import_players = commands.add_parser("import-players", help="importe des joueurs depuis un fichier CSV ou NDJSON")
+    import_players.add_argument("source", help="fichier .csv, .ndjson ou .jsonl")
+    import_players.add_argument("--rejects", help="fichier des lignes rejetées (par défaut : <source>.rejects.csv)")
+    commands.add_parser("build-player-table", help="construit la table des joueurs mappée en mémoire")
+    export_players = commands.add_parser("export-players", help="exporte les joueurs en CSV ou NDJSON")
+    export_players.add_argument("destination", help="fichier .csv, .ndjson ou .jsonl (- : sortie standard)")
+    export_players.add_argument("--format", choices=("csv", "ndjson"), help="format (par défaut : selon l'extension)")
+    export_players.add_argument("--idn", action="append", help="ne garder que ce joueur (répétable)")
+    export_games = commands.add_parser("export-games", help="exporte les parties des tournois en CSV ou NDJSON")
+    export_games.add_argument("destination", help="fichier .csv, .ndjson ou .jsonl (- : sortie standard)")
+    export_games.add_argument("--format", choices=("csv", "ndjson"), help="format (par défaut : selon l'extension)")
+    export_games.add_argument("--tournament", action="append", help="ne garder que ce tournoi (répétable)")
+    export_games.add_argument("--from", dest="date_from", help="première date incluse (JJMMAAAA)")
+    export_games.add_argument("--to", dest="date_to", help="dernière date incluse (JJMMAAAA)")
+    export_games.add_argument("--idn", action="append", help="ne garder que les parties de ce joueur (répétable)")
+    return parser.parse_args(argv)
+
+
 if __name__ == "__main__":
-    menu = MenuView()
-    menu.menu()
+    args = parse_args()
+    if args.command == "archive":
+        MaintenanceController.archive_tournaments()
+    elif args.command == "convert-layout":
+        MaintenanceController.convert_tournaments_layout()
+    elif args.command == "migrate-players":
+        MaintenanceController.migrate_players()
+    elif args.command == "migrate-schema":
+        MaintenanceController.migrate_schema(args.workers)
+    elif args.command == "import-players":
+        MaintenanceController.import_players(args.source, args.rejects)
+    elif args.command == "build-player-table":
+        MaintenanceController.build_player_table()
+    elif args.command == "export-players":
+        MaintenanceController.export_players(args.destination, args.format, args.idn)
+    elif args.command == "export-games":
+        MaintenanceController.export_games(
+            args.destination, args.format, args.tournament, args.date_from, args.date_to, args.idn
+        )
+    else:
+        menu = MenuView()
+        menu.menu()
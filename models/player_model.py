@@ -1,6 +1,8 @@
 from __future__ import annotations
 from typing import List, Dict, Any
 
+from config import PLAYER_SCHEMA_VERSION
+
 
 class Player:
     """
@@ -40,16 +42,17 @@ class Player:
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> Player:
         """
-        Reconstruit une instance Player à partir d'un dict désérialisé.
+        Reconstruit une instance Player à partir d'un dict désérialisé,
+        à la version courante du schéma (voir storage/schema.py).
         """
         return cls(
-            id_national_chess=data.get("id_national_chess"),
-            first_name=data.get("first_name", None),
-            last_name=data.get("last_name", None),
-            date_of_birth=data.get("date_of_birth", None),
-            tournament_score=data.get("tournament_score", 0.0),
-            rank=data.get("rank", 0),
-            played_with=data.get("played_with", [])
+            id_national_chess=data["id_national_chess"],
+            first_name=data["first_name"],
+            last_name=data["last_name"],
+            date_of_birth=data["date_of_birth"],
+            tournament_score=data["tournament_score"],
+            rank=data["rank"],
+            played_with=data["played_with"]
         )
 
     def get_serialized_player(self) -> Dict[str, Any]:
@@ -57,6 +60,7 @@ class Player:
         Sérialise le joueur pour JSON.
         """
         return {
+            "schema_version": PLAYER_SCHEMA_VERSION,
             "id_national_chess": self.id_national_chess,
             "first_name": self.first_name,
             "last_name": self.last_name,
@@ -65,3 +69,75 @@ class Player:
             "rank": self.rank,
             "played_with": list(self.played_with)
         }
+
+
+def _profile_field(name: str) -> property:
+    """Champ du profil d'un LazyPlayer, lu dans le fichier du joueur au premier accès."""
+    def getter(self: "LazyPlayer") -> Any:
+        if name not in self._profile:
+            self.hydrate()
+        return self._profile.get(name)
+
+    def setter(self: "LazyPlayer", value: Any) -> None:
+        self._profile[name] = value
+
+    return property(getter, setter)
+
+
+class LazyPlayer(Player):
+    """
+    Joueur d'un tournoi créé à partir de son entrée de `list_of_players`
+    (IDN, score, rang, adversaires) : son profil (prénom, nom, date de naissance)
+    n'est lu qu'au premier accès à l'un de ces champs.
+
+    Le chargement est délégué à un `hydrator` (voir storage/player_data.py) qui lit
+    en un seul lot les profils de tous les joueurs qu'on lui confie : une vue qui
+    affiche un tableau de joueurs l'appelle une fois avant le rendu.
+    """
+
+    PROFILE_FIELDS = ("first_name", "last_name", "date_of_birth")
+
+    first_name = _profile_field("first_name")
+    last_name = _profile_field("last_name")
+    date_of_birth = _profile_field("date_of_birth")
+
+    def __init__(
+        self,
+        id_national_chess: str,
+        hydrator: Any,
+        tournament_score: float = 0.0,
+        rank: int = 0,
+        played_with: List[str] = None
+    ) -> None:
+        self._profile: Dict[str, Any] = {}
+        self._has_profile = None
+        self.hydrator = hydrator
+        self.id_national_chess = id_national_chess
+        self.tournament_score = tournament_score
+        self.rank = rank
+        self.played_with = played_with if played_with is not None else []
+
+    @property
+    def is_hydrated(self) -> bool:
+        """Indique si le profil a déjà été lu."""
+        return self._has_profile is not None
+
+    @property
+    def has_profile(self) -> bool:
+        """Indique si un profil est enregistré pour ce joueur (le lit si nécessaire)."""
+        self.hydrate()
+        return bool(self._has_profile)
+
+    def hydrate(self) -> None:
+        """Lit le profil du joueur s'il ne l'a pas encore été."""
+        if not self.is_hydrated:
+            self.hydrator.hydrate([self])
+
+    def set_profile(self, data: Dict[str, Any] | None) -> None:
+        """
+        Renseigne le profil lu par l'hydrator (None si aucun profil n'est enregistré).
+        Les champs déjà modifiés sur l'objet sont conservés.
+        """
+        self._has_profile = data is not None
+        for field in self.PROFILE_FIELDS:
+            self._profile.setdefault(field, data.get(field) if data else None)
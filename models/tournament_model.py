@@ -1,3 +1,4 @@
+from config import TOURNAMENT_SCHEMA_VERSION
 from models.player_model import Player
 from models.round_model import Round
 
@@ -25,9 +26,12 @@ class Tournament:
         self.list_of_players = list_of_players if list_of_players is not None else []
         self.number_of_rounds = number_of_rounds
         self.description = description
+        # Session de persistance (storage.tournament_session), attachée par le contrôleur
+        self.session = None
 
     def get_serialized_tournament(self) -> dict:
         return {
+            "schema_version": TOURNAMENT_SCHEMA_VERSION,
             "tournament_name": self.tournament_name,
             "location": self.location,
             "start_date": self.start_date,
@@ -0,0 +1,228 @@
+import csv
+import json
+import os
+import sys
+from datetime import datetime
+from typing import Any, Dict, Iterable, Iterator, Optional, Sequence
+
+from storage.player_data import iter_players_from_json
+from storage.tournament_data import list_tournament_summaries, load_tournament_document
+from utils.date_helpers import parse_date_str
+
+# Formats d'export, et format associé à chaque extension de fichier
+EXPORT_FORMATS = ("csv", "ndjson")
+EXPORT_EXTENSIONS = {".csv": "csv", ".ndjson": "ndjson", ".jsonl": "ndjson"}
+
+# Colonnes des exports (CSV) et clés de chaque ligne (NDJSON)
+PLAYER_EXPORT_FIELDS = ("id_national_chess", "last_name", "first_name", "date_of_birth")
+GAME_EXPORT_FIELDS = (
+    "tournament",
+    "tournament_name",
+    "round_number",
+    "round_start",
+    "round_end",
+    "match",
+    "player_1",
+    "player_1_color",
+    "player_1_score",
+    "player_2",
+    "player_2_color",
+    "player_2_score",
+    "result",
+    "winner",
+)
+
+
+def iter_player_rows(folder: str, idns: Optional[Sequence[str]] = None) -> Iterator[Dict[str, Any]]:
+    """
+    Produit une ligne d'export par joueur enregistré, dans l'ordre du stockage.
+
+    Args:
+        folder (str): Le dossier des joueurs.
+        idns (Sequence[str] | None): Ne garder que ces joueurs.
+
+    Returns:
+        Iterator[dict]: Les lignes (voir PLAYER_EXPORT_FIELDS).
+    """
+    wanted = set(idns) if idns else None
+    for player in iter_players_from_json(folder):
+        if wanted is None or player.id_national_chess in wanted:
+            yield {field: getattr(player, field) for field in PLAYER_EXPORT_FIELDS}
+
+
+def _overlaps(summary: Dict[str, Any], date_from: Optional[datetime], date_to: Optional[datetime]) -> bool:
+    """Indique si les dates d'un tournoi (résumé catalogue) recoupent la période demandée."""
+    start = parse_date_str(summary.get("start_date"))
+    end = parse_date_str(summary.get("end_date")) or start
+    if date_from is not None and end is not None and end < date_from:
+        return False
+    if date_to is not None and start is not None and start > date_to:
+        return False
+    return True
+
+
+def _game_date(rnd: Dict[str, Any], tournament: Dict[str, Any]) -> Optional[datetime]:
+    """Date d'une partie : début de son round, ou à défaut début du tournoi."""
+    start_time = rnd.get("start_time")
+    if start_time:
+        return parse_date_str(start_time.split(" ")[0])
+    return parse_date_str(tournament.get("start_date"))
+
+
+def _result(match: Dict[str, Any]) -> tuple:
+    """Type de résultat ("bye", "unplayed", "draw" ou "win") et IDN du vainqueur."""
+    player_2 = match.get("player_2")
+    if player_2 is None:
+        return "bye", (match.get("player_1") or {}).get("id_national_chess")
+    winner = match.get("winner")
+    if winner == "draw":
+        return "draw", None
+    if isinstance(winner, dict):
+        return "win", winner.get("id_national_chess")
+    return "unplayed", None
+
+
+def _game_row(filename: str, tournament: Dict[str, Any], rnd: Dict[str, Any], match: Dict[str, Any]) -> Dict[str, Any]:
+    player_1 = match.get("player_1") or {}
+    player_2 = match.get("player_2") or {}
+    result, winner = _result(match)
+    return {
+        "tournament": filename,
+        "tournament_name": tournament.get("tournament_name"),
+        "round_number": rnd.get("round_number"),
+        "round_start": rnd.get("start_time"),
+        "round_end": rnd.get("end_time"),
+        "match": match.get("name"),
+        "player_1": player_1.get("id_national_chess"),
+        "player_1_color": player_1.get("color"),
+        "player_1_score": player_1.get("match_score"),
+        "player_2": player_2.get("id_national_chess"),
+        "player_2_color": player_2.get("color"),
+        "player_2_score": player_2.get("match_score"),
+        "result": result,
+        "winner": winner,
+    }
+
+
+def iter_game_rows(
+    folder: str,
+    tournaments: Optional[Sequence[str]] = None,
+    date_from: Optional[datetime] = None,
+    date_to: Optional[datetime] = None,
+    idns: Optional[Sequence[str]] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Produit une ligne d'export par partie, tous tournois confondus.
+
+    Les tournois sont choisis sur le catalogue (sans relire leurs fichiers), puis ouverts
+    un par un avec load_tournament_document : seuls le tournoi et le round en cours de
+    lecture sont en mémoire.
+
+    Args:
+        folder (str): Le dossier des tournois.
+        tournaments (Sequence[str] | None): Ne garder que ces tournois (nom de fichier,
+            avec ou sans '.json', ou nom du tournoi).
+        date_from (datetime | None): Ne garder que les parties jouées à partir de cette date.
+        date_to (datetime | None): Ne garder que les parties jouées jusqu'à cette date incluse.
+        idns (Sequence[str] | None): Ne garder que les parties de ces joueurs.
+
+    Returns:
+        Iterator[dict]: Les lignes (voir GAME_EXPORT_FIELDS).
+    """
+    wanted_tournaments = {name.upper() for name in tournaments} if tournaments else None
+    wanted_players = set(idns) if idns else None
+    for summary in list_tournament_summaries(folder):
+        filename = summary["filename"]
+        if wanted_tournaments is not None and not wanted_tournaments & {
+            filename.upper(),
+            os.path.splitext(filename)[0].upper(),
+            (summary.get("tournament_name") or "").upper(),
+        }:
+            continue
+        if not _overlaps(summary, date_from, date_to):
+            continue
+
+        tournament = load_tournament_document(os.path.join(folder, filename))
+        for rnd in tournament["list_of_rounds"]:
+            played_on = _game_date(rnd, tournament)
+            if played_on is not None and (
+                (date_from is not None and played_on < date_from)
+                or (date_to is not None and played_on > date_to)
+            ):
+                continue
+            for match in rnd.get("matches", []):
+                row = _game_row(filename, tournament, rnd, match)
+                if wanted_players is None or wanted_players & {row["player_1"], row["player_2"]}:
+                    yield row
+
+
+def write_csv(rows: Iterable[Dict[str, Any]], file, fields: Sequence[str]) -> int:
+    """Écrit les lignes au format CSV (avec en-tête) au fil de l'eau ; retourne leur nombre."""
+    writer = csv.DictWriter(file, fieldnames=fields)
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_ndjson(rows: Iterable[Dict[str, Any]], file) -> int:
+    """Écrit une ligne JSON par ligne d'export au fil de l'eau ; retourne leur nombre."""
+    count = 0
+    for row in rows:
+        file.write(json.dumps(row, ensure_ascii=False))
+        file.write("\n")
+        count += 1
+    return count
+
+
+def _resolve_format(destination: str, export_format: Optional[str] = None) -> str:
+    """
+    Format d'un export : celui demandé, sinon celui de l'extension de `destination`
+    ("ndjson" pour la sortie standard « - »).
+
+    Raises:
+        ValueError: si le format ne correspond à aucun format connu.
+    """
+    if export_format is None:
+        extension = os.path.splitext(destination)[1].lower()
+        export_format = "ndjson" if destination == "-" else EXPORT_EXTENSIONS.get(extension, extension)
+    if export_format not in EXPORT_FORMATS:
+        raise ValueError(f"Format d'export inconnu : {export_format or destination!r} (attendu : csv ou ndjson)")
+    return export_format
+
+
+def export_rows(
+    rows: Iterable[Dict[str, Any]],
+    destination: str,
+    fields: Sequence[str],
+    export_format: Optional[str] = None,
+) -> int:
+    """
+    Écrit des lignes d'export dans `destination` (« - » : sortie standard), au format
+    demandé ou à défaut choisi par l'extension (voir `_resolve_format`).
+
+    Args:
+        rows (Iterable[dict]): Les lignes, consommées une à une.
+        destination (str): Le fichier à écrire.
+        fields (Sequence[str]): Les colonnes (export CSV).
+        export_format (str | None): "csv" ou "ndjson".
+
+    Returns:
+        int: Le nombre de lignes écrites.
+
+    Raises:
+        ValueError: si le format ne correspond à aucun format connu.
+    """
+    chosen = _resolve_format(destination, export_format)
+
+    def write(file) -> int:
+        if chosen == "csv":
+            return write_csv(rows, file, fields)
+        return write_ndjson(rows, file)
+
+    if destination == "-":
+        return write(sys.stdout)
+    with open(destination, "w", encoding="utf-8", newline="") as file:
+        return write(file)
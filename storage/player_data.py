@@ -1,13 +1,152 @@
 import json
 import os
+import threading
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Iterable, Iterator, List, Optional, Tuple
 
-from models.player_model import Player
+from config import (
+    PLAYERS_LAYOUT,
+    PLAYERS_FILENAME,
+    PLAYERS_REGISTRY_DATA,
+    PLAYER_CACHE_SIZE,
+    PLAYER_LOAD_WORKERS,
+    PLAYER_SEARCH_LIMIT
+)
+from models.player_model import LazyPlayer, Player
+from storage.player_manifest import get_player_manifest
+from storage.player_registry import get_registry
+from storage.player_search import get_name_index, search_player_names
+from storage.player_table import get_player_table
+from storage.repository import get_repository
+from storage.schema import upgrade_player
+from storage.write_behind import fsync_directory
+from storage.write_digest import content_digest, get_write_digests
+
+
+class PlayerCache:
+    """
+    Cache LRU borné des profils joueurs lus dans les fichiers `<IDN>.json`.
+
+    Chaque lecture valide l'entrée par un seul os.stat (date de modification en ns
+    et taille) : un fichier modifié par un autre moyen est relu. Les sauvegardes du
+    processus mettent le cache à jour (écriture simultanée). Les profils sont remis
+    sous forme de copies : les champs propres à un tournoi (tournament_score, rank,
+    played_with) modifiés par l'appelant ne sont jamais partagés.
+    """
+
+    def __init__(self, maxsize: int = PLAYER_CACHE_SIZE) -> None:
+        """
+        Args:
+            maxsize (int): Nombre maximal de profils gardés en mémoire.
+        """
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, Tuple[Tuple[int, int], Dict[str, Any]]]" = OrderedDict()
+
+    def get(self, path: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne une copie du profil enregistré dans `path`, ou None si le fichier n'existe pas.
+        """
+        try:
+            st = os.stat(path)
+        except FileNotFoundError:
+            with self._lock:
+                self._entries.pop(path, None)
+                self.misses += 1
+            return None
+        signature = (st.st_mtime_ns, st.st_size)
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None and entry[0] == signature:
+                self._entries.move_to_end(path)
+                self.hits += 1
+                return _copy_player_data(entry[1])
+            self.misses += 1
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        self._store(path, signature, data)
+        return _copy_player_data(data)
+
+    def put(self, path: str, player_data: Dict[str, Any]) -> None:
+        """Enregistre dans le cache le profil qui vient d'être écrit dans `path`."""
+        st = os.stat(path)
+        self._store(path, (st.st_mtime_ns, st.st_size), _copy_player_data(player_data))
+
+    def _store(self, path: str, signature: Tuple[int, int], data: Any) -> None:
+        if not isinstance(data, dict):
+            return
+        with self._lock:
+            self._entries[path] = (signature, data)
+            self._entries.move_to_end(path)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def stats(self) -> Dict[str, int]:
+        """Compteurs du cache : hits, misses et nombre de profils en mémoire."""
+        with self._lock:
+            return {"hits": self.hits, "misses": self.misses, "size": len(self._entries)}
+
+    def clear(self) -> None:
+        """Vide le cache et remet ses compteurs à zéro."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = 0
+
+
+_player_cache = PlayerCache()
+
+
+def get_player_cache() -> PlayerCache:
+    """Retourne le cache des profils joueurs du processus."""
+    return _player_cache
+
+
+def _copy_player_data(data: Any) -> Any:
+    """Copie d'un profil : les valeurs sont scalaires, sauf la liste played_with."""
+    if not isinstance(data, dict):
+        return data
+    copy = dict(data)
+    if isinstance(copy.get("played_with"), list):
+        copy["played_with"] = list(copy["played_with"])
+    return copy
+
+
+def player_file_path(folder: str, filename: str, layout: Optional[str] = None) -> str:
+    """
+    Chemin du fichier d'un joueur selon la disposition (ex : 'AB12345.json' ->
+    'AB12345.json' en "flat", 'AB/12/AB12345.json' en "sharded").
+
+    Args:
+        folder (str): Le dossier des joueurs.
+        filename (str): Le nom du fichier (ex : 'AB12345.json').
+        layout (str | None): "flat" ou "sharded" (par défaut : PLAYERS_LAYOUT).
+
+    Returns:
+        str: Le chemin du fichier.
+    """
+    if (layout or PLAYERS_LAYOUT) == "sharded":
+        return os.path.join(folder, filename[:2], filename[2:4], filename)
+    return os.path.join(folder, filename)
+
+
+def _player_file_paths(folder: str, filename: str) -> Tuple[str, str]:
+    """
+    Chemins possibles du fichier d'un joueur : celui de la disposition configurée,
+    puis celui de l'autre disposition (fichier pas encore migré).
+    """
+    other = "flat" if PLAYERS_LAYOUT == "sharded" else "sharded"
+    return player_file_path(folder, filename), player_file_path(folder, filename, other)
 
 
 def save_player_to_json(player_data: dict, folder: str, filename: str) -> bool:
     """
-    Sauvegarde les données d'un joueur dans un fichier JSON nommé selon son identifiant unique.
-    Le fichier est (ré)écrit à chaque appel pour permettre les mises à jour incrémentales.
+    Sauvegarde les données d'un joueur dans un fichier JSON nommé selon son identifiant unique
+    (ou dans le stockage configuré, voir `_write_players`).
+    Dans un bloc `player_transaction`, l'écriture est différée jusqu'à la fin du bloc.
 
     Args:
         player_data (dict): Les données du joueur à enregistrer.
@@ -15,43 +154,405 @@ def save_player_to_json(player_data: dict, folder: str, filename: str) -> bool:
         filename (str): Le nom du fichier (ex : 'AB12345.json').
 
     Returns:
-        bool: True si l’écriture a réussi.
+        bool: True si l’écriture a réussi (ou a été mise en attente dans la transaction).
     """
-    os.makedirs(folder, exist_ok=True)
-    filepath = os.path.join(folder, filename)
+    transaction = _active_transaction(folder)
+    if transaction is not None:
+        transaction.add(player_data)
+        return True
+    _write_players([(player_data, filename)], folder)
+    return True
 
-    with open(filepath, "w", encoding="utf-8") as file:
-        json.dump(player_data, file, ensure_ascii=False, indent=4)
 
-    return True
+def save_players(players_data: Iterable[dict], folder: str) -> int:
+    """
+    Sauvegarde un lot de joueurs en une seule opération par backend : une transaction
+    SQLite, une seule écriture dans le registre, ou un fichier par joueur (disposition
+    "flat" ou "sharded", nommé selon PLAYERS_FILENAME), suivis d'une seule
+    synchronisation sur disque pour tout le lot.
+    Dans un bloc `player_transaction`, les joueurs rejoignent la transaction.
+
+    Args:
+        players_data (Iterable[dict]): Données sérialisées des joueurs.
+        folder (str): Le dossier des joueurs.
+
+    Returns:
+        int: Le nombre de joueurs sauvegardés.
+    """
+    entries = [
+        (player_data, PLAYERS_FILENAME.format(id_input=player_data["id_national_chess"]))
+        for player_data in players_data
+    ]
+    transaction = _active_transaction(folder)
+    if transaction is not None:
+        for player_data, _ in entries:
+            transaction.add(player_data)
+    elif entries:
+        _write_players(entries, folder)
+    return len(entries)
+
+
+def _write_players(entries: List[Tuple[dict, str]], folder: str) -> None:
+    """
+    Écrit des profils (couples données, nom de fichier) dans le dépôt, le registre ou
+    les fichiers de la disposition configurée, et met à jour l'index des noms et la table
+    des joueurs. Le lot est rendu durable en une fois ; un fichier inchangé n'est pas réécrit.
+    """
+    players_data = [player_data for player_data, _ in entries]
+    get_name_index(folder).update_many(players_data)
+    _update_player_table(folder, players_data)
+    repository = get_repository()
+    if repository is not None:
+        repository.save_players(players_data)
+        return
+
+    if PLAYERS_LAYOUT == "registry":
+        registry = get_registry(folder)
+        registry.put_many(players_data)
+        registry.sync()
+        return
+
+    digests = get_write_digests()
+    # Dossiers dont une entrée a été créée (nouveau fichier ou sous-dossier), synchronisés une fois chacun
+    directories = set()
+    for player_data, filename in entries:
+        filepath = player_file_path(folder, filename)
+        payload = json.dumps(player_data, ensure_ascii=False, indent=4).encode("utf-8")
+        digest = content_digest([payload])
+        if not digests.unchanged(filepath, digest):
+            directories.update(_missing_entries(filepath))
+            os.makedirs(os.path.dirname(filepath), exist_ok=True)
+            digests.expect(filepath, digest)
+            with open(filepath, "wb") as file:
+                file.write(payload)
+                file.flush()
+                os.fsync(file.fileno())
+            digests.written(filepath)
+        _player_cache.put(filepath, player_data)
+        get_player_manifest(folder).update(filename, filepath, player_data)
+    for directory in directories:
+        fsync_directory(directory)
+
+
+def _missing_entries(path: str) -> List[str]:
+    """Dossiers qui recevront une nouvelle entrée si `path` est créé (avec ses dossiers parents)."""
+    parents = []
+    while not os.path.exists(path):
+        parent = os.path.dirname(path)
+        parents.append(parent)
+        if not parent or parent == path:
+            break
+        path = parent
+    return parents
+
+
+class PlayerTransaction:
+    """
+    Regroupe les sauvegardes de joueurs d'un bloc `player_transaction` : chaque joueur
+    n'est écrit qu'une fois, dans sa dernière version, et tout le lot est écrit à la
+    fin du bloc en une seule opération (voir `save_players`). Les lectures du même
+    thread voient les profils en attente.
+    """
+
+    def __init__(self, folder: str) -> None:
+        """
+        Args:
+            folder (str): Le dossier des joueurs.
+        """
+        self.folder = folder
+        self._pending: Dict[str, dict] = {}
+
+    def add(self, player_data: dict) -> None:
+        """Met en attente la dernière version d'un joueur (remplace la précédente)."""
+        idn = player_data["id_national_chess"]
+        self._pending.pop(idn, None)
+        self._pending[idn] = _copy_player_data(player_data)
+
+    def get(self, id_national: str) -> Optional[dict]:
+        """Copie du profil en attente pour `id_national`, ou None."""
+        data = self._pending.get(id_national)
+        return _copy_player_data(data) if data is not None else None
+
+    def commit(self) -> None:
+        """Écrit les profils en attente et vide la transaction."""
+        pending, self._pending = self._pending, {}
+        if pending:
+            _write_players(
+                [(data, PLAYERS_FILENAME.format(id_input=idn)) for idn, data in pending.items()],
+                self.folder,
+            )
+
+    def rollback(self) -> None:
+        """Abandonne les profils en attente."""
+        self._pending = {}
+
+
+_transactions = threading.local()
+
+
+def _active_transaction(folder: str) -> Optional[PlayerTransaction]:
+    """Transaction en cours dans ce thread pour le dossier `folder`, ou None."""
+    transaction = getattr(_transactions, "current", None)
+    if transaction is not None and os.path.abspath(transaction.folder) == os.path.abspath(folder):
+        return transaction
+    return None
+
+
+@contextmanager
+def player_transaction(folder: str, commit_on_error: bool = False) -> Iterator[PlayerTransaction]:
+    """
+    Ouvre une transaction de sauvegarde des joueurs (voir PlayerTransaction) pour le
+    thread courant. Un bloc imbriqué rejoint la transaction déjà ouverte.
+
+    Args:
+        folder (str): Le dossier des joueurs.
+        commit_on_error (bool): Si True, les profils en attente sont écrits même si le
+            bloc est interrompu par une exception ; sinon ils sont abandonnés.
+
+    Yields:
+        PlayerTransaction: La transaction, écrite à la sortie du bloc.
+    """
+    outer = getattr(_transactions, "current", None)
+    if outer is not None:
+        if os.path.abspath(outer.folder) != os.path.abspath(folder):
+            raise ValueError("Une transaction est déjà ouverte sur un autre dossier de joueurs.")
+        yield outer
+        return
+
+    transaction = PlayerTransaction(folder)
+    _transactions.current = transaction
+    try:
+        yield transaction
+    except BaseException:
+        _transactions.current = None
+        if commit_on_error:
+            transaction.commit()
+        else:
+            transaction.rollback()
+        raise
+    _transactions.current = None
+    transaction.commit()
+
+
+def _update_player_table(folder: str, players_data: List[dict]) -> None:
+    """Reporte les profils sauvegardés dans la table mappée en mémoire, si elle a été construite."""
+    table = get_player_table(folder)
+    if table.exists():
+        table.put_many(players_data)
+
+
+def build_player_table(folder: str) -> int:
+    """
+    Construit (ou complète) la table des joueurs mappée en mémoire à partir de tous
+    les joueurs enregistrés (voir storage/player_table.py).
+
+    Args:
+        folder (str): Le dossier des joueurs.
+
+    Returns:
+        int: Le nombre de joueurs écrits dans la table.
+    """
+    table = get_player_table(folder)
+    count = 0
+    for player in iter_players_from_json(folder):
+        table.put(player.get_serialized_player())
+        count += 1
+    table.flush()
+    return count
 
 
 def load_players_from_json(folder: str) -> list[Player]:
     """
     Charge tous les joueurs depuis le dossier `data/players` en lisant
     les fichiers JSON. Supporte les fichiers JSON contenant un seul dict.
+    Avec la disposition "registry", lit séquentiellement le registre.
+    Les fichiers illisibles sont signalés et ignorés (voir `iter_players_from_json`).
     """
-    players: list[Player] = []
+    if get_repository() is None and not os.path.exists(folder):
+        print(f"Le dossier {folder} n'existe pas.")
+        return []
+    return list(iter_players_from_json(folder))
+
+
+def iter_players_from_json(
+    folder: str,
+    errors: Optional[List[Tuple[str, str]]] = None,
+    workers: int = PLAYER_LOAD_WORKERS
+) -> Iterator[Player]:
+    """
+    Produit les joueurs enregistrés un par un, sans construire la liste complète.
+
+    Avec les dispositions "flat" et "sharded", le dossier est parcouru avec os.scandir et
+    comparé au manifeste des joueurs (voir storage/player_manifest.py) : seuls les fichiers
+    nouveaux ou modifiés depuis le dernier parcours sont lus et désérialisés, en parallèle
+    par `workers` threads (la lecture est limitée par la latence du disque, pas par le
+    processeur). Les joueurs sont produits dans l'ordre des noms de fichiers.
+
+    Args:
+        folder (str): Le dossier des joueurs.
+        errors (list, optional): Reçoit un couple (nom de fichier, message) par fichier
+            illisible ; sans cette liste, chaque erreur est affichée. Le parcours continue.
+        workers (int): Nombre de lectures simultanées.
+
+    Yields:
+        Player: Les joueurs enregistrés (nouveaux objets à chaque appel).
+    """
+    repository = get_repository()
+    if repository is not None:
+        yield from (_player_from_dict(upgrade_player(data)) for data in repository.load_players())
+        return
 
     if not os.path.exists(folder):
-        print(f"Le dossier {folder} n'existe pas.")
-        return players
+        return
+
+    if PLAYERS_LAYOUT == "registry":
+        yield from (_player_from_dict(upgrade_player(data)) for data in get_registry(folder).iter_players())
+        return
+
+    def read(paths: List[str]) -> Iterator[Tuple[str, Optional[dict], Optional[str]]]:
+        return _parallel_map(_read_player, paths, workers)
+
+    for path, data, error in get_player_manifest(folder).refresh(_player_file_entries(folder), read):
+        if data is not None:
+            yield Player(data["id_national_chess"], data["first_name"], data["last_name"], data["date_of_birth"])
+        elif errors is not None:
+            errors.append((os.path.basename(path), error))
+        else:
+            print(f"Ignoré : {os.path.basename(path)} ({error}).")
+
 
-    for filename in os.listdir(folder):
-        path = os.path.join(folder, filename)
-        if not filename.endswith(".json") or not os.path.isfile(path):
-            continue
+def iter_stored_player_data(
+    folder: str,
+    errors: Optional[List[Tuple[str, str]]] = None,
+    workers: int = PLAYER_LOAD_WORKERS
+) -> Iterator[dict]:
+    """
+    Produit les profils enregistrés par le backend "json", même si un autre backend est
+    configuré : fichiers des dispositions "flat" et "sharded", puis registre s'il existe.
+    Sert à l'import des données dans ce backend ; les profils sont à la version courante
+    du schéma. La disposition configurée est lue en dernier : pour un joueur enregistré
+    aux deux endroits, c'est sa version qui l'emporte à l'import.
+
+    Args:
+        folder (str): Le dossier des joueurs.
+        errors (list, optional): Reçoit un couple (nom de fichier, message) par fichier
+            illisible ; sans cette liste, chaque erreur est affichée.
+        workers (int): Nombre de lectures simultanées.
+
+    Yields:
+        dict: Les données de chaque joueur.
+    """
+    if not os.path.isdir(folder):
+        return
+
+    def read_files() -> Iterator[dict]:
+        entries = _player_file_entries(folder)
+        paths = [entries[name].path for name in sorted(entries)]
+        for path, data, error in _parallel_map(_read_player, paths, workers):
+            if data is not None:
+                yield data
+            elif errors is not None:
+                errors.append((os.path.basename(path), error))
+            else:
+                print(f"Ignoré : {os.path.basename(path)} ({error}).")
+
+    def read_registry() -> Iterator[dict]:
+        if os.path.exists(os.path.join(folder, PLAYERS_REGISTRY_DATA)):
+            yield from (upgrade_player(data) for data in get_registry(folder).iter_players())
+
+    if PLAYERS_LAYOUT == "registry":
+        yield from read_files()
+        yield from read_registry()
+    else:
+        yield from read_registry()
+        yield from read_files()
+
+
+def scan_player_files(folder: str) -> Dict[str, Dict[str, os.DirEntry]]:
+    """
+    Relève avec os.scandir les fichiers joueurs des deux dispositions : à la racine
+    du dossier ("flat") et dans les sous-dossiers à deux niveaux ("sharded").
 
+    Returns:
+        dict: Pour chaque disposition, l'entrée (os.DirEntry) de chaque fichier par nom de fichier.
+    """
+    found: Dict[str, Dict[str, os.DirEntry]] = {"flat": {}, "sharded": {}}
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file():
+                found["flat"][entry.name] = entry
+            elif len(entry.name) == 2 and entry.is_dir():
+                with os.scandir(entry.path) as shards:
+                    for shard in shards:
+                        if len(shard.name) != 2 or not shard.is_dir():
+                            continue
+                        with os.scandir(shard.path) as files:
+                            for file in files:
+                                if file.name.endswith(".json") and file.is_file():
+                                    found["sharded"][file.name] = file
+    return found
+
+
+def _player_file_entries(folder: str) -> Dict[str, os.DirEntry]:
+    """
+    Fichier de chaque joueur, par nom de fichier. Pendant une migration, un joueur peut
+    avoir un fichier à chaque emplacement : celui de la disposition configurée l'emporte.
+    """
+    found = scan_player_files(folder)
+    current = "sharded" if PLAYERS_LAYOUT == "sharded" else "flat"
+    other = "flat" if current == "sharded" else "sharded"
+    return {**found[other], **found[current]}
+
+
+def _read_player(path: str) -> Tuple[str, Optional[dict], Optional[str]]:
+    """
+    Lit et valide un fichier joueur, mis à la version courante du schéma
+    (exécuté dans un thread du chargement en parallèle).
+
+    Returns:
+        tuple: (chemin, données du joueur ou None, message d'erreur ou None).
+    """
+    try:
         with open(path, "r", encoding="utf-8") as f:
             data = json.load(f)
+        if not isinstance(data, dict):
+            return path, None, "n'est pas un objet JSON"
+        _player_from_dict(upgrade_player(data))
+        return path, data, None
+    except (OSError, ValueError) as e:
+        return path, None, str(e)
+    except KeyError as e:
+        return path, None, f"champ manquant {e}"
 
-            if isinstance(data, dict):
-                players.append(_player_from_dict(data))
-            else:
-                # Juste au cas où, on ignore les autres formats
-                print(f"Ignoré : {filename} n'est pas un objet JSON.")
 
-    return players
+def _parallel_map(
+    func: Callable[[Any], Any],
+    items: List[Any],
+    workers: int,
+    batch_size: int = 64
+) -> Iterator[Any]:
+    """
+    Applique `func` à chaque élément dans un pool de threads et produit les résultats
+    dans l'ordre des éléments. Les éléments sont confiés aux threads par lots de
+    `batch_size` (le coût de planification d'une tâche dépasse celui d'une petite lecture)
+    et seule une fenêtre de lots est en cours à la fois : la mémoire utilisée ne dépend
+    pas du nombre d'éléments.
+    """
+    if workers <= 1:
+        yield from map(func, items)
+        return
+
+    def run_batch(batch: List[Any]) -> List[Any]:
+        return [func(item) for item in batch]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        window: Deque[Future] = deque()
+        for start in range(0, len(items), batch_size):
+            window.append(pool.submit(run_batch, items[start:start + batch_size]))
+            if len(window) >= workers * 2:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
 
 
 def load_player_from_json(folder: str, id_national: str) -> Player:
@@ -60,29 +561,221 @@ def load_player_from_json(folder: str, id_national: str) -> Player:
     Lève FileNotFoundError si le fichier JSON n'existe pas.
     Utilise os.path au lieu de pathlib.
     """
-    # Construction du chemin vers le fichier JSON
-    filename = f"{id_national}.json"
-    path = os.path.join(folder, filename)
-
-    if not os.path.exists(path):
+    data = _read_player_data(folder, id_national)
+    if data is None:
         raise FileNotFoundError(f"Pas de joueur avec ID {id_national}")
 
-    # Lecture et désérialisation
-    with open(path, 'r', encoding='utf-8') as f:
-        data = json.load(f)
-
     # Création de l'objet Player à partir du dict
     return Player.from_dict(data)
 
 
+def _read_player_data(folder: str, id_national: str) -> dict | None:
+    """
+    Lit le profil d'un joueur dans le stockage configuré (dépôt, registre ou fichier),
+    ou dans la transaction en cours s'il y est en attente. Le profil est retourné
+    à la version courante du schéma (voir storage/schema.py).
+
+    Returns:
+        dict | None: Les données du joueur, ou None si aucun profil n'est enregistré.
+    """
+    transaction = _active_transaction(folder)
+    if transaction is not None:
+        pending = transaction.get(id_national)
+        if pending is not None:
+            return upgrade_player(pending)
+    repository = get_repository()
+    if repository is not None:
+        data = repository.load_player(id_national)
+    elif PLAYERS_LAYOUT == "registry":
+        data = get_registry(folder).get(id_national)
+    else:
+        data = _read_player_file(folder, id_national)
+    return upgrade_player(data) if data is not None else None
+
+
+class PlayerHydrator:
+    """
+    Charge à la demande les profils des LazyPlayer d'un dossier de joueurs :
+    les profils d'un lot de joueurs sont lus ensemble, en parallèle
+    (voir PLAYER_LOAD_WORKERS), chaque profil n'étant lu qu'une fois.
+    """
+
+    def __init__(self, folder: str, workers: int = PLAYER_LOAD_WORKERS) -> None:
+        """
+        Args:
+            folder (str): Le dossier des joueurs.
+            workers (int): Nombre de profils lus en parallèle.
+        """
+        self.folder = folder
+        self.workers = workers
+
+    def hydrate(self, players: List[LazyPlayer]) -> None:
+        """
+        Lit les profils des joueurs de `players` qui ne l'ont pas encore été.
+
+        Args:
+            players (list[LazyPlayer]): Les joueurs à compléter.
+        """
+        pending = [p for p in players if not p.is_hydrated]
+        idns = list(dict.fromkeys(p.id_national_chess for p in pending))
+        if not idns:
+            return
+
+        def read(idn: str) -> dict | None:
+            return _read_player_data(self.folder, idn)
+
+        profiles = dict(zip(idns, _parallel_map(read, idns, min(self.workers, len(idns)))))
+        for player in pending:
+            player.set_profile(profiles[player.id_national_chess])
+
+
+def lazy_players(players_data: List[dict], folder: str) -> List[LazyPlayer]:
+    """
+    Crée les joueurs d'un tournoi à partir de son `list_of_players`, sans lire leurs
+    profils : ils seront lus au premier accès au nom, au prénom ou à la date de naissance,
+    ou en un seul lot par `hydrate_players`.
+
+    Args:
+        players_data (list[dict]): Entrées id_national_chess, tournament_score, rank, played_with.
+        folder (str): Le dossier des joueurs.
+
+    Returns:
+        list[LazyPlayer]: Les joueurs, dans le même ordre.
+    """
+    hydrator = PlayerHydrator(folder)
+    return [
+        LazyPlayer(
+            id_national_chess=p["id_national_chess"],
+            hydrator=hydrator,
+            tournament_score=p["tournament_score"],
+            rank=p["rank"],
+            played_with=p["played_with"],
+        )
+        for p in players_data
+    ]
+
+
+def hydrate_players(players: Iterable[Player]) -> None:
+    """
+    Lit en un seul lot les profils des LazyPlayer de `players` qui ne l'ont pas encore été
+    (à appeler avant d'afficher un tableau de joueurs). Les autres joueurs sont ignorés.
+    """
+    groups: Dict[int, Tuple[PlayerHydrator, List[LazyPlayer]]] = {}
+    for player in players:
+        if isinstance(player, LazyPlayer) and not player.is_hydrated:
+            groups.setdefault(id(player.hydrator), (player.hydrator, []))[1].append(player)
+    for hydrator, group in groups.values():
+        hydrator.hydrate(group)
+
+
+def _read_player_file(folder: str, id_national: str) -> dict | None:
+    """
+    Lit le fichier JSON `<IDN>.json` d'un joueur, à travers le cache des profils.
+    Un fichier pas encore migré vers la disposition configurée est aussi trouvé.
+
+    Returns:
+        dict | None: Les données du joueur (copie), ou None si le fichier n'existe pas.
+    """
+    # Construction du chemin vers le fichier JSON
+    for path in _player_file_paths(folder, PLAYERS_FILENAME.format(id_input=id_national)):
+        data = _player_cache.get(path)
+        if data is not None:
+            return data
+    return None
+
+
+def player_exists(folder: str, id_national: str) -> bool:
+    """
+    Indique si un profil existe pour `id_national`, quelle que soit la disposition du stockage.
+
+    Args:
+        folder (str): Le dossier des joueurs.
+        id_national (str): Identifiant national du joueur.
+
+    Returns:
+        bool: True si le profil existe.
+    """
+    transaction = _active_transaction(folder)
+    if transaction is not None and transaction.get(id_national) is not None:
+        return True
+    repository = get_repository()
+    if repository is not None:
+        return repository.player_exists(id_national)
+    if PLAYERS_LAYOUT == "registry":
+        return get_registry(folder).contains(id_national)
+    paths = _player_file_paths(folder, PLAYERS_FILENAME.format(id_input=id_national))
+    return any(os.path.exists(path) for path in paths)
+
+
+def migrate_player_files(folder: str) -> Dict[str, int]:
+    """
+    Range chaque fichier joueur à l'emplacement de la disposition configurée
+    ("flat" ou "sharded"). Chaque fichier est déplacé par un renommage atomique :
+    la migration peut être interrompue à tout moment et relancée, elle reprend
+    avec les fichiers restants. Pendant la migration, les profils restent lisibles.
+
+    Args:
+        folder (str): Le dossier des joueurs.
+
+    Returns:
+        dict: "moved" (fichiers déplacés) et "duplicates" (anciens fichiers supprimés
+            car une version plus récente existait déjà au nouvel emplacement).
+    """
+    report = {"moved": 0, "duplicates": 0}
+    if get_repository() is not None or PLAYERS_LAYOUT == "registry" or not os.path.isdir(folder):
+        return report
+    other = "flat" if PLAYERS_LAYOUT == "sharded" else "sharded"
+    for filename, entry in sorted(scan_player_files(folder)[other].items()):
+        path = entry.path
+        target = player_file_path(folder, filename)
+        if os.path.exists(target):
+            # Le profil a été réenregistré au nouvel emplacement depuis le début de la migration
+            os.remove(path)
+            report["duplicates"] += 1
+        else:
+            os.makedirs(os.path.dirname(target), exist_ok=True)
+            os.replace(path, target)
+            report["moved"] += 1
+        if other == "sharded":
+            _remove_empty_shards(os.path.dirname(path), folder)
+    return report
+
+
+def _remove_empty_shards(directory: str, folder: str) -> None:
+    """Supprime les sous-dossiers de disposition "sharded" devenus vides."""
+    while os.path.abspath(directory) != os.path.abspath(folder) and not os.listdir(directory):
+        os.rmdir(directory)
+        directory = os.path.dirname(directory)
+
+
+def search_players(folder: str, query: str, limit: int = PLAYER_SEARCH_LIMIT) -> list[dict]:
+    """
+    Recherche des joueurs par début de nom ou de prénom, sans tenir compte des accents
+    ni de la casse (voir storage/player_search.py). L'index est construit à la première
+    recherche en lisant tous les joueurs, puis tenu à jour à chaque sauvegarde.
+
+    Args:
+        folder (str): Le dossier des joueurs.
+        query (str): Le texte saisi (ex : "dupont je").
+        limit (int): Nombre maximal de résultats.
+
+    Returns:
+        list[dict]: Les joueurs trouvés (id_national_chess, last_name, first_name).
+    """
+    def load_players() -> Iterator[dict]:
+        return (player.get_serialized_player() for player in iter_players_from_json(folder))
+
+    return search_player_names(folder, query, load_players, limit)
+
+
 def _player_from_dict(d: dict) -> Player:
-    """Convertit un dict JSON en instance Player."""
+    """Convertit un dict JSON (à la version courante du schéma) en instance Player."""
     return Player(
         first_name=d["first_name"],
         last_name=d["last_name"],
         date_of_birth=d["date_of_birth"],
         id_national_chess=d["id_national_chess"],
-        tournament_score=d.get("tournament_score", 0.0),
-        rank=d.get("rank", 0),
-        played_with=d.get("played_with", []),
+        tournament_score=d["tournament_score"],
+        rank=d["rank"],
+        played_with=d["played_with"],
     )
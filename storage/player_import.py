@@ -0,0 +1,196 @@
+import csv
+import json
+import os
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from config import PLAYER_IMPORT_BATCH_SIZE
+from models.player_model import Player
+from storage.player_data import save_players
+from utils.input_formatters import format_date, format_first_name, format_id_national_chess, format_name
+from utils.input_validators import is_valid_id_national_chess, is_valid_name, is_valid_player_birthdate
+
+# Extensions reconnues pour chaque format de fichier d'import
+CSV_EXTENSIONS = (".csv",)
+NDJSON_EXTENSIONS = (".ndjson", ".jsonl")
+
+# Colonnes (CSV) ou clés (NDJSON) attendues, comme dans les fichiers joueurs
+_FIELDS = ("id_national_chess", "last_name", "first_name", "date_of_birth")
+_REJECT_FIELDS = ("line", "reason", "record")
+
+
+def rejects_path_for(source: str) -> str:
+    """Fichier des rejets par défaut (ex : 'ffe.csv' -> 'ffe.rejects.csv')."""
+    stem, _ = os.path.splitext(source)
+    return f"{stem}.rejects.csv"
+
+
+def _csv_records(file) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """Lignes d'un fichier CSV (séparateur « , », « ; » ou tabulation, détecté sur le début du fichier)."""
+    sample = file.read(4096)
+    file.seek(0)
+    try:
+        dialect = csv.Sniffer().sniff(sample, delimiters=",;\t")
+    except csv.Error:
+        dialect = csv.excel
+    reader = csv.DictReader(file, dialect=dialect)
+    for record in reader:
+        yield reader.line_num, record, None
+
+
+def _ndjson_records(file) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """Lignes d'un fichier NDJSON (un objet JSON par ligne, lignes vides ignorées)."""
+    for line_number, line in enumerate(file, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError as e:
+            yield line_number, line.strip(), f"JSON invalide ({e.msg})"
+            continue
+        if not isinstance(record, dict):
+            yield line_number, line.strip(), "un objet JSON est attendu"
+            continue
+        yield line_number, record, None
+
+
+def read_player_records(file, source: str) -> Iterator[Tuple[int, Optional[Dict[str, Any]], Optional[str]]]:
+    """
+    Lit les enregistrements d'un fichier d'import un par un, sans charger tout le fichier.
+
+    Args:
+        file: Le fichier ouvert en mode texte.
+        source (str): Son chemin, dont l'extension choisit le format (CSV ou NDJSON).
+
+    Returns:
+        Iterator: (numéro de ligne, enregistrement, None), ou (numéro de ligne, ligne brute,
+            raison du rejet) pour une ligne illisible.
+
+    Raises:
+        ValueError: si l'extension ne correspond à aucun format connu.
+    """
+    extension = os.path.splitext(source)[1].lower()
+    if extension in CSV_EXTENSIONS:
+        return _csv_records(file)
+    if extension in NDJSON_EXTENSIONS:
+        return _ndjson_records(file)
+    raise ValueError(f"Format d'import inconnu : {extension or source!r} (attendu : .csv, .ndjson ou .jsonl)")
+
+
+def validate_player_record(record: Dict[str, Any]) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Applique à un enregistrement les formateurs et validateurs de la saisie interactive
+    (voir PlayerView).
+
+    Args:
+        record (dict): Enregistrement brut (colonnes id_national_chess, last_name,
+            first_name, date_of_birth).
+
+    Returns:
+        tuple: (données sérialisées du joueur, None), ou (None, raison du rejet).
+    """
+    values = {}
+    for field in _FIELDS:
+        value = record.get(field)
+        if value is None or not str(value).strip():
+            return None, f"{field} manquant"
+        values[field] = str(value)
+
+    id_national = format_id_national_chess(values["id_national_chess"])
+    if not is_valid_id_national_chess(id_national):
+        return None, "id_national_chess invalide (format attendu : XX00000)"
+    last_name = format_name(values["last_name"])
+    if not is_valid_name(last_name):
+        return None, "last_name invalide"
+    first_name = format_first_name(values["first_name"])
+    if not is_valid_name(first_name):
+        return None, "first_name invalide"
+    date_of_birth = format_date(values["date_of_birth"])
+    if not is_valid_player_birthdate(date_of_birth):
+        return None, "date_of_birth invalide"
+
+    player = Player(
+        id_national_chess=id_national,
+        first_name=first_name,
+        last_name=last_name,
+        date_of_birth=date_of_birth,
+    )
+    return player.get_serialized_player(), None
+
+
+class _RejectsWriter:
+    """Fichier CSV des lignes rejetées, créé seulement au premier rejet."""
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self.count = 0
+        self._file = None
+        self._writer = None
+
+    def write(self, line_number: int, reason: str, record: Any) -> None:
+        if self._writer is None:
+            self._file = open(self.path, "w", encoding="utf-8", newline="")
+            self._writer = csv.writer(self._file)
+            self._writer.writerow(_REJECT_FIELDS)
+        raw = record if isinstance(record, str) else json.dumps(record, ensure_ascii=False)
+        self._writer.writerow((line_number, reason, raw))
+        self.count += 1
+
+    def close(self) -> None:
+        if self._file is not None:
+            self._file.close()
+
+
+def import_players(
+    source: str,
+    folder: str,
+    rejects_path: Optional[str] = None,
+    batch_size: int = PLAYER_IMPORT_BATCH_SIZE,
+) -> Dict[str, Any]:
+    """
+    Importe les joueurs d'un fichier CSV ou NDJSON (ex : liste d'une fédération).
+
+    Le fichier est lu en flux : seuls les joueurs du lot en cours sont gardés en mémoire,
+    quelle que soit la taille du fichier. Chaque lot de `batch_size` joueurs validés est
+    écrit en une seule opération (voir `save_players`). Un joueur déjà enregistré
+    est mis à jour ; les lignes invalides sont écrites, avec leur raison, dans le fichier
+    des rejets.
+
+    Args:
+        source (str): Le fichier à importer (.csv, .ndjson ou .jsonl).
+        folder (str): Le dossier des joueurs.
+        rejects_path (str | None): Le fichier des rejets (par défaut : voir `rejects_path_for`).
+        batch_size (int): Nombre de joueurs par écriture.
+
+    Returns:
+        dict: "imported", "rejected" et "rejects_path" (None s'il n'y a eu aucun rejet).
+
+    Raises:
+        FileNotFoundError: si `source` n'existe pas.
+        ValueError: si le format de `source` n'est pas reconnu.
+    """
+    rejects = _RejectsWriter(rejects_path or rejects_path_for(source))
+    imported = 0
+    batch: List[Dict[str, Any]] = []
+    try:
+        with open(source, "r", encoding="utf-8-sig", newline="") as file:
+            for line_number, record, error in read_player_records(file, source):
+                if error is None:
+                    player_data, error = validate_player_record(record)
+                if error is not None:
+                    rejects.write(line_number, error, record)
+                    continue
+                batch.append(player_data)
+                if len(batch) >= batch_size:
+                    save_players(batch, folder)
+                    imported += len(batch)
+                    batch = []
+        if batch:
+            save_players(batch, folder)
+            imported += len(batch)
+    finally:
+        rejects.close()
+    return {
+        "imported": imported,
+        "rejected": rejects.count,
+        "rejects_path": rejects.path if rejects.count else None,
+    }
@@ -0,0 +1,154 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import PLAYERS_MANIFEST
+from storage.write_behind import write_atomic
+
+# Champs du profil recopiés dans le manifeste
+SUMMARY_FIELDS = ("id_national_chess", "first_name", "last_name", "date_of_birth")
+
+# Résultat d'une lecture de fichier joueur : (chemin, profil ou None, message d'erreur ou None)
+ReadResult = Tuple[str, Optional[Dict[str, Any]], Optional[str]]
+
+
+def summary_from_data(player_data: Dict[str, Any]) -> Dict[str, Any]:
+    """Résumé manifeste d'un joueur : son profil, sans les champs de tournoi."""
+    return {field: player_data.get(field) for field in SUMMARY_FIELDS}
+
+
+class PlayerManifest:
+    """
+    Manifeste des fichiers joueurs d'un dossier (dispositions "flat" et "sharded") :
+    pour chaque fichier, sa taille, sa date de modification (ns) et le profil qu'il contient
+    (ou le message d'erreur s'il est illisible).
+
+    Les entrées restent en mémoire d'un appel à l'autre. Chaque resynchronisation compare
+    les signatures relevées par os.scandir avec celles du manifeste : seuls les fichiers
+    nouveaux ou modifiés sont relus. Les sauvegardes du processus mettent le manifeste
+    à jour sans relecture. Il est persisté dans PLAYERS_MANIFEST, à côté des joueurs.
+    """
+
+    def __init__(self, folder: str) -> None:
+        """
+        Args:
+            folder (str): Le dossier des joueurs.
+        """
+        self.folder = folder
+        self.path = os.path.join(folder, PLAYERS_MANIFEST)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self._dirty = False
+        self._results: Optional[List[ReadResult]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Charge le manifeste persisté (une seule fois par processus)."""
+        if self._entries is None:
+            self._entries = {}
+            if os.path.isfile(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._entries = json.load(f).get("entries", {})
+                except (OSError, ValueError):
+                    # Manifeste illisible : il sera reconstruit depuis les fichiers
+                    self._entries = {}
+        return self._entries
+
+    def update(self, filename: str, path: str, player_data: Dict[str, Any]) -> None:
+        """
+        Met à jour l'entrée d'un joueur que le processus vient d'écrire dans `path`.
+
+        Args:
+            filename (str): Nom du fichier joueur (ex : 'AB12345.json').
+            path (str): Chemin du fichier écrit.
+            player_data (dict): Le joueur sérialisé.
+        """
+        st = os.stat(path)
+        with self._lock:
+            self._load()[filename] = {
+                "path": os.path.relpath(path, self.folder),
+                "signature": [st.st_size, st.st_mtime_ns],
+                "player": summary_from_data(player_data),
+            }
+            self._dirty = True
+
+    def refresh(
+        self,
+        files: Dict[str, os.DirEntry],
+        read: Callable[[List[str]], Iterable[ReadResult]],
+    ) -> List[ReadResult]:
+        """
+        Resynchronise le manifeste avec les fichiers relevés et retourne leur contenu.
+        Si aucun fichier n'a changé, la liste du précédent appel est retournée telle quelle.
+
+        Args:
+            files (dict): Fichier retenu pour chaque nom de fichier joueur (os.DirEntry).
+            read (callable): Lit une liste de chemins et produit un ReadResult par chemin ;
+                appelé seulement pour les fichiers nouveaux ou modifiés.
+
+        Returns:
+            list[tuple]: (chemin, profil ou None, message d'erreur ou None) pour chaque
+                fichier, trié par nom de fichier. Les profils sont partagés : ne pas les modifier.
+        """
+        prefix = os.path.join(self.folder, "")
+        with self._lock:
+            entries = self._load()
+            changed = self._dirty
+            for filename in [name for name in entries if name not in files]:
+                del entries[filename]
+                changed = True
+
+            stale: Dict[str, List[int]] = {}
+            for filename, dir_entry in files.items():
+                st = dir_entry.stat()
+                signature = [st.st_size, st.st_mtime_ns]
+                entry = entries.get(filename)
+                if entry is None or entry["signature"] != signature:
+                    stale[dir_entry.path] = signature
+                elif entry["path"] != dir_entry.path[len(prefix):]:
+                    # Fichier déplacé par une migration de disposition : contenu inchangé
+                    entry["path"] = dir_entry.path[len(prefix):]
+                    changed = True
+
+            for path, data, error in read(list(stale)):
+                entry = {"path": path[len(prefix):], "signature": stale[path]}
+                if data is None:
+                    entry["error"] = error
+                else:
+                    entry["player"] = summary_from_data(data)
+                entries[os.path.basename(path)] = entry
+                changed = True
+
+            if changed:
+                self._persist(entries)
+                self._results = None
+            if self._results is None:
+                self._results = [
+                    (prefix + entries[name]["path"], entries[name].get("player"), entries[name].get("error"))
+                    for name in sorted(entries)
+                ]
+            return self._results
+
+    def _persist(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Écrit le manifeste de façon atomique."""
+        payload = json.dumps({"version": 1, "entries": entries}, ensure_ascii=False).encode("utf-8")
+        write_atomic(self.path, payload)
+        self._dirty = False
+
+
+_manifests: Dict[str, PlayerManifest] = {}
+_manifests_lock = threading.Lock()
+
+
+def get_player_manifest(folder: str) -> PlayerManifest:
+    """
+    Retourne le manifeste des joueurs (partagé dans le processus) du dossier `folder`.
+    """
+    key = os.path.abspath(folder)
+    with _manifests_lock:
+        manifest = _manifests.get(key)
+        if manifest is None:
+            manifest = PlayerManifest(folder)
+            _manifests[key] = manifest
+        return manifest
@@ -0,0 +1,422 @@
+import json
+import os
+import secrets
+import struct
+import threading
+import zlib
+from typing import Any, Dict, Iterator, Optional
+
+from config import (
+    PLAYERS_REGISTRY_DATA,
+    PLAYERS_REGISTRY_INDEX,
+    REGISTRY_COMPACTION_RATIO,
+    REGISTRY_COMPACTION_MIN_BYTES
+)
+from storage.write_behind import fsync_directory
+
+
+# En-tête de l'index : magic, jeton du fichier de données, capacité, nombre d'entrées,
+# octets vivants et octets morts dans le fichier de données.
+_HEADER = struct.Struct("<4s8sIIQQ")
+_MAGIC = b"PRIX"
+# Alvéole de la table de hachage : IDN (7 octets), offset et longueur de l'enregistrement.
+_KEY_SIZE = 7
+_SLOT = struct.Struct(f"<{_KEY_SIZE}sQI")
+_EMPTY_KEY = b"\x00" * _KEY_SIZE
+_DATA_MAGIC = b"PLAYER-REGISTRY "
+_INITIAL_CAPACITY = 1024
+_MAX_LOAD_FACTOR = 0.7
+# Marqueur écrit une fois l'import des fichiers joueurs terminé (à côté du fichier de données)
+_IMPORT_MARKER_SUFFIX = ".imported"
+# Nombre de joueurs ajoutés par écriture pendant l'import des fichiers joueurs
+_IMPORT_BATCH_SIZE = 1000
+
+
+class PlayerRegistry:
+    """
+    Registre des joueurs stocké dans un unique fichier de données « packé »
+    et une table de hachage sur disque indexée par `id_national_chess`.
+
+    - Le fichier de données est en ajout seul : chaque sauvegarde ajoute une ligne JSON.
+    - L'index (adressage ouvert, sondage linéaire) donne l'offset de la version courante
+      de chaque joueur : une lecture coûte O(1) accès disque.
+    - Les anciennes versions deviennent des octets morts, récupérés par compaction.
+    """
+
+    def __init__(self, folder: str) -> None:
+        """
+        Ouvre (ou crée) le registre situé dans `folder`.
+
+        Args:
+            folder (str): Dossier contenant registry.dat et registry.idx.
+        """
+        self.folder = folder
+        self.data_path = os.path.join(folder, PLAYERS_REGISTRY_DATA)
+        self.index_path = os.path.join(folder, PLAYERS_REGISTRY_INDEX)
+        self._lock = threading.RLock()
+        os.makedirs(folder, exist_ok=True)
+
+        self.import_marker_path = self.data_path + _IMPORT_MARKER_SUFFIX
+        if not os.path.exists(self.data_path):
+            self._create_empty(secrets.token_bytes(8))
+        self._open()
+        if not os.path.exists(self.import_marker_path):
+            self.import_player_files()
+
+    # ------------------------------------------------------------------ #
+    # Ouverture / création
+    # ------------------------------------------------------------------ #
+
+    def _create_empty(self, token: bytes) -> None:
+        """Crée un fichier de données et un index vides partageant le même jeton."""
+        with open(self.data_path, "wb") as data:
+            data.write(_DATA_MAGIC + token.hex().encode("ascii") + b"\n")
+            data.flush()
+            os.fsync(data.fileno())
+        self._write_index_file(self.index_path, token, _INITIAL_CAPACITY, {}, 0, 0)
+
+    def _open(self) -> None:
+        """
+        Ouvre les deux fichiers. Si l'index est absent ou ne correspond pas
+        au fichier de données (crash pendant une compaction), il est reconstruit.
+        """
+        self._data = open(self.data_path, "a+b")
+        token = self._read_data_token()
+        if not self._index_matches(token):
+            self._rebuild_index(token)
+        self._index = open(self.index_path, "r+b")
+        self._read_header()
+
+    def _read_data_token(self) -> bytes:
+        self._data.seek(0)
+        first_line = self._data.readline()
+        if not first_line.startswith(_DATA_MAGIC):
+            raise ValueError(f"{self.data_path} n'est pas un registre de joueurs.")
+        return bytes.fromhex(first_line[len(_DATA_MAGIC):].strip().decode("ascii"))
+
+    def _index_matches(self, token: bytes) -> bool:
+        if not os.path.exists(self.index_path):
+            return False
+        with open(self.index_path, "rb") as index:
+            raw = index.read(_HEADER.size)
+        if len(raw) < _HEADER.size:
+            return False
+        magic, index_token, *_ = _HEADER.unpack(raw)
+        return magic == _MAGIC and index_token == token
+
+    def _read_header(self) -> None:
+        self._index.seek(0)
+        (_, self._token, self._capacity, self._count,
+         self._live_bytes, self._dead_bytes) = _HEADER.unpack(self._index.read(_HEADER.size))
+
+    def _write_header(self) -> None:
+        self._index.seek(0)
+        self._index.write(_HEADER.pack(
+            _MAGIC, self._token, self._capacity, self._count, self._live_bytes, self._dead_bytes
+        ))
+
+    # ------------------------------------------------------------------ #
+    # Table de hachage sur disque
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _key(id_national: str) -> bytes:
+        key = id_national.encode("ascii")
+        if len(key) != _KEY_SIZE:
+            raise ValueError(f"IDN invalide pour le registre : {id_national!r}")
+        return key
+
+    @staticmethod
+    def _first_slot(key: bytes, capacity: int) -> int:
+        return zlib.crc32(key) & (capacity - 1)
+
+    def _read_slot(self, position: int) -> tuple[bytes, int, int]:
+        self._index.seek(_HEADER.size + position * _SLOT.size)
+        return _SLOT.unpack(self._index.read(_SLOT.size))
+
+    def _write_slot(self, position: int, key: bytes, offset: int, length: int) -> None:
+        self._index.seek(_HEADER.size + position * _SLOT.size)
+        self._index.write(_SLOT.pack(key, offset, length))
+
+    def _probe(self, key: bytes) -> tuple[int, Optional[tuple[int, int]]]:
+        """
+        Sonde la table à partir de l'alvéole de hachage.
+
+        Returns:
+            tuple: (position de l'alvéole trouvée ou libre, (offset, longueur) ou None).
+        """
+        position = self._first_slot(key, self._capacity)
+        while True:
+            slot_key, offset, length = self._read_slot(position)
+            if slot_key == _EMPTY_KEY:
+                return position, None
+            if slot_key == key:
+                return position, (offset, length)
+            position = (position + 1) & (self._capacity - 1)
+
+    @staticmethod
+    def _write_index_file(path: str, token: bytes, capacity: int,
+                          entries: Dict[bytes, tuple[int, int]], live: int, dead: int) -> None:
+        """Écrit une table complète dans un fichier temporaire puis le renomme."""
+        table = bytearray(_SLOT.size * capacity)
+        for key, (offset, length) in entries.items():
+            position = PlayerRegistry._first_slot(key, capacity)
+            while table[position * _SLOT.size:position * _SLOT.size + _KEY_SIZE] != _EMPTY_KEY:
+                position = (position + 1) & (capacity - 1)
+            _SLOT.pack_into(table, position * _SLOT.size, key, offset, length)
+
+        tmp_path = f"{path}.tmp"
+        with open(tmp_path, "wb") as index:
+            index.write(_HEADER.pack(_MAGIC, token, capacity, len(entries), live, dead))
+            index.write(table)
+            index.flush()
+            os.fsync(index.fileno())
+        os.replace(tmp_path, path)
+
+    def _live_entries(self) -> Dict[bytes, tuple[int, int]]:
+        """Charge toutes les alvéoles occupées de l'index en mémoire."""
+        self._index.seek(_HEADER.size)
+        raw = self._index.read(_SLOT.size * self._capacity)
+        entries = {}
+        for key, offset, length in _SLOT.iter_unpack(raw):
+            if key != _EMPTY_KEY:
+                entries[key] = (offset, length)
+        return entries
+
+    def _resize(self, capacity: int) -> None:
+        """Recrée l'index avec une capacité plus grande (facteur de charge dépassé)."""
+        entries = self._live_entries()
+        self._index.close()
+        self._write_index_file(
+            self.index_path, self._token, capacity, entries, self._live_bytes, self._dead_bytes
+        )
+        self._index = open(self.index_path, "r+b")
+        self._read_header()
+
+    def _rebuild_index(self, token: bytes) -> None:
+        """
+        Reconstruit l'index en relisant le fichier de données :
+        la dernière occurrence de chaque IDN est la version courante.
+        """
+        entries: Dict[bytes, tuple[int, int]] = {}
+        live = dead = 0
+        for offset, line in self._scan_data():
+            key = self._key(json.loads(line)["id_national_chess"])
+            if key in entries:
+                dead += entries[key][1]
+                live -= entries[key][1]
+            entries[key] = (offset, len(line))
+            live += len(line)
+
+        capacity = _INITIAL_CAPACITY
+        while len(entries) > capacity * _MAX_LOAD_FACTOR:
+            capacity *= 2
+        self._write_index_file(self.index_path, token, capacity, entries, live, dead)
+
+    def _scan_data(self, data_file=None) -> Iterator[tuple[int, bytes]]:
+        """Parcourt séquentiellement les enregistrements (offset, ligne) du fichier de données."""
+        data_file = data_file or self._data
+        data_file.seek(0)
+        offset = len(data_file.readline())
+        for line in data_file:
+            if line.endswith(b"\n"):
+                yield offset, line
+            offset += len(line)
+
+    # ------------------------------------------------------------------ #
+    # API publique
+    # ------------------------------------------------------------------ #
+
+    def get(self, id_national: str) -> Optional[Dict[str, Any]]:
+        """
+        Retourne le dict du joueur `id_national`, ou None s'il est inconnu.
+        """
+        with self._lock:
+            _, found = self._probe(self._key(id_national))
+            if found is None:
+                return None
+            offset, length = found
+            self._data.seek(offset)
+            return json.loads(self._data.read(length))
+
+    def contains(self, id_national: str) -> bool:
+        """Indique si le registre contient le joueur `id_national`."""
+        with self._lock:
+            return self._probe(self._key(id_national))[1] is not None
+
+    def put(self, player_data: Dict[str, Any]) -> None:
+        """
+        Ajoute la nouvelle version d'un joueur en fin de fichier et met à jour
+        son alvéole d'index. Déclenche une compaction si trop d'octets sont morts.
+
+        Args:
+            player_data (dict): Données sérialisées du joueur.
+        """
+        self.put_many([player_data])
+
+    def put_many(self, players_data: list[Dict[str, Any]]) -> None:
+        """
+        Ajoute plusieurs joueurs en une seule écriture sur le fichier de données.
+
+        Args:
+            players_data (list[dict]): Données sérialisées des joueurs.
+        """
+        with self._lock:
+            self._data.seek(0, os.SEEK_END)
+            offset = self._data.tell()
+            records = []
+            chunks = []
+            for player_data in players_data:
+                line = json.dumps(player_data, ensure_ascii=False).encode("utf-8") + b"\n"
+                records.append((self._key(player_data["id_national_chess"]), offset, len(line)))
+                chunks.append(line)
+                offset += len(line)
+            self._data.write(b"".join(chunks))
+            # Les enregistrements sont sur disque avant que l'index n'y renvoie
+            self._data.flush()
+            os.fsync(self._data.fileno())
+
+            for key, record_offset, length in records:
+                if self._count + 1 > self._capacity * _MAX_LOAD_FACTOR:
+                    self._resize(self._capacity * 2)
+                position, found = self._probe(key)
+                if found is None:
+                    self._count += 1
+                else:
+                    self._live_bytes -= found[1]
+                    self._dead_bytes += found[1]
+                self._live_bytes += length
+                self._write_slot(position, key, record_offset, length)
+            self._write_header()
+            self._index.flush()
+
+            if self._needs_compaction():
+                self.compact()
+
+    def sync(self) -> None:
+        """Force l'écriture sur disque (fsync) du fichier de données et de l'index."""
+        with self._lock:
+            self._data.flush()
+            os.fsync(self._data.fileno())
+            self._index.flush()
+            os.fsync(self._index.fileno())
+
+    def iter_players(self) -> Iterator[Dict[str, Any]]:
+        """
+        Itère sur la version courante de chaque joueur, dans l'ordre du fichier de données.
+        Une seule lecture séquentielle : les versions obsolètes sont simplement ignorées.
+        """
+        with self._lock:
+            live_offsets = {offset for offset, _ in self._live_entries().values()}
+            data_file = open(self.data_path, "rb")
+        with data_file:
+            for offset, line in self._scan_data(data_file):
+                if offset in live_offsets:
+                    yield json.loads(line)
+
+    def _needs_compaction(self) -> bool:
+        total = self._live_bytes + self._dead_bytes
+        return (
+            total >= REGISTRY_COMPACTION_MIN_BYTES
+            and self._dead_bytes > total * REGISTRY_COMPACTION_RATIO
+        )
+
+    def compact(self) -> None:
+        """
+        Réécrit le fichier de données avec les seules versions courantes,
+        sous un nouveau jeton, puis régénère l'index correspondant.
+        En cas d'interruption, le jeton différent force la reconstruction de l'index.
+        """
+        with self._lock:
+            token = secrets.token_bytes(8)
+            entries: Dict[bytes, tuple[int, int]] = {}
+            live_offsets = {offset for offset, _ in self._live_entries().values()}
+
+            tmp_path = f"{self.data_path}.tmp"
+            with open(tmp_path, "wb") as compacted:
+                compacted.write(_DATA_MAGIC + token.hex().encode("ascii") + b"\n")
+                for offset, line in self._scan_data():
+                    if offset not in live_offsets:
+                        continue
+                    key = self._key(json.loads(line)["id_national_chess"])
+                    entries[key] = (compacted.tell(), len(line))
+                    compacted.write(line)
+                compacted.flush()
+                os.fsync(compacted.fileno())
+            live = sum(length for _, length in entries.values())
+
+            self._data.close()
+            self._index.close()
+            os.replace(tmp_path, self.data_path)
+            capacity = _INITIAL_CAPACITY
+            while len(entries) > capacity * _MAX_LOAD_FACTOR:
+                capacity *= 2
+            self._write_index_file(self.index_path, token, capacity, entries, live, 0)
+            self._open()
+
+    def import_player_files(self) -> int:
+        """
+        Importe dans le registre les fichiers `<IDN>.json` du dossier, dispositions "flat"
+        et "sharded" (passage de la disposition « un fichier par joueur » au registre).
+        Un joueur déjà présent dans le registre n'est pas remplacé. Le marqueur d'import
+        n'est écrit qu'une fois tous les fichiers importés : un import interrompu est
+        repris à la prochaine ouverture du registre.
+
+        Returns:
+            int: Nombre de joueurs importés.
+        """
+        from storage.player_data import scan_player_files
+
+        found = scan_player_files(self.folder)
+        imported = 0
+        batch = []
+        seen = set()
+        for entry in [*found["flat"].values(), *found["sharded"].values()]:
+            with open(entry.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+            idn = data.get("id_national_chess") if isinstance(data, dict) else None
+            if not idn or idn in seen or self.contains(idn):
+                continue
+            seen.add(idn)
+            batch.append(data)
+            if len(batch) >= _IMPORT_BATCH_SIZE:
+                self.put_many(batch)
+                imported += len(batch)
+                batch = []
+        if batch:
+            self.put_many(batch)
+            imported += len(batch)
+        self.sync()
+        with open(self.import_marker_path, "wb") as marker:
+            marker.flush()
+            os.fsync(marker.fileno())
+        fsync_directory(self.folder)
+        return imported
+
+    def close(self) -> None:
+        """Ferme les descripteurs de fichiers du registre."""
+        with self._lock:
+            self._data.close()
+            self._index.close()
+
+
+_registries: Dict[str, PlayerRegistry] = {}
+_registries_lock = threading.Lock()
+
+
+def get_registry(folder: str) -> PlayerRegistry:
+    """
+    Retourne le registre (partagé dans le processus) associé au dossier `folder`.
+    """
+    key = os.path.abspath(folder)
+    with _registries_lock:
+        registry = _registries.get(key)
+        if registry is None:
+            registry = PlayerRegistry(folder)
+            _registries[key] = registry
+        return registry
+
+
+def compact_registry(folder: str) -> None:
+    """Force la compaction du registre de `folder`."""
+    get_registry(folder).compact()
@@ -0,0 +1,234 @@
+import json
+import os
+import re
+import threading
+import unicodedata
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from config import PLAYERS_NAME_INDEX, PLAYER_SEARCH_LIMIT
+from storage.write_behind import write_atomic
+
+# Séparateur entre le mot normalisé et l'IDN dans les clés de l'index
+_SEP = "\x00"
+_WORD = re.compile(r"[^\W_]+")
+
+
+def normalize_words(text: Optional[str]) -> List[str]:
+    """
+    Découpe un nom en mots comparables : sans accents, en minuscules, séparés
+    par les espaces, tirets et apostrophes (ex : "Jean-Éric" -> ["jean", "eric"]).
+    """
+    if not text:
+        return []
+    decomposed = unicodedata.normalize("NFKD", text)
+    stripped = "".join(c for c in decomposed if not unicodedata.combining(c))
+    return _WORD.findall(stripped.casefold())
+
+
+def _entry(player_data: Dict[str, Any]) -> Tuple[str, str, str]:
+    return (
+        player_data["id_national_chess"],
+        player_data.get("last_name") or "",
+        player_data.get("first_name") or "",
+    )
+
+
+class PlayerNameIndex:
+    """
+    Index de recherche des joueurs par nom et prénom, persistant dans PLAYERS_NAME_INDEX.
+
+    - En mémoire : une liste triée de clés "<mot normalisé>\\x00<IDN>" (un mot par
+      nom et prénom), parcourue par bisect : une recherche par préfixe ne lit que
+      les clés qui commencent par ce préfixe.
+    - Sur disque : une ligne JSON [IDN, nom, prénom] par sauvegarde, ajoutée en fin
+      de fichier (la dernière ligne d'un IDN fait foi) ; le fichier est compacté
+      au chargement lorsqu'il contient trop de lignes obsolètes.
+    """
+
+    def __init__(self, folder: str) -> None:
+        """
+        Args:
+            folder (str): Le dossier des joueurs, qui contient le fichier de l'index.
+        """
+        self.path = os.path.join(folder, PLAYERS_NAME_INDEX)
+        self._lock = threading.Lock()
+        self._keys: Optional[List[str]] = None
+        self._names: Dict[str, Tuple[str, str]] = {}
+
+    def exists(self) -> bool:
+        """Indique si l'index a déjà été construit."""
+        return os.path.exists(self.path)
+
+    def build(self, players_data: Iterable[Dict[str, Any]]) -> int:
+        """
+        (Re)construit l'index à partir de tous les joueurs enregistrés.
+
+        Args:
+            players_data (Iterable[dict]): Les joueurs sérialisés.
+
+        Returns:
+            int: Le nombre de joueurs indexés.
+        """
+        with self._lock:
+            self._names = {}
+            for player_data in players_data:
+                idn, last_name, first_name = _entry(player_data)
+                self._names[idn] = (last_name, first_name)
+            self._write_snapshot()
+            self._sort_keys()
+            return len(self._names)
+
+    def update(self, player_data: Dict[str, Any]) -> None:
+        """
+        Enregistre les nom et prénom (éventuellement modifiés) d'un joueur.
+
+        Args:
+            player_data (dict): Le joueur sérialisé.
+        """
+        self.update_many([player_data])
+
+    def update_many(self, players_data: Iterable[Dict[str, Any]]) -> None:
+        """
+        Enregistre les nom et prénom de plusieurs joueurs en une seule écriture.
+        Sans effet tant que l'index n'a pas été construit : la construction relira ces joueurs.
+
+        Args:
+            players_data (Iterable[dict]): Les joueurs sérialisés.
+        """
+        with self._lock:
+            if self._keys is None and not self.exists():
+                return
+            lines = []
+            for player_data in players_data:
+                idn, last_name, first_name = _entry(player_data)
+                if self._keys is not None:
+                    previous = self._names.get(idn)
+                    if previous == (last_name, first_name):
+                        continue
+                    for word in set(self._words(previous)):
+                        self._discard(f"{word}{_SEP}{idn}")
+                    self._names[idn] = (last_name, first_name)
+                    for word in set(self._words((last_name, first_name))):
+                        insort(self._keys, f"{word}{_SEP}{idn}")
+                lines.append(json.dumps([idn, last_name, first_name], ensure_ascii=False) + "\n")
+            if lines:
+                with open(self.path, "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+
+    def search(self, query: str, limit: int = PLAYER_SEARCH_LIMIT) -> List[Dict[str, str]]:
+        """
+        Cherche les joueurs dont chaque mot de `query` est le début d'un mot de leur
+        nom ou prénom, sans tenir compte des accents ni de la casse
+        (ex : "dup je" trouve DUPONT Jean et Jérôme DUPUIS).
+
+        Args:
+            query (str): Le texte saisi.
+            limit (int): Nombre maximal de résultats.
+
+        Returns:
+            list[dict]: Au plus `limit` joueurs (id_national_chess, last_name, first_name),
+                triés par le mot le plus long de la recherche.
+        """
+        words = normalize_words(query)
+        if not words:
+            return []
+        # Le mot le plus long est le plus sélectif : c'est lui qui parcourt l'index
+        driver = max(words, key=len)
+        others = [word for word in words if word is not driver]
+        with self._lock:
+            self._load()
+            results = []
+            seen = set()
+            position = bisect_left(self._keys, driver)
+            while position < len(self._keys) and len(results) < limit:
+                key = self._keys[position]
+                position += 1
+                if not key.startswith(driver):
+                    break
+                idn = key.rsplit(_SEP, 1)[1]
+                if idn in seen:
+                    continue
+                seen.add(idn)
+                names = self._names[idn]
+                player_words = self._words(names)
+                if all(any(w.startswith(other) for w in player_words) for other in others):
+                    results.append({"id_national_chess": idn, "last_name": names[0], "first_name": names[1]})
+            return results
+
+    @staticmethod
+    def _words(names: Optional[Tuple[str, str]]) -> List[str]:
+        if names is None:
+            return []
+        return normalize_words(names[0]) + normalize_words(names[1])
+
+    def _discard(self, key: str) -> None:
+        position = bisect_left(self._keys, key)
+        if position < len(self._keys) and self._keys[position] == key:
+            del self._keys[position]
+
+    def _sort_keys(self) -> None:
+        self._keys = sorted(
+            f"{word}{_SEP}{idn}" for idn, names in self._names.items() for word in set(self._words(names))
+        )
+
+    def _load(self) -> None:
+        """Charge l'index en mémoire (au premier appel) et le compacte si nécessaire."""
+        if self._keys is not None:
+            return
+        lines = 0
+        truncated = False
+        self._names = {}
+        with open(self.path, "r", encoding="utf-8") as f:
+            for line in f:
+                try:
+                    idn, last_name, first_name = json.loads(line)
+                except ValueError:
+                    # Ligne tronquée par un arrêt brutal : réécrite ci-dessous
+                    truncated = True
+                    continue
+                self._names[idn] = (last_name, first_name)
+                lines += 1
+        if truncated or lines > 2 * len(self._names):
+            self._write_snapshot()
+        self._sort_keys()
+
+    def _write_snapshot(self) -> None:
+        write_atomic(self.path, (
+            (json.dumps([idn, *names], ensure_ascii=False) + "\n").encode("utf-8")
+            for idn, names in self._names.items()
+        ))
+
+
+_indexes: Dict[str, PlayerNameIndex] = {}
+_indexes_lock = threading.Lock()
+
+
+def get_name_index(folder: str) -> PlayerNameIndex:
+    """
+    Retourne l'index des noms (partagé dans le processus) associé au dossier `folder`.
+    """
+    key = os.path.abspath(folder)
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = PlayerNameIndex(folder)
+            _indexes[key] = index
+        return index
+
+
+def search_player_names(
+    folder: str,
+    query: str,
+    load_players: Callable[[], Iterable[Dict[str, Any]]],
+    limit: int = PLAYER_SEARCH_LIMIT,
+) -> List[Dict[str, str]]:
+    """
+    Recherche des joueurs par nom (voir PlayerNameIndex.search). L'index est construit
+    avec `load_players` à la première recherche s'il n'existe pas encore.
+    """
+    index = get_name_index(folder)
+    if not index.exists():
+        os.makedirs(folder, exist_ok=True)
+        index.build(load_players())
+    return index.search(query, limit)
@@ -0,0 +1,274 @@
+import mmap
+import os
+import re
+import struct
+import threading
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from config import MAX_FIRST_NAME_LENGTH, MAX_LAST_NAME_LENGTH, PLAYERS_TABLE
+
+# En-tête de chaque fichier de la table : magic, taille d'un enregistrement
+_HEADER = struct.Struct("<8sI4x")
+_MAGIC = b"CHPTABLE"
+
+# Un fichier par préfixe de deux lettres de l'IDN, une alvéole par numéro à cinq chiffres
+SLOTS_PER_FILE = 100_000
+_IDN = re.compile(r"[A-Z]{2}\d{5}")
+
+# Enregistrement : octet d'occupation (1 si l'alvéole contient un joueur), champs absents,
+# longueur et octets UTF-8 du nom, puis du prénom, date JJ/MM/AAAA.
+# Un caractère UTF-8 occupe au plus 4 octets : tout nom valide tient dans son champ.
+_USED = 0
+_FLAGS = 1
+_LAST_NAME = 2
+_LAST_NAME_SIZE = 4 * MAX_LAST_NAME_LENGTH
+_FIRST_NAME = _LAST_NAME + 1 + _LAST_NAME_SIZE
+_FIRST_NAME_SIZE = 4 * MAX_FIRST_NAME_LENGTH
+_DATE = _FIRST_NAME + 1 + _FIRST_NAME_SIZE
+_DATE_SIZE = 10
+RECORD_SIZE = _DATE + _DATE_SIZE
+
+# Champs absents (None) du profil
+_NO_LAST_NAME = 0x01
+_NO_FIRST_NAME = 0x02
+_NO_DATE = 0x04
+
+
+def _locate(id_national: str) -> tuple[str, int]:
+    """Préfixe (fichier) et numéro d'alvéole d'un IDN (ex : 'AB12345' -> ('AB', 12345))."""
+    if not isinstance(id_national, str) or not _IDN.fullmatch(id_national):
+        raise ValueError(f"IDN invalide pour la table des joueurs : {id_national!r}")
+    return id_national[:2], int(id_national[2:])
+
+
+class PlayerRecord:
+    """
+    Vue sur l'enregistrement d'un joueur dans la table mappée en mémoire.
+
+    Aucun champ n'est copié à la création : les propriétés `*_bytes` retournent des
+    memoryview sur le fichier (sans copie), les propriétés texte ne décodent
+    le champ qu'au moment où on le lit.
+    """
+
+    __slots__ = ("_view", "_offset", "_prefix", "_slot")
+
+    def __init__(self, view: memoryview, prefix: str, slot: int) -> None:
+        self._view = view
+        self._prefix = prefix
+        self._move(slot)
+
+    def _move(self, slot: int) -> None:
+        self._slot = slot
+        self._offset = _HEADER.size + slot * RECORD_SIZE
+
+    def _flag(self, flag: int) -> bool:
+        return bool(self._view[self._offset + _FLAGS] & flag)
+
+    def _field(self, position: int) -> memoryview:
+        start = self._offset + position
+        return self._view[start + 1:start + 1 + self._view[start]]
+
+    @property
+    def id_national_chess(self) -> str:
+        return f"{self._prefix}{self._slot:05d}"
+
+    @property
+    def last_name_bytes(self) -> memoryview:
+        return self._field(_LAST_NAME)
+
+    @property
+    def first_name_bytes(self) -> memoryview:
+        return self._field(_FIRST_NAME)
+
+    @property
+    def date_of_birth_bytes(self) -> memoryview:
+        start = self._offset + _DATE
+        return self._view[start:start + _DATE_SIZE]
+
+    @property
+    def last_name(self) -> Optional[str]:
+        return None if self._flag(_NO_LAST_NAME) else str(self.last_name_bytes, "utf-8")
+
+    @property
+    def first_name(self) -> Optional[str]:
+        return None if self._flag(_NO_FIRST_NAME) else str(self.first_name_bytes, "utf-8")
+
+    @property
+    def date_of_birth(self) -> Optional[str]:
+        return None if self._flag(_NO_DATE) else str(self.date_of_birth_bytes, "ascii")
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Profil du joueur, au format des fichiers joueurs (sans les champs de tournoi)."""
+        return {
+            "id_national_chess": self.id_national_chess,
+            "first_name": self.first_name,
+            "last_name": self.last_name,
+            "date_of_birth": self.date_of_birth,
+        }
+
+
+class PlayerTable:
+    """
+    Table des profils joueurs à enregistrements de taille fixe, mappée en mémoire.
+
+    L'IDN donne directement l'emplacement de son enregistrement : les deux lettres
+    choisissent le fichier (`<dossier>/<PLAYERS_TABLE>/AB.tbl`), les cinq chiffres
+    l'alvéole. Les fichiers sont creux : seules les pages contenant des joueurs
+    occupent de la place sur le disque. Seuls l'identité et la date de naissance
+    sont stockées (les champs de tournoi n'ont pas de sens dans un profil).
+    """
+
+    def __init__(self, folder: str) -> None:
+        """
+        Args:
+            folder (str): Le dossier des joueurs, qui contient le dossier de la table.
+        """
+        self.directory = os.path.join(folder, PLAYERS_TABLE)
+        self._lock = threading.Lock()
+        self._maps: Dict[str, tuple] = {}
+
+    def exists(self) -> bool:
+        """Indique si la table a déjà été construite."""
+        return os.path.isdir(self.directory)
+
+    def _open(self, prefix: str, create: bool) -> Optional[memoryview]:
+        """memoryview sur le fichier du préfixe `prefix` (créé si `create`), ou None."""
+        with self._lock:
+            entry = self._maps.get(prefix)
+            if entry is not None:
+                return entry[2]
+            path = os.path.join(self.directory, f"{prefix}.tbl")
+            size = _HEADER.size + SLOTS_PER_FILE * RECORD_SIZE
+            if not os.path.exists(path):
+                if not create:
+                    return None
+                os.makedirs(self.directory, exist_ok=True)
+                with open(path, "wb") as f:
+                    f.write(_HEADER.pack(_MAGIC, RECORD_SIZE))
+                    f.truncate(size)
+            file = open(path, "r+b")
+            mapped = mmap.mmap(file.fileno(), 0)
+            magic, record_size = _HEADER.unpack_from(mapped)
+            if magic != _MAGIC or record_size != RECORD_SIZE or len(mapped) != size:
+                mapped.close()
+                file.close()
+                raise ValueError(f"Table des joueurs illisible ou d'un autre format : {path}")
+            view = memoryview(mapped)
+            self._maps[prefix] = (file, mapped, view)
+            return view
+
+    def get(self, id_national: str) -> Optional[PlayerRecord]:
+        """
+        Retourne l'enregistrement du joueur `id_national`, ou None s'il n'est pas dans la table.
+
+        Raises:
+            ValueError: si `id_national` n'a pas la forme d'un IDN.
+        """
+        prefix, slot = _locate(id_national)
+        view = self._open(prefix, create=False)
+        if view is None or not view[_HEADER.size + slot * RECORD_SIZE + _USED]:
+            return None
+        return PlayerRecord(view, prefix, slot)
+
+    def __contains__(self, id_national: str) -> bool:
+        return self.get(id_national) is not None
+
+    def put(self, player_data: Dict[str, Any]) -> None:
+        """
+        Écrit (ou remplace) le profil d'un joueur dans son alvéole.
+
+        Raises:
+            ValueError: si l'IDN n'a pas la bonne forme ou si un champ dépasse sa taille.
+        """
+        prefix, slot = _locate(player_data["id_national_chess"])
+        view = self._open(prefix, create=True)
+        offset = _HEADER.size + slot * RECORD_SIZE
+        record = bytearray(RECORD_SIZE)
+        flags = 0
+        for key, position, size, missing in (
+            ("last_name", _LAST_NAME, _LAST_NAME_SIZE, _NO_LAST_NAME),
+            ("first_name", _FIRST_NAME, _FIRST_NAME_SIZE, _NO_FIRST_NAME),
+        ):
+            value = player_data.get(key)
+            if value is None:
+                flags |= missing
+                continue
+            encoded = value.encode("utf-8")
+            if len(encoded) > size:
+                raise ValueError(f"{key} trop long pour la table des joueurs : {value!r}")
+            record[position] = len(encoded)
+            record[position + 1:position + 1 + len(encoded)] = encoded
+        date = player_data.get("date_of_birth")
+        if date is None:
+            flags |= _NO_DATE
+        else:
+            encoded = date.encode("ascii")
+            if len(encoded) != _DATE_SIZE:
+                raise ValueError(f"date_of_birth invalide pour la table des joueurs : {date!r}")
+            record[_DATE:_DATE + _DATE_SIZE] = encoded
+        record[_USED] = 1
+        record[_FLAGS] = flags
+        view[offset:offset + RECORD_SIZE] = record
+
+    def put_many(self, players_data: Iterable[Dict[str, Any]]) -> None:
+        """Écrit plusieurs profils (voir `put`)."""
+        for player_data in players_data:
+            self.put(player_data)
+
+    def scan(self) -> Iterator[PlayerRecord]:
+        """
+        Parcourt les joueurs de la table, par IDN croissant.
+
+        Les alvéoles occupées sont repérées par une recherche en C sur les seuls octets
+        d'occupation, et un même curseur PlayerRecord est déplacé d'un joueur à l'autre :
+        aucun objet n'est créé par joueur tant qu'aucun champ n'est lu. Le curseur ne doit
+        donc pas être conservé d'une itération à l'autre (utiliser `to_dict` au besoin).
+        """
+        if not self.exists():
+            return
+        prefixes = sorted(name[:2] for name in os.listdir(self.directory) if name.endswith(".tbl"))
+        for prefix in prefixes:
+            view = self._open(prefix, create=False)
+            # Octet d'occupation de chaque alvéole (vue à pas fixe, copiée une fois par fichier)
+            used = bytes(view[_HEADER.size + _USED::RECORD_SIZE])
+            cursor = None
+            slot = used.find(1)
+            while slot != -1:
+                if cursor is None:
+                    cursor = PlayerRecord(view, prefix, slot)
+                else:
+                    cursor._move(slot)
+                yield cursor
+                slot = used.find(1, slot + 1)
+
+    def flush(self) -> None:
+        """Force l'écriture sur disque des pages modifiées."""
+        with self._lock:
+            for _, mapped, _ in self._maps.values():
+                mapped.flush()
+
+    def close(self) -> None:
+        """Libère les projections en mémoire et ferme les fichiers."""
+        with self._lock:
+            for file, mapped, view in self._maps.values():
+                view.release()
+                mapped.close()
+                file.close()
+            self._maps.clear()
+
+
+_tables: Dict[str, PlayerTable] = {}
+_tables_lock = threading.Lock()
+
+
+def get_player_table(folder: str) -> PlayerTable:
+    """
+    Retourne la table des joueurs (partagée dans le processus) associée au dossier `folder`.
+    """
+    key = os.path.abspath(folder)
+    with _tables_lock:
+        table = _tables.get(key)
+        if table is None:
+            table = PlayerTable(folder)
+            _tables[key] = table
+        return table
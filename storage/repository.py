@@ -0,0 +1,96 @@
+import os
+from abc import ABC, abstractmethod
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+from config import STORAGE_BACKEND, SQLITE_DATABASE, PLAYERS_FOLDER, TOURNAMENTS_FOLDER
+
+
+class Repository(ABC):
+    """
+    Interface commune des backends de stockage alternatifs : chaque backend
+    implémente toutes les méthodes abstraites.
+
+    Les fonctions de `storage/player_data.py` et `storage/tournament_data.py`
+    restent le point d'entrée unique des contrôleurs et des vues : elles délèguent
+    au dépôt configuré par STORAGE_BACKEND, ou gèrent elles-mêmes les fichiers JSON.
+    """
+
+    # Joueurs
+
+    @abstractmethod
+    def save_player(self, player_data: Dict[str, Any]) -> None:
+        """Enregistre (ou remplace) un joueur sérialisé."""
+
+    @abstractmethod
+    def save_players(self, players_data: Iterable[Dict[str, Any]]) -> None:
+        """Enregistre plusieurs joueurs en une seule opération."""
+
+    @abstractmethod
+    def load_player(self, id_national: str) -> Optional[Dict[str, Any]]:
+        """Retourne le joueur `id_national`, ou None s'il n'est pas enregistré."""
+
+    @abstractmethod
+    def load_players(self) -> Iterator[Dict[str, Any]]:
+        """Produit tous les joueurs enregistrés."""
+
+    @abstractmethod
+    def player_exists(self, id_national: str) -> bool:
+        """Indique si le joueur `id_national` est enregistré."""
+
+    # Tournois
+
+    @abstractmethod
+    def save_tournament(self, tournament_data: Dict[str, Any], filename: str) -> None:
+        """Enregistre (ou remplace) un tournoi sérialisé sous `filename`."""
+
+    @abstractmethod
+    def load_tournament(self, filename: str) -> Optional[Dict[str, Any]]:
+        """Retourne le tournoi enregistré sous `filename` (format du document JSON), ou None."""
+
+    @abstractmethod
+    def list_tournaments(self) -> list[str]:
+        """Noms de fichiers des tournois enregistrés, triés."""
+
+    @abstractmethod
+    def list_tournament_summaries(self) -> list[Dict[str, Any]]:
+        """Résumés des tournois enregistrés (voir storage/tournament_catalog.py), triés."""
+
+    @abstractmethod
+    def tournament_exists(self, filename: str) -> bool:
+        """Indique si un tournoi est enregistré sous `filename`."""
+
+    # Schéma
+
+    @abstractmethod
+    def migrate_schema(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Met à la version courante du schéma les documents enregistrés sous une version
+        antérieure (bilan au format de storage/schema_migration.py).
+        """
+
+
+_repository: Optional[Repository] = None
+
+
+def get_repository() -> Optional[Repository]:
+    """
+    Retourne le dépôt correspondant à STORAGE_BACKEND (instancié une seule fois),
+    ou None pour le backend "json" géré directement par les fonctions de stockage.
+    À la création de la base SQLite, les fichiers JSON existants y sont importés.
+
+    Raises:
+        ValueError: si STORAGE_BACKEND ne correspond à aucun backend connu.
+    """
+    global _repository
+    if STORAGE_BACKEND == "json":
+        return None
+    if _repository is None:
+        if STORAGE_BACKEND == "sqlite":
+            from storage.sqlite_repository import SqliteRepository
+            is_new = not os.path.exists(SQLITE_DATABASE)
+            _repository = SqliteRepository(SQLITE_DATABASE)
+            if is_new:
+                _repository.import_json_folders(PLAYERS_FOLDER, TOURNAMENTS_FOLDER)
+        else:
+            raise ValueError(f"Backend de stockage inconnu : {STORAGE_BACKEND!r}")
+    return _repository
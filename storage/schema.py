@@ -0,0 +1,137 @@
+from typing import Any, Callable, Dict
+
+from config import PLAYER_SCHEMA_VERSION, TOURNAMENT_SCHEMA_VERSION
+
+# Clé de la version du schéma dans chaque document (joueur ou tournoi).
+# Un document sans cette clé est en version 0 (antérieur au versionnement).
+SCHEMA_VERSION_KEY = "schema_version"
+
+# Version courante de chaque type de document
+CURRENT_VERSIONS = {
+    "player": PLAYER_SCHEMA_VERSION,
+    "tournament": TOURNAMENT_SCHEMA_VERSION,
+}
+
+# Étapes de migration : pour chaque type de document, la fonction qui fait passer
+# un document de la version N à la version N + 1 (enregistrée avec @migration).
+_MIGRATIONS: Dict[str, Dict[int, Callable[[Dict[str, Any]], None]]] = {kind: {} for kind in CURRENT_VERSIONS}
+
+
+def migration(kind: str, from_version: int) -> Callable:
+    """
+    Enregistre une étape de migration : la fonction décorée modifie sur place un
+    document `kind` de la version `from_version` pour lui donner la forme de la version suivante.
+
+    Args:
+        kind (str): "player" ou "tournament".
+        from_version (int): Version du document avant l'étape.
+    """
+    def register(step: Callable[[Dict[str, Any]], None]) -> Callable[[Dict[str, Any]], None]:
+        if from_version in _MIGRATIONS[kind]:
+            raise ValueError(f"Migration {kind} {from_version} déjà enregistrée.")
+        _MIGRATIONS[kind][from_version] = step
+        return step
+    return register
+
+
+def schema_version(data: Dict[str, Any]) -> int:
+    """Version du schéma d'un document (0 s'il n'en porte pas)."""
+    return data.get(SCHEMA_VERSION_KEY, 0)
+
+
+def is_current(kind: str, data: Dict[str, Any]) -> bool:
+    """Indique si un document `kind` a déjà la forme de la version courante."""
+    return schema_version(data) == CURRENT_VERSIONS[kind]
+
+
+def upgrade(kind: str, data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Met un document à la version courante en appliquant dans l'ordre les étapes
+    de migration manquantes (sans effet si le document est déjà à jour).
+
+    Args:
+        kind (str): "player" ou "tournament".
+        data (dict): Le document, modifié sur place.
+
+    Returns:
+        dict: Le document à jour (le même objet).
+
+    Raises:
+        ValueError: si le document vient d'une version plus récente du programme
+            ou s'il manque une étape de migration.
+    """
+    current = CURRENT_VERSIONS[kind]
+    version = schema_version(data)
+    if version == current:
+        return data
+    if version > current:
+        raise ValueError(f"Document {kind} en version {version}, version gérée : {current}.")
+    while version < current:
+        step = _MIGRATIONS[kind].get(version)
+        if step is None:
+            raise ValueError(f"Aucune migration {kind} depuis la version {version}.")
+        step(data)
+        version += 1
+        data[SCHEMA_VERSION_KEY] = version
+    return data
+
+
+def upgrade_player(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Met un profil joueur à la version courante (voir `upgrade`)."""
+    return upgrade("player", data)
+
+
+def upgrade_tournament(data: Dict[str, Any]) -> Dict[str, Any]:
+    """Met un tournoi à la version courante (voir `upgrade`)."""
+    return upgrade("tournament", data)
+
+
+# ---------------------------------------------------------------------- #
+# Étapes de migration
+# ---------------------------------------------------------------------- #
+
+def _set_tournament_fields(player: Dict[str, Any]) -> None:
+    player.setdefault("tournament_score", 0.0)
+    player.setdefault("rank", 0)
+    player.setdefault("played_with", [])
+
+
+@migration("player", 0)
+def _player_v0_to_v1(data: Dict[str, Any]) -> None:
+    """Version 1 : tous les champs de Player.get_serialized_player() sont présents."""
+    for field in ("first_name", "last_name", "date_of_birth"):
+        data.setdefault(field, None)
+    _set_tournament_fields(data)
+
+
+@migration("tournament", 0)
+def _tournament_v0_to_v1(data: Dict[str, Any]) -> None:
+    """
+    Version 1 : tous les champs de Tournament.get_serialized_tournament() sont présents,
+    ainsi que les champs de chaque joueur inscrit, round et participant à un match.
+    """
+    for field in ("location", "start_date", "end_date", "number_of_rounds", "description"):
+        data.setdefault(field, None)
+    data.setdefault("actual_round", 0)
+    for player in data.setdefault("list_of_players", []):
+        _set_tournament_fields(player)
+    for rnd in data.setdefault("list_of_rounds", []):
+        rnd.setdefault("start_time", None)
+        rnd.setdefault("end_time", None)
+        for match in rnd.setdefault("matches", []):
+            match.setdefault("player_2", None)
+            match.setdefault("winner", None)
+            for key in ("player_1", "player_2"):
+                if match[key] is not None:
+                    match[key].setdefault("match_score", None)
+                    match[key].setdefault("color", None)
+                    _set_tournament_fields(match[key])
+
+
+@migration("tournament", 1)
+def _tournament_v1_to_v2(data: Dict[str, Any]) -> None:
+    """
+    Version 2 : les snapshots des matchs sont enregistrés sans leurs champs cumulés
+    (tournament_score, played_with), reconstruits à la lecture (voir storage/tournament_snapshots.py).
+    Un document relu a déjà sa forme complète : rien à modifier.
+    """
@@ -0,0 +1,168 @@
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from typing import Any, Callable, Deque, Dict, Iterator, List, Tuple
+
+from config import PLAYERS_LAYOUT, SCHEMA_MIGRATION_WORKERS, TOURNAMENT_GENERATIONS
+from storage.player_data import scan_player_files
+from storage.repository import get_repository
+from storage.schema import is_current, upgrade_player, upgrade_tournament
+from storage.tournament_codec import decode_tournament, encode_tournament_binary, is_binary_tournament, seal
+from storage.tournament_data import stored_tournament_files
+from storage.tournament_document import encode_tournament, write_index
+from storage.tournament_snapshots import normalize_snapshots
+from storage.tournament_split import read_split, rewrite_split, split_path
+from storage.write_behind import drain_writes, write_atomic
+
+# Résultat de la migration d'un fichier : (chemin, "upgraded" | "current" | "error", message d'erreur)
+MigrationResult = Tuple[str, str, str]
+
+
+def _dumps(value: Any) -> bytes:
+    return json.dumps(value, ensure_ascii=False, indent=4).encode("utf-8")
+
+
+def migrate_player_file(path: str) -> MigrationResult:
+    """
+    Met à la version courante le fichier JSON d'un joueur (exécuté dans un processus
+    du pool). Le fichier est réécrit de façon atomique, seulement s'il n'est pas à jour.
+    """
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        if not isinstance(data, dict):
+            return path, "error", "n'est pas un objet JSON"
+        if is_current("player", data):
+            return path, "current", ""
+        write_atomic(path, _dumps(upgrade_player(data)))
+        return path, "upgraded", ""
+    except (OSError, ValueError) as e:
+        return path, "error", str(e)
+
+
+def migrate_tournament_file(path: str) -> MigrationResult:
+    """
+    Met à la version courante un tournoi (exécuté dans un processus du pool) : fichier
+    JSON (index des offsets réécrit) ou binaire (format conservé), ou dossier "split".
+    Le journal du tournoi n'est pas modifié : il est rejoué sur le document migré.
+    """
+    try:
+        if os.path.isdir(path):
+            return _migrate_split_tournament(path)
+        with open(path, "rb") as f:
+            content = f.read()
+        data = decode_tournament(content)
+        if is_current("tournament", data):
+            return path, "current", ""
+        data = normalize_snapshots(upgrade_tournament(data))
+        if is_binary_tournament(content):
+            write_atomic(path, seal(encode_tournament_binary(data)), TOURNAMENT_GENERATIONS)
+        else:
+            payload, index = encode_tournament(data)
+            write_atomic(path, seal(payload), TOURNAMENT_GENERATIONS)
+            write_index(path, index)
+        return path, "upgraded", ""
+    except (OSError, ValueError, KeyError, TypeError) as e:
+        return path, "error", str(e)
+
+
+def _migrate_split_tournament(directory: str) -> MigrationResult:
+    """Migre un tournoi en disposition "split" (en-tête réécrit en dernier, voir `rewrite_split`)."""
+    data = read_split(directory)
+    if is_current("tournament", data):
+        return directory, "current", ""
+    rewrite_split(normalize_snapshots(upgrade_tournament(data)), directory)
+    return directory, "upgraded", ""
+
+
+def _run_batch(func: Callable[[str], MigrationResult], paths: List[str]) -> List[MigrationResult]:
+    return [func(path) for path in paths]
+
+
+def _run_in_pool(
+    func: Callable[[str], MigrationResult],
+    paths: List[str],
+    workers: int,
+    batch_size: int = 256,
+) -> Iterator[MigrationResult]:
+    """
+    Applique `func` à chaque fichier dans un pool de `workers` processus : les fichiers
+    sont confiés par lots et seule une fenêtre de lots est en cours à la fois
+    (la mémoire utilisée ne dépend pas du nombre de fichiers).
+    """
+    if workers <= 1:
+        yield from map(func, paths)
+        return
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        window: Deque[Future] = deque()
+        for start in range(0, len(paths), batch_size):
+            window.append(pool.submit(_run_batch, func, paths[start:start + batch_size]))
+            if len(window) >= workers * 2:
+                yield from window.popleft().result()
+        while window:
+            yield from window.popleft().result()
+
+
+def _player_paths(folder: str) -> List[str]:
+    """Fichiers joueurs des dispositions "flat" et "sharded" (le registre est migré à la lecture)."""
+    if PLAYERS_LAYOUT == "registry" or not os.path.isdir(folder):
+        return []
+    found = scan_player_files(folder)
+    return sorted(entry.path for layout in found.values() for entry in layout.values())
+
+
+def _tournament_paths(folder: str) -> List[str]:
+    """Fichiers (ou dossiers "split") des tournois hors archive."""
+    paths = []
+    for filename in stored_tournament_files(folder):
+        filepath = os.path.join(folder, filename)
+        paths.append(filepath if os.path.isfile(filepath) else split_path(folder, filename))
+        if os.path.isfile(filepath) and os.path.isdir(split_path(folder, filename)):
+            # Conversion de disposition interrompue : les deux enregistrements sont migrés
+            paths.append(split_path(folder, filename))
+    return paths
+
+
+def migrate_schema(
+    players_folder: str,
+    tournaments_folder: str,
+    workers: int = SCHEMA_MIGRATION_WORKERS,
+) -> Dict[str, Dict[str, Any]]:
+    """
+    Met à la version courante du schéma tous les documents du dossier de données
+    (backend "json"), en parallèle dans un pool de processus, ou ceux du dépôt
+    configuré pour un autre backend (voir `Repository.migrate_schema`).
+
+    Chaque fichier est lu, migré puis réécrit de façon atomique (fichier temporaire,
+    fsync, os.replace) : une interruption ne laisse aucun fichier à moitié écrit, et
+    une nouvelle exécution reprend là où la précédente s'est arrêtée, les fichiers
+    déjà à jour étant simplement relus. Le registre des joueurs et les tournois archivés
+    ne sont pas réécrits : leurs documents sont migrés à la lecture.
+
+    Args:
+        players_folder (str): Le dossier des joueurs.
+        tournaments_folder (str): Le dossier des tournois.
+        workers (int): Nombre de processus.
+
+    Returns:
+        dict: Pour "players" et "tournaments" : "upgraded", "current" (nombre de documents)
+            et "errors" (couples nom de fichier ou identifiant, message).
+    """
+    repository = get_repository()
+    if repository is not None:
+        return repository.migrate_schema()
+    report: Dict[str, Dict[str, Any]] = {}
+    drain_writes()
+    for kind, func, paths in (
+        ("players", migrate_player_file, _player_paths(players_folder)),
+        ("tournaments", migrate_tournament_file, _tournament_paths(tournaments_folder)),
+    ):
+        counts: Dict[str, Any] = {"upgraded": 0, "current": 0, "errors": []}
+        for path, status, error in _run_in_pool(func, paths, workers):
+            if status == "error":
+                counts["errors"].append((os.path.basename(path), error))
+            else:
+                counts[status] += 1
+        report[kind] = counts
+    return report
@@ -0,0 +1,533 @@
+import copy
+import json
+import os
+import sqlite3
+import threading
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional
+
+from config import SQLITE_DATABASE
+from storage.player_data import iter_stored_player_data
+from storage.repository import Repository
+from storage.schema import CURRENT_VERSIONS, SCHEMA_VERSION_KEY, is_current, upgrade
+from storage.tournament_data import iter_stored_tournaments
+
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS players (
+    id_national_chess TEXT PRIMARY KEY,
+    first_name        TEXT,
+    last_name         TEXT,
+    date_of_birth     TEXT,
+    tournament_score  REAL NOT NULL DEFAULT 0,
+    rank              INTEGER NOT NULL DEFAULT 0,
+    played_with       TEXT NOT NULL DEFAULT '[]',
+    schema_version    INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS tournaments (
+    id               INTEGER PRIMARY KEY,
+    filename         TEXT NOT NULL UNIQUE,
+    tournament_name  TEXT NOT NULL,
+    location         TEXT,
+    start_date       TEXT,
+    end_date         TEXT,
+    actual_round     INTEGER NOT NULL DEFAULT 0,
+    number_of_rounds INTEGER,
+    description      TEXT,
+    schema_version   INTEGER NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_tournaments_name ON tournaments (tournament_name);
+CREATE TABLE IF NOT EXISTS tournament_players (
+    tournament_id     INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    position          INTEGER NOT NULL,
+    id_national_chess TEXT NOT NULL,
+    tournament_score  REAL NOT NULL,
+    rank              INTEGER NOT NULL,
+    played_with       TEXT NOT NULL,
+    PRIMARY KEY (tournament_id, position)
+);
+CREATE INDEX IF NOT EXISTS idx_tournament_players_idn ON tournament_players (id_national_chess);
+CREATE TABLE IF NOT EXISTS rounds (
+    tournament_id INTEGER NOT NULL REFERENCES tournaments (id) ON DELETE CASCADE,
+    round_index   INTEGER NOT NULL,
+    round_number  TEXT NOT NULL,
+    start_time    TEXT,
+    end_time      TEXT,
+    PRIMARY KEY (tournament_id, round_index)
+);
+CREATE TABLE IF NOT EXISTS matches (
+    tournament_id INTEGER NOT NULL,
+    round_index   INTEGER NOT NULL,
+    match_index   INTEGER NOT NULL,
+    name          TEXT NOT NULL,
+    winner        TEXT,
+    PRIMARY KEY (tournament_id, round_index, match_index),
+    FOREIGN KEY (tournament_id, round_index) REFERENCES rounds (tournament_id, round_index) ON DELETE CASCADE
+);
+CREATE TABLE IF NOT EXISTS match_players (
+    tournament_id     INTEGER NOT NULL,
+    round_index       INTEGER NOT NULL,
+    match_index       INTEGER NOT NULL,
+    side              INTEGER NOT NULL,
+    id_national_chess TEXT NOT NULL,
+    match_score       REAL,
+    tournament_score  REAL,
+    rank              INTEGER,
+    color             TEXT,
+    played_with       TEXT NOT NULL,
+    PRIMARY KEY (tournament_id, round_index, match_index, side),
+    FOREIGN KEY (tournament_id, round_index, match_index)
+        REFERENCES matches (tournament_id, round_index, match_index) ON DELETE CASCADE
+);
+CREATE INDEX IF NOT EXISTS idx_match_players_idn ON match_players (id_national_chess);
+"""
+
+# Version de la structure de la base (PRAGMA user_version). Pour chaque version N,
+# les instructions qui font passer une base existante de la version N à la version N + 1.
+_DATABASE_VERSION = 1
+_DATABASE_MIGRATIONS: Dict[int, List[str]] = {
+    # Version 1 : chaque joueur et chaque tournoi porte la version du schéma de son document.
+    # Les lignes écrites avant le versionnement sont en version 0 (migrées à la lecture).
+    0: [
+        "ALTER TABLE players ADD COLUMN schema_version INTEGER NOT NULL DEFAULT 0",
+        "ALTER TABLE tournaments ADD COLUMN schema_version INTEGER NOT NULL DEFAULT 0",
+    ],
+}
+
+# Requêtes paramétrées (préparées une fois puis réutilisées par le cache de la connexion).
+_UPSERT_PLAYER = """
+INSERT INTO players (id_national_chess, first_name, last_name, date_of_birth,
+                     tournament_score, rank, played_with, schema_version)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (id_national_chess) DO UPDATE SET
+    first_name = excluded.first_name, last_name = excluded.last_name,
+    date_of_birth = excluded.date_of_birth, tournament_score = excluded.tournament_score,
+    rank = excluded.rank, played_with = excluded.played_with,
+    schema_version = excluded.schema_version
+"""
+_SELECT_PLAYER = "SELECT * FROM players WHERE id_national_chess = ?"
+_SELECT_PLAYERS = "SELECT * FROM players ORDER BY id_national_chess"
+_UPSERT_TOURNAMENT = """
+INSERT INTO tournaments (filename, tournament_name, location, start_date, end_date,
+                         actual_round, number_of_rounds, description, schema_version)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (filename) DO UPDATE SET
+    tournament_name = excluded.tournament_name, location = excluded.location,
+    start_date = excluded.start_date, end_date = excluded.end_date,
+    actual_round = excluded.actual_round, number_of_rounds = excluded.number_of_rounds,
+    description = excluded.description, schema_version = excluded.schema_version
+"""
+_UPSERT_TOURNAMENT_PLAYER = """
+INSERT INTO tournament_players (tournament_id, position, id_national_chess,
+                                tournament_score, rank, played_with)
+VALUES (?, ?, ?, ?, ?, ?)
+ON CONFLICT (tournament_id, position) DO UPDATE SET
+    id_national_chess = excluded.id_national_chess, tournament_score = excluded.tournament_score,
+    rank = excluded.rank, played_with = excluded.played_with
+"""
+_UPSERT_ROUND = """
+INSERT INTO rounds (tournament_id, round_index, round_number, start_time, end_time)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (tournament_id, round_index) DO UPDATE SET
+    round_number = excluded.round_number, start_time = excluded.start_time,
+    end_time = excluded.end_time
+"""
+_UPSERT_MATCH = """
+INSERT INTO matches (tournament_id, round_index, match_index, name, winner)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT (tournament_id, round_index, match_index) DO UPDATE SET
+    name = excluded.name, winner = excluded.winner
+"""
+_UPSERT_MATCH_PLAYER = """
+INSERT INTO match_players (tournament_id, round_index, match_index, side, id_national_chess,
+                           match_score, tournament_score, rank, color, played_with)
+VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+ON CONFLICT (tournament_id, round_index, match_index, side) DO UPDATE SET
+    id_national_chess = excluded.id_national_chess, match_score = excluded.match_score,
+    tournament_score = excluded.tournament_score, rank = excluded.rank,
+    color = excluded.color, played_with = excluded.played_with
+"""
+_DELETE_ROWS = {
+    "tournament_players": "DELETE FROM tournament_players WHERE tournament_id = ? AND position = ?",
+    "rounds": "DELETE FROM rounds WHERE tournament_id = ? AND round_index = ?",
+    "matches": "DELETE FROM matches WHERE tournament_id = ? AND round_index = ? AND match_index = ?",
+    "match_players": (
+        "DELETE FROM match_players "
+        "WHERE tournament_id = ? AND round_index = ? AND match_index = ? AND side = ?"
+    ),
+}
+_UPSERT_ROWS = {
+    "tournament_players": _UPSERT_TOURNAMENT_PLAYER,
+    "rounds": _UPSERT_ROUND,
+    "matches": _UPSERT_MATCH,
+    "match_players": _UPSERT_MATCH_PLAYER,
+}
+# Nombre de joueurs écrits par transaction lors de l'import des données du backend "json".
+_IMPORT_BATCH_SIZE = 1000
+# Nombre de colonnes formant la clé primaire (après tournament_id) de chaque table enfant.
+_KEY_WIDTH = {"tournament_players": 1, "rounds": 1, "matches": 2, "match_players": 3}
+
+
+class SqliteRepository(Repository):
+    """
+    Backend SQLite (module standard `sqlite3`, mode WAL).
+
+    Les tournois sont normalisés en tables (tournois, joueurs inscrits, rounds, matchs,
+    participants de match). Chaque sauvegarde compare les lignes à la dernière version
+    persistée et n'écrit que celles qui ont changé, dans une seule transaction :
+    enregistrer le résultat d'un match ne touche que quelques lignes.
+
+    Les documents sont enregistrés à la version courante du schéma (voir storage/schema.py),
+    dont le numéro est conservé avec chaque joueur et chaque tournoi : un document
+    écrit par une version antérieure est relu avec son numéro, puis migré à la lecture
+    ou par `migrate_schema`.
+    """
+
+    def __init__(self, database: str = SQLITE_DATABASE) -> None:
+        """
+        Ouvre (ou crée) la base et applique le schéma, en mettant à jour la structure
+        d'une base créée par une version antérieure (voir `_migrate_database`).
+
+        Args:
+            database (str): Chemin du fichier SQLite.
+        """
+        folder = os.path.dirname(database)
+        if folder:
+            os.makedirs(folder, exist_ok=True)
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(database, check_same_thread=False, cached_statements=64)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute("PRAGMA journal_mode = WAL")
+        self._conn.execute("PRAGMA synchronous = NORMAL")
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._migrate_database()
+        # Dernières lignes persistées, par tournoi : {filename: {table: {clé: ligne}}}
+        self._saved_rows: Dict[str, Dict[str, Dict[tuple, tuple]]] = {}
+
+    def _migrate_database(self) -> None:
+        """
+        Crée les tables d'une nouvelle base, ou applique à une base existante les étapes
+        de `_DATABASE_MIGRATIONS` depuis sa version (PRAGMA user_version), dans une transaction.
+        """
+        version = self._conn.execute("PRAGMA user_version").fetchone()[0]
+        is_new = self._conn.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'players'"
+        ).fetchone() is None
+        if version > _DATABASE_VERSION:
+            raise ValueError(f"Base SQLite en version {version}, version gérée : {_DATABASE_VERSION}.")
+        with self._conn:
+            if not is_new:
+                for step in range(version, _DATABASE_VERSION):
+                    for statement in _DATABASE_MIGRATIONS[step]:
+                        self._conn.execute(statement)
+            self._conn.execute(f"PRAGMA user_version = {_DATABASE_VERSION}")
+        self._conn.executescript(_SCHEMA)
+
+    @staticmethod
+    def _current(kind: str, data: Dict[str, Any]) -> Dict[str, Any]:
+        """Le document à la version courante du schéma (copie migrée s'il est plus ancien)."""
+        return data if is_current(kind, data) else upgrade(kind, copy.deepcopy(data))
+
+    # ------------------------------------------------------------------ #
+    # Joueurs
+    # ------------------------------------------------------------------ #
+
+    @classmethod
+    def _player_row(cls, player_data: Dict[str, Any]) -> tuple:
+        p = cls._current("player", player_data)
+        return (
+            p["id_national_chess"],
+            p["first_name"],
+            p["last_name"],
+            p["date_of_birth"],
+            p["tournament_score"],
+            p["rank"],
+            json.dumps(p["played_with"], ensure_ascii=False),
+            p[SCHEMA_VERSION_KEY],
+        )
+
+    @staticmethod
+    def _player_dict(row: sqlite3.Row) -> Dict[str, Any]:
+        return {
+            SCHEMA_VERSION_KEY: row["schema_version"],
+            "id_national_chess": row["id_national_chess"],
+            "first_name": row["first_name"],
+            "last_name": row["last_name"],
+            "date_of_birth": row["date_of_birth"],
+            "tournament_score": row["tournament_score"],
+            "rank": row["rank"],
+            "played_with": json.loads(row["played_with"]),
+        }
+
+    def save_player(self, player_data: Dict[str, Any]) -> None:
+        self.save_players([player_data])
+
+    def save_players(self, players_data: Iterable[Dict[str, Any]]) -> None:
+        """Upsert groupé (executemany) de plusieurs joueurs dans une transaction."""
+        with self._lock, self._conn:
+            self._conn.executemany(_UPSERT_PLAYER, (self._player_row(p) for p in players_data))
+
+    def load_player(self, id_national: str) -> Optional[Dict[str, Any]]:
+        with self._lock:
+            row = self._conn.execute(_SELECT_PLAYER, (id_national,)).fetchone()
+        return self._player_dict(row) if row else None
+
+    def load_players(self) -> Iterator[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(_SELECT_PLAYERS).fetchall()
+        return (self._player_dict(row) for row in rows)
+
+    def player_exists(self, id_national: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM players WHERE id_national_chess = ?", (id_national,)
+            ).fetchone()
+        return row is not None
+
+    # ------------------------------------------------------------------ #
+    # Tournois
+    # ------------------------------------------------------------------ #
+
+    @staticmethod
+    def _child_rows(tournament_data: Dict[str, Any]) -> Dict[str, Dict[tuple, tuple]]:
+        """
+        Décompose un tournoi sérialisé, à la version courante du schéma, en lignes des
+        tables enfants, indexées par clé primaire (sans tournament_id, ajouté au moment de l'écriture).
+        """
+        rows: Dict[str, Dict[tuple, tuple]] = {table: {} for table in _UPSERT_ROWS}
+        for position, p in enumerate(tournament_data["list_of_players"]):
+            rows["tournament_players"][(position,)] = (
+                p["id_national_chess"], p["tournament_score"], p["rank"],
+                json.dumps(p["played_with"], ensure_ascii=False),
+            )
+        for r_idx, rnd in enumerate(tournament_data["list_of_rounds"]):
+            rows["rounds"][(r_idx,)] = (rnd["round_number"], rnd["start_time"], rnd["end_time"])
+            for m_idx, match in enumerate(rnd["matches"]):
+                winner = match["winner"]
+                if isinstance(winner, dict):
+                    winner = winner["id_national_chess"]
+                rows["matches"][(r_idx, m_idx)] = (match["name"], winner)
+                for side, key in ((1, "player_1"), (2, "player_2")):
+                    snap = match[key]
+                    if snap is None:
+                        continue
+                    rows["match_players"][(r_idx, m_idx, side)] = (
+                        snap["id_national_chess"], snap["match_score"], snap["tournament_score"],
+                        snap["rank"], snap["color"], json.dumps(snap["played_with"], ensure_ascii=False),
+                    )
+        return rows
+
+    def _read_child_rows(self, tournament_id: int) -> Dict[str, Dict[tuple, tuple]]:
+        """Relit depuis la base les lignes enfants d'un tournoi, au format de `_child_rows`."""
+        rows: Dict[str, Dict[tuple, tuple]] = {}
+        for table, width in _KEY_WIDTH.items():
+            cursor = self._conn.execute(
+                f"SELECT * FROM {table} WHERE tournament_id = ?", (tournament_id,)
+            )
+            rows[table] = {
+                tuple(row[1:1 + width]): tuple(row[1 + width:]) for row in cursor
+            }
+        return rows
+
+    def _tournament_id(self, filename: str) -> Optional[int]:
+        row = self._conn.execute("SELECT id FROM tournaments WHERE filename = ?", (filename,)).fetchone()
+        return row["id"] if row else None
+
+    def save_tournament(self, tournament_data: Dict[str, Any], filename: str) -> None:
+        """
+        Persiste un tournoi en n'écrivant que les lignes ajoutées, modifiées ou supprimées
+        depuis la dernière sauvegarde, dans une seule transaction. Un tournoi d'une
+        version antérieure du schéma est d'abord mis à la version courante.
+        """
+        tournament_data = self._current("tournament", tournament_data)
+        new_rows = self._child_rows(tournament_data)
+        with self._lock, self._conn:
+            self._conn.execute(_UPSERT_TOURNAMENT, (
+                filename,
+                tournament_data["tournament_name"],
+                tournament_data["location"],
+                tournament_data["start_date"],
+                tournament_data["end_date"],
+                tournament_data["actual_round"],
+                tournament_data["number_of_rounds"],
+                tournament_data["description"],
+                tournament_data[SCHEMA_VERSION_KEY],
+            ))
+            tournament_id = self._tournament_id(filename)
+            old_rows = self._saved_rows.get(filename)
+            if old_rows is None:
+                old_rows = self._read_child_rows(tournament_id)
+
+            # Suppressions d'abord (enfants avant parents), puis upserts (parents avant enfants).
+            for table in reversed(list(_UPSERT_ROWS)):
+                removed = [key for key in old_rows[table] if key not in new_rows[table]]
+                if removed:
+                    self._conn.executemany(
+                        _DELETE_ROWS[table], ((tournament_id, *key) for key in removed)
+                    )
+            for table, statement in _UPSERT_ROWS.items():
+                changed = [
+                    (tournament_id, *key, *row) for key, row in new_rows[table].items()
+                    if old_rows[table].get(key) != row
+                ]
+                if changed:
+                    self._conn.executemany(statement, changed)
+        self._saved_rows[filename] = new_rows
+
+    def load_tournament(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Reconstruit le dict du tournoi, au même format que le document JSON, avec la
+        version du schéma sous laquelle il a été enregistré.
+        """
+        with self._lock:
+            header = self._conn.execute(
+                "SELECT * FROM tournaments WHERE filename = ?", (filename,)
+            ).fetchone()
+            if header is None:
+                return None
+            rows = self._read_child_rows(header["id"])
+        self._saved_rows[filename] = rows
+
+        def snapshot(values: tuple) -> Dict[str, Any]:
+            idn, match_score, tournament_score, rank, color, played_with = values
+            return {
+                "id_national_chess": idn,
+                "match_score": match_score,
+                "tournament_score": tournament_score,
+                "rank": rank,
+                "color": color,
+                "played_with": json.loads(played_with),
+            }
+
+        rounds = []
+        for (r_idx,), (round_number, start_time, end_time) in sorted(rows["rounds"].items()):
+            matches = []
+            match_keys = sorted(key for key in rows["matches"] if key[0] == r_idx)
+            for key in match_keys:
+                name, winner = rows["matches"][key]
+                snap1 = rows["match_players"].get((*key, 1))
+                snap2 = rows["match_players"].get((*key, 2))
+                if winner is not None and winner != "draw":
+                    winner = {"id_national_chess": winner}
+                matches.append({
+                    "name": name,
+                    "player_1": snapshot(snap1) if snap1 else None,
+                    "player_2": snapshot(snap2) if snap2 else None,
+                    "winner": winner,
+                })
+            rounds.append({
+                "round_number": round_number,
+                "start_time": start_time,
+                "end_time": end_time,
+                "matches": matches,
+            })
+
+        return {
+            SCHEMA_VERSION_KEY: header["schema_version"],
+            "tournament_name": header["tournament_name"],
+            "location": header["location"],
+            "start_date": header["start_date"],
+            "end_date": header["end_date"],
+            "actual_round": header["actual_round"],
+            "number_of_rounds": header["number_of_rounds"],
+            "description": header["description"],
+            "list_of_players": [
+                {
+                    "id_national_chess": idn,
+                    "tournament_score": score,
+                    "rank": rank,
+                    "played_with": json.loads(played_with),
+                }
+                for _, (idn, score, rank, played_with) in sorted(rows["tournament_players"].items())
+            ],
+            "list_of_rounds": rounds,
+        }
+
+    def import_json_folders(self, players_folder: str, tournaments_folder: str) -> tuple[int, int]:
+        """
+        Importe en masse les données du backend "json" (joueurs puis tournois), lues
+        comme ce backend les lit : joueurs des dispositions "flat", "sharded" et du
+        registre, tournois en fichier, en dossier "split" ou archivés, journal rejoué.
+
+        Args:
+            players_folder (str): Dossier des joueurs.
+            tournaments_folder (str): Dossier des tournois.
+
+        Returns:
+            tuple[int, int]: Nombre de joueurs et de tournois importés.
+        """
+        players = set()
+        batch = []
+        for player_data in iter_stored_player_data(players_folder):
+            players.add(player_data["id_national_chess"])
+            batch.append(player_data)
+            if len(batch) >= _IMPORT_BATCH_SIZE:
+                self.save_players(batch)
+                batch = []
+        if batch:
+            self.save_players(batch)
+        tournaments = 0
+        for filename, data in iter_stored_tournaments(tournaments_folder):
+            self.save_tournament(data, filename)
+            tournaments += 1
+        return len(players), tournaments
+
+    def migrate_schema(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Met à la version courante du schéma les joueurs et les tournois enregistrés sous
+        une version antérieure : chaque document est relu, migré puis réécrit dans sa
+        propre transaction, si bien qu'une migration interrompue reprend à la relance.
+
+        Returns:
+            dict: Pour "players" et "tournaments" : "upgraded", "current" (nombre de documents)
+                et "errors" (couples identifiant, message).
+        """
+        return {
+            "players": self._migrate_documents(
+                "player", "players", "id_national_chess",
+                lambda idn: self.save_player(upgrade("player", self.load_player(idn))),
+            ),
+            "tournaments": self._migrate_documents(
+                "tournament", "tournaments", "filename",
+                lambda filename: self.save_tournament(upgrade("tournament", self.load_tournament(filename)), filename),
+            ),
+        }
+
+    def _migrate_documents(self, kind: str, table: str, key: str, migrate: Callable[[str], None]) -> Dict[str, Any]:
+        """
+        Applique `migrate` (relecture, migration, réécriture) à chaque ligne de `table`
+        enregistrée sous une version antérieure du schéma, identifiée par la colonne `key`.
+        """
+        with self._lock:
+            total = self._conn.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+            stale = [row[0] for row in self._conn.execute(
+                f"SELECT {key} FROM {table} WHERE schema_version != ? ORDER BY {key}",
+                (CURRENT_VERSIONS[kind],),
+            )]
+        counts: Dict[str, Any] = {"upgraded": 0, "current": total - len(stale), "errors": []}
+        for name in stale:
+            try:
+                migrate(name)
+            except ValueError as e:
+                counts["errors"].append((name, str(e)))
+                continue
+            counts["upgraded"] += 1
+        return counts
+
+    def list_tournaments(self) -> list[str]:
+        with self._lock:
+            rows = self._conn.execute("SELECT filename FROM tournaments ORDER BY filename").fetchall()
+        return [row["filename"] for row in rows]
+
+    def list_tournament_summaries(self) -> list[Dict[str, Any]]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT t.filename, t.tournament_name, t.location, t.start_date, t.end_date,"
+                " t.actual_round, t.number_of_rounds, t.description,"
+                " (SELECT COUNT(*) FROM tournament_players tp WHERE tp.tournament_id = t.id) AS player_count"
+                " FROM tournaments t ORDER BY t.filename"
+            ).fetchall()
+        return [{**dict(row), "size": None, "mtime": None} for row in rows]
+
+    def tournament_exists(self, filename: str) -> bool:
+        with self._lock:
+            return self._tournament_id(filename) is not None
@@ -0,0 +1,188 @@
+import json
+import lzma
+import os
+import struct
+import threading
+import zlib
+from typing import Any, Dict, Iterator, List, Optional
+
+from config import TOURNAMENT_ARCHIVE, ARCHIVE_CODEC
+from storage.tournament_snapshots import expand_snapshots, normalize_snapshots
+from storage.write_behind import write_atomic
+
+ARCHIVE_MAGIC = b"CHESSARC"
+# Pied de l'archive : signature, position et longueur de l'index des membres
+_FOOTER = struct.Struct("<8sQI")
+
+_COMPRESSORS = {
+    "zlib": lambda content: zlib.compress(content, 9),
+    "lzma": lambda content: lzma.compress(content, preset=9),
+}
+_DECOMPRESSORS = {
+    "zlib": zlib.decompress,
+    "lzma": lzma.decompress,
+}
+
+
+def is_tournament_finished(tournament_data: Dict[str, Any]) -> bool:
+    """
+    Indique si un tournoi est terminé : tous ses rounds ont été joués
+    et le dernier round a une heure de fin.
+    """
+    rounds = tournament_data.get("list_of_rounds") or []
+    return (
+        bool(rounds)
+        and tournament_data.get("actual_round") == tournament_data.get("number_of_rounds")
+        and bool(rounds[-1].get("end_time"))
+    )
+
+
+class TournamentArchive:
+    """
+    Archive compressée des tournois terminés d'un dossier (TOURNAMENT_ARCHIVE).
+
+    Chaque tournoi est un membre compressé indépendamment (JSON compact, codec
+    ARCHIVE_CODEC) : un membre se lit par accès direct, sans décompresser les autres.
+    L'index des membres (position, longueur, taille, CRC, résumé catalogue) est écrit
+    en fin de fichier et repéré par un pied de taille fixe.
+    """
+
+    def __init__(self, folder: str) -> None:
+        """
+        Args:
+            folder (str): Dossier des tournois.
+        """
+        self.folder = folder
+        self.path = os.path.join(folder, TOURNAMENT_ARCHIVE)
+        self._lock = threading.Lock()
+        self._signature: Optional[List[int]] = None
+        self._members: Dict[str, Dict[str, Any]] = {}
+
+    def signature(self) -> Optional[List[int]]:
+        """[taille, mtime] du fichier d'archive, ou None s'il n'existe pas."""
+        try:
+            st = os.stat(self.path)
+        except FileNotFoundError:
+            return None
+        return [st.st_size, st.st_mtime_ns]
+
+    def members(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Retourne l'index des membres de l'archive (relu seulement si le fichier a changé).
+
+        Raises:
+            ValueError: si l'archive est illisible.
+        """
+        with self._lock:
+            return dict(self._current())
+
+    def _current(self) -> Dict[str, Dict[str, Any]]:
+        """Index des membres à jour (appelé sous le verrou)."""
+        signature = self.signature()
+        if signature != self._signature:
+            self._members = self._read_index() if signature is not None else {}
+            self._signature = signature
+        return self._members
+
+    def _read_index(self) -> Dict[str, Dict[str, Any]]:
+        """Lit l'index des membres à partir du pied de l'archive."""
+        try:
+            with open(self.path, "rb") as f:
+                f.seek(-_FOOTER.size, os.SEEK_END)
+                magic, offset, length = _FOOTER.unpack(f.read(_FOOTER.size))
+                if magic != ARCHIVE_MAGIC:
+                    raise ValueError("signature absente")
+                f.seek(offset)
+                return json.loads(zlib.decompress(f.read(length)))["members"]
+        except (OSError, struct.error, zlib.error, KeyError, ValueError) as e:
+            raise ValueError(f"Archive de tournois illisible ({self.path}) : {e}") from e
+
+    def read(self, filename: str) -> Optional[Dict[str, Any]]:
+        """
+        Décompresse et retourne un tournoi archivé, ou None s'il n'est pas dans l'archive.
+
+        Raises:
+            ValueError: si le membre est corrompu (CRC différent).
+        """
+        with self._lock:
+            member = self._current().get(filename)
+            if member is None:
+                return None
+            with open(self.path, "rb") as f:
+                f.seek(member["offset"])
+                raw = f.read(member["length"])
+        content = _DECOMPRESSORS[member["codec"]](raw)
+        if zlib.crc32(content) != member["crc32"]:
+            raise ValueError(f"Tournoi archivé corrompu : {filename}")
+        return expand_snapshots(json.loads(content))
+
+    def pack(self, tournaments: Dict[str, Dict[str, Any]], summaries: Dict[str, Dict[str, Any]]) -> None:
+        """
+        Ajoute (ou remplace) des tournois dans l'archive. L'archive est réécrite de façon
+        atomique ; les membres existants sont recopiés tels quels, sans recompression.
+
+        Args:
+            tournaments (dict): Contenu de chaque tournoi, par nom de fichier.
+            summaries (dict): Résumé catalogue de chaque tournoi, par nom de fichier.
+        """
+        with self._lock:
+            existing = self._current()
+            write_atomic(self.path, self._chunks(existing, tournaments, summaries))
+            self._signature = None
+
+    def _chunks(
+        self,
+        existing: Dict[str, Dict[str, Any]],
+        tournaments: Dict[str, Dict[str, Any]],
+        summaries: Dict[str, Dict[str, Any]]
+    ) -> Iterator[bytes]:
+        """Produit le contenu de la nouvelle archive, membre par membre."""
+        position = 0
+        index: Dict[str, Dict[str, Any]] = {}
+        old = open(self.path, "rb") if existing else None
+        try:
+            for filename, member in existing.items():
+                if filename in tournaments:
+                    continue
+                old.seek(member["offset"])
+                raw = old.read(member["length"])
+                index[filename] = {**member, "offset": position}
+                position += len(raw)
+                yield raw
+            for filename, tournament_data in tournaments.items():
+                stored = normalize_snapshots(tournament_data)
+                content = json.dumps(stored, ensure_ascii=False, separators=(",", ":")).encode("utf-8")
+                raw = _COMPRESSORS[ARCHIVE_CODEC](content)
+                index[filename] = {
+                    "offset": position,
+                    "length": len(raw),
+                    "size": len(content),
+                    "codec": ARCHIVE_CODEC,
+                    "crc32": zlib.crc32(content),
+                    "summary": summaries[filename],
+                }
+                position += len(raw)
+                yield raw
+        finally:
+            if old is not None:
+                old.close()
+        index_bytes = zlib.compress(json.dumps({"version": 1, "members": index}, ensure_ascii=False).encode("utf-8"))
+        yield index_bytes
+        yield _FOOTER.pack(ARCHIVE_MAGIC, position, len(index_bytes))
+
+
+_archives: Dict[str, TournamentArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def get_archive(folder: str) -> TournamentArchive:
+    """
+    Retourne l'archive (partagée dans le processus) du dossier `folder`.
+    """
+    key = os.path.abspath(folder)
+    with _archives_lock:
+        archive = _archives.get(key)
+        if archive is None:
+            archive = TournamentArchive(folder)
+            _archives[key] = archive
+        return archive
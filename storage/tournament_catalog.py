@@ -0,0 +1,232 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import TOURNAMENT_CATALOG, JOURNAL_EXTENSION, WRITE_BEHIND
+from storage.tournament_archive import get_archive
+from storage.tournament_split import SPLIT_HEADER, split_path
+from storage.write_behind import get_saver, pending_write, write_atomic
+
+# Champs d'en-tête recopiés dans le catalogue
+HEADER_FIELDS = (
+    "tournament_name",
+    "location",
+    "start_date",
+    "end_date",
+    "actual_round",
+    "number_of_rounds",
+    "description",
+)
+
+
+def summary_from_data(tournament_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Résumé catalogue d'un tournoi à partir de son contenu JSON.
+    """
+    summary = {field: tournament_data.get(field) for field in HEADER_FIELDS}
+    summary["player_count"] = len(tournament_data.get("list_of_players", []))
+    return summary
+
+
+def summary_from_tournament(tournament: Any) -> Dict[str, Any]:
+    """
+    Résumé catalogue d'un objet Tournament, sans le sérialiser.
+    """
+    summary = {field: getattr(tournament, field) for field in HEADER_FIELDS}
+    summary["player_count"] = len(tournament.list_of_players)
+    return summary
+
+
+class TournamentCatalog:
+    """
+    Catalogue des tournois d'un dossier : nom, lieu, dates, avancement des rounds,
+    nombre de joueurs, taille et date de modification de chaque fichier. Les tournois
+    de l'archive (voir storage/tournament_archive.py) y figurent avec le résumé de son index.
+
+    Le catalogue est tenu à jour à chaque sauvegarde du processus et resynchronisé
+    avec le dossier par comparaison des tailles et dates de modification (fichier JSON
+    et journal) : seuls les fichiers modifiés par ailleurs sont relus.
+    Il est persisté dans TOURNAMENT_CATALOG, à côté des tournois.
+    """
+
+    def __init__(self, folder: str) -> None:
+        """
+        Args:
+            folder (str): Dossier des tournois.
+        """
+        self.folder = folder
+        self.path = os.path.join(folder, TOURNAMENT_CATALOG)
+        self._lock = threading.Lock()
+        self._entries: Optional[Dict[str, Dict[str, Any]]] = None
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        """Charge le manifeste persisté (une seule fois par processus)."""
+        if self._entries is None:
+            self._entries = {}
+            if os.path.isfile(self.path):
+                try:
+                    with open(self.path, "r", encoding="utf-8") as f:
+                        self._entries = json.load(f).get("entries", {})
+                    # Entrées persistées avant relevé de leur signature : à relire
+                    for entry in self._entries.values():
+                        if entry.get("signature") is None:
+                            entry["signature"] = []
+                except (OSError, ValueError):
+                    # Manifeste illisible : il sera reconstruit depuis les fichiers
+                    self._entries = {}
+        return self._entries
+
+    def update(self, filename: str, summary: Dict[str, Any]) -> None:
+        """
+        Met à jour l'entrée d'un tournoi que le processus vient de sauvegarder.
+        Sa signature disque sera relevée (sans relecture) à la prochaine synchronisation.
+
+        Args:
+            filename (str): Nom du fichier JSON du tournoi.
+            summary (dict): Résumé (voir `summary_from_data` / `summary_from_tournament`).
+        """
+        with self._lock:
+            entry = self._load().get(filename, {})
+            self._entries[filename] = {
+                **summary,
+                "filename": filename,
+                "archived": False,
+                "size": entry.get("size"),
+                "mtime": entry.get("mtime"),
+                "signature": None,
+            }
+
+    def refresh(self, loader: Callable[[str], Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Resynchronise le catalogue avec le dossier et retourne ses entrées.
+
+        Args:
+            loader (callable): Charge un tournoi complet à partir de son chemin ;
+                appelé seulement pour les fichiers nouveaux ou modifiés hors du processus.
+
+        Returns:
+            list[dict]: Entrées du catalogue, triées par nom de fichier.
+        """
+        with self._lock:
+            entries = self._load()
+            stats, archived = self._scan()
+            changed = False
+            for filename in list(entries):
+                if filename not in stats and not self._is_pending(filename):
+                    del entries[filename]
+                    changed = True
+            for filename, signature in stats.items():
+                entry = entries.get(filename)
+                if entry is not None and entry["signature"] == signature:
+                    continue
+                path = os.path.join(self.folder, filename)
+                if filename in archived:
+                    entry = {**archived[filename]["summary"], "filename": filename, "archived": True}
+                elif entry is None or entry["signature"] is not None:
+                    entry = {**self._read_summary(loader, path), "filename": filename, "archived": False}
+                if not self._is_pending(filename):
+                    entry["signature"] = signature
+                entry["size"], entry["mtime"] = signature[0], signature[1] / 1e9
+                if filename in archived:
+                    entry["size"] = archived[filename]["length"]
+                entries[filename] = entry
+                changed = True
+            if changed:
+                self._persist(entries)
+            return [entries[f] for f in sorted(entries)]
+
+    def get(self, filename: str, loader: Callable[[str], Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+        """
+        Retourne l'entrée d'un tournoi (synchronisée), ou None s'il n'existe pas.
+        """
+        return next((e for e in self.refresh(loader) if e["filename"] == filename), None)
+
+    def _is_pending(self, filename: str) -> bool:
+        """Indique si une sauvegarde du tournoi (fichier ou dossier "split") attend d'être écrite."""
+        header = os.path.join(split_path(self.folder, filename), SPLIT_HEADER)
+        return pending_write(os.path.join(self.folder, filename)) is not None or pending_write(header) is not None
+
+    @staticmethod
+    def _read_summary(loader: Callable[[str], Dict[str, Any]], path: str) -> Dict[str, Any]:
+        """Relit un tournoi pour en extraire le résumé (champs vides si illisible)."""
+        try:
+            return summary_from_data(loader(path))
+        except (OSError, ValueError, KeyError):
+            return summary_from_data({})
+
+    def _scan(self) -> Tuple[Dict[str, List[int]], Dict[str, Dict[str, Any]]]:
+        """
+        Relève la signature [taille, mtime, taille du journal, mtime du journal]
+        de chaque fichier de tournoi en un seul parcours du dossier (pour un dossier
+        "split" : taille de l'en-tête et mtime du dossier).
+        Un tournoi archivé a pour signature [taille, mtime, position, longueur] de son
+        membre dans l'archive ; un fichier JSON du même nom (écrit ou en attente) a priorité.
+        Une archive illisible est signalée et ignorée.
+
+        Returns:
+            tuple: (signatures par nom de fichier, membres de l'archive retenus).
+        """
+        if not os.path.isdir(self.folder):
+            return {}, {}
+        stats = {}
+        split = {}
+        with os.scandir(self.folder) as it:
+            for entry in it:
+                if entry.name.endswith(".json") or entry.name.endswith(JOURNAL_EXTENSION):
+                    st = entry.stat()
+                    stats[entry.name] = [st.st_size, st.st_mtime_ns]
+                elif entry.is_dir():
+                    # Disposition "split" : toute écriture (atomique) dans le dossier
+                    # change sa date de modification
+                    try:
+                        header = os.stat(os.path.join(entry.path, SPLIT_HEADER))
+                    except FileNotFoundError:
+                        continue
+                    split[entry.name + ".json"] = [header.st_size, entry.stat().st_mtime_ns]
+        files = {name: stat for name, stat in stats.items() if name.endswith(".json")}
+        signatures = {}
+        for name, (size, mtime) in {**files, **split}.items():
+            stem = name[: -len(".json")]
+            journal = stats.get(stem + JOURNAL_EXTENSION, [0, 0])
+            signatures[name] = [size, mtime, *journal]
+        archive = get_archive(self.folder)
+        archive_signature = archive.signature()
+        archived = {}
+        if archive_signature is not None:
+            try:
+                members = archive.members()
+            except ValueError as e:
+                # Archive endommagée : les tournois qui n'y sont pas restent listés
+                print(f"Ignoré : {e}.")
+                members = {}
+            for name, member in members.items():
+                if name not in signatures and not self._is_pending(name):
+                    signatures[name] = [*archive_signature, member["offset"], member["length"]]
+                    archived[name] = member
+        return signatures, archived
+
+    def _persist(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        """Écrit le manifeste (de façon atomique, différée si WRITE_BEHIND)."""
+        payload = json.dumps({"version": 1, "entries": entries}, ensure_ascii=False).encode("utf-8")
+        if WRITE_BEHIND:
+            get_saver().submit(self.path, payload)
+        else:
+            write_atomic(self.path, payload)
+
+
+_catalogs: Dict[str, TournamentCatalog] = {}
+_catalogs_lock = threading.Lock()
+
+
+def get_catalog(folder: str) -> TournamentCatalog:
+    """
+    Retourne le catalogue (partagé dans le processus) du dossier `folder`.
+    """
+    key = os.path.abspath(folder)
+    with _catalogs_lock:
+        catalog = _catalogs.get(key)
+        if catalog is None:
+            catalog = TournamentCatalog(folder)
+            _catalogs[key] = catalog
+        return catalog
@@ -0,0 +1,445 @@
+import json
+import struct
+import zlib
+from typing import Any, Dict, List, Optional
+
+from storage.tournament_snapshots import expand_snapshots
+
+# Début d'un fichier de tournoi au format binaire (le format JSON commence par "{")
+BINARY_MAGIC = b"CHTB\x01"
+
+_DOUBLE = struct.Struct("<d")
+
+_PLAYER_KEYS = ("id_national_chess", "tournament_score", "rank", "played_with")
+_SNAP_KEYS = ("id_national_chess", "match_score", "tournament_score", "rank", "color", "played_with")
+# Snapshot enregistré sans ses champs cumulés (voir storage/tournament_snapshots.py)
+_DELTA_SNAP_KEYS = ("id_national_chess", "match_score", "rank", "color")
+_ROUND_KEYS = ("round_number", "start_time", "end_time", "matches")
+_MATCH_KEYS = ("name", "player_1", "player_2", "winner")
+_BODY_KEYS = ("list_of_players", "list_of_rounds")
+
+# Étiquettes des valeurs (un octet) :
+# 0x00-0x06 : None, True, False, entier, flottant, chaîne du dictionnaire, JSON brut ;
+# 0x40-0x7F : entier 0 à 63 ; 0x80-0xFF : flottant multiple de 0,5 de 0.0 à 63.5.
+_NONE, _TRUE, _FALSE, _INT, _FLOAT, _STR, _JSON = range(7)
+_SMALL_INT = 0x40
+_HALF = 0x80
+
+# Vainqueur d'un match
+_WINNER_NONE, _WINNER_DRAW, _WINNER_ID, _WINNER_OTHER = range(4)
+
+# Enregistrement au format attendu, ou valeur quelconque (données anciennes ou incomplètes),
+# ou snapshot sans ses champs cumulés
+_GENERIC, _RECORD, _DELTA = 0, 1, 2
+
+# Somme de contrôle (CRC-32, 8 chiffres hexadécimaux) embarquée dans chaque fichier de tournoi :
+# dernier champ "checksum" d'un objet JSON, ou suffixe _CHECKSUM_TRAILER + somme en binaire.
+_CHECKSUM_FIELD = b',\n    "checksum": "'
+_CHECKSUM_END = b'"\n}'
+_CHECKSUM_TRAILER = b"\x00CHK"
+_CHECKSUM_DIGITS = 8
+
+
+def is_binary_tournament(payload: bytes) -> bool:
+    """Indique si `payload` est un tournoi au format binaire."""
+    return payload[:len(BINARY_MAGIC)] == BINARY_MAGIC
+
+
+def _checksum(payload: bytes) -> bytes:
+    return b"%08x" % zlib.crc32(payload)
+
+
+def seal(payload: bytes) -> bytes:
+    """
+    Ajoute une somme de contrôle à un contenu de fichier de tournoi : champ "checksum"
+    ajouté en dernier à un objet JSON indenté (les offsets des autres champs sont inchangés),
+    suffixe après un tournoi binaire. Les autres contenus (ex : `null`) sont retournés tels quels.
+
+    Args:
+        payload (bytes): Contenu produit par `encode_tournament`, `encode_tournament_binary`
+            ou json.dumps(..., indent=4).
+
+    Returns:
+        bytes: Le contenu scellé (voir `unseal`).
+    """
+    if is_binary_tournament(payload):
+        return payload + _CHECKSUM_TRAILER + _checksum(payload)
+    if payload.endswith(b"\n}"):
+        body = payload[:-2]
+        return body + _CHECKSUM_FIELD + _checksum(body) + _CHECKSUM_END
+    return payload
+
+
+def unseal(payload: bytes) -> bytes:
+    """
+    Vérifie la somme de contrôle d'un contenu scellé par `seal` et retourne le contenu d'origine.
+    Un contenu sans somme de contrôle (fichier antérieur, ou non scellable) est retourné tel quel.
+
+    Raises:
+        ValueError: si la somme de contrôle ne correspond pas au contenu (fichier corrompu).
+    """
+    if is_binary_tournament(payload):
+        size = len(_CHECKSUM_TRAILER) + _CHECKSUM_DIGITS
+        if payload[-size:-_CHECKSUM_DIGITS] != _CHECKSUM_TRAILER:
+            return payload
+        body, expected = payload[:-size], payload[-_CHECKSUM_DIGITS:]
+        original = body
+    else:
+        size = len(_CHECKSUM_FIELD) + _CHECKSUM_DIGITS + len(_CHECKSUM_END)
+        if not payload.endswith(_CHECKSUM_END) or payload[-size:-size + len(_CHECKSUM_FIELD)] != _CHECKSUM_FIELD:
+            return payload
+        body, expected = payload[:-size], payload[-size + len(_CHECKSUM_FIELD):-len(_CHECKSUM_END)]
+        original = body + b"\n}"
+    if _checksum(body) != expected:
+        raise ValueError("Somme de contrôle invalide : fichier de tournoi corrompu")
+    return original
+
+
+def decode_tournament(payload: bytes) -> Dict[str, Any]:
+    """
+    Décode le contenu d'un fichier de tournoi, quel que soit son format (JSON ou binaire).
+    La somme de contrôle éventuelle est vérifiée (voir `unseal`) et les champs cumulés
+    des snapshots des matchs sont reconstruits (voir `expand_snapshots`).
+
+    Args:
+        payload (bytes): Contenu du fichier.
+
+    Returns:
+        dict: Le tournoi, tel que retourné par Tournament.get_serialized_tournament().
+
+    Raises:
+        ValueError: si le contenu n'est pas un tournoi valide ou s'il est corrompu.
+    """
+    payload = unseal(payload)
+    if is_binary_tournament(payload):
+        return expand_snapshots(_Reader(payload).tournament())
+    return expand_snapshots(json.loads(payload))
+
+
+def encode_tournament_binary(tournament_data: Dict[str, Any]) -> bytes:
+    """
+    Encode un tournoi sérialisé au format binaire compact :
+      - un dictionnaire des chaînes (IDN, couleurs, noms de matchs…) remplace chaque
+        occurrence par un petit entier ;
+      - scores et rangs tiennent en un octet, les listes d'adversaires en entiers variables ;
+      - les champs d'en-tête restent en JSON, l'ordre des clés étant conservé.
+    `decode_tournament` restitue exactement le même dict.
+
+    Args:
+        tournament_data (dict): Le tournoi sérialisé.
+
+    Returns:
+        bytes: Le contenu du fichier.
+    """
+    writer = _Writer()
+    header = {k: v for k, v in tournament_data.items() if k not in _BODY_KEYS}
+    flags = 0
+    for bit, key in enumerate(_BODY_KEYS):
+        if key in tournament_data:
+            flags |= 1 << bit
+    writer.out.append(flags)
+    for bit, key in enumerate(_BODY_KEYS):
+        if flags & (1 << bit):
+            writer.records(tournament_data[key], writer.player if key == "list_of_players" else writer.round)
+
+    out = bytearray(BINARY_MAGIC)
+    _write_blob(out, json.dumps(header, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+    _write_varint(out, len(writer.strings))
+    for text in writer.strings:
+        _write_blob(out, text.encode("utf-8"))
+    out += writer.out
+    return bytes(out)
+
+
+def _write_varint(out: bytearray, value: int) -> None:
+    """Entier positif sur 7 bits par octet (bit de poids fort : octet suivant)."""
+    while value >= 0x80:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+
+
+def _write_blob(out: bytearray, data: bytes) -> None:
+    _write_varint(out, len(data))
+    out += data
+
+
+class _Writer:
+    """Encodage du corps du tournoi (joueurs et rounds) et du dictionnaire des chaînes."""
+
+    def __init__(self) -> None:
+        self.out = bytearray()
+        self.strings: List[str] = []
+        self._refs: Dict[str, int] = {}
+
+    def ref(self, text: str) -> int:
+        ref = self._refs.get(text)
+        if ref is None:
+            ref = self._refs[text] = len(self.strings)
+            self.strings.append(text)
+        return ref
+
+    def value(self, value: Any) -> None:
+        out = self.out
+        if value is None:
+            out.append(_NONE)
+        elif value is True:
+            out.append(_TRUE)
+        elif value is False:
+            out.append(_FALSE)
+        elif isinstance(value, int):
+            if 0 <= value < 64:
+                out.append(_SMALL_INT | value)
+            else:
+                out.append(_INT)
+                _write_varint(out, (value << 1) if value >= 0 else ((-value << 1) - 1))
+        elif isinstance(value, float):
+            doubled = value * 2
+            if doubled.is_integer() and 0 <= doubled < 128:
+                out.append(_HALF | int(doubled))
+            else:
+                out.append(_FLOAT)
+                out += _DOUBLE.pack(value)
+        elif isinstance(value, str):
+            out.append(_STR)
+            _write_varint(out, self.ref(value))
+        else:
+            out.append(_JSON)
+            _write_blob(out, json.dumps(value, ensure_ascii=False, separators=(",", ":")).encode("utf-8"))
+
+    def id_list(self, ids: List[str]) -> None:
+        _write_varint(self.out, len(ids))
+        for idn in ids:
+            _write_varint(self.out, self.ref(idn))
+
+    def records(self, items: Any, encode_record) -> None:
+        if not isinstance(items, list):
+            self.out.append(_GENERIC)
+            self.value(items)
+            return
+        self.out.append(_RECORD)
+        _write_varint(self.out, len(items))
+        for item in items:
+            encode_record(item)
+
+    def _generic(self, item: Any, keys: tuple) -> bool:
+        """Écrit `item` tel quel s'il n'a pas exactement la forme attendue."""
+        if (
+            isinstance(item, dict)
+            and tuple(item) == keys
+            and isinstance(item.get("id_national_chess", ""), str)
+            and _is_id_list(item.get("played_with", []))
+        ):
+            self.out.append(_RECORD)
+            return False
+        self.out.append(_GENERIC)
+        self.value(item)
+        return True
+
+    def player(self, item: Any) -> None:
+        if self._generic(item, _PLAYER_KEYS):
+            return
+        _write_varint(self.out, self.ref(item["id_national_chess"]))
+        self.value(item["tournament_score"])
+        self.value(item["rank"])
+        self.id_list(item["played_with"])
+
+    def snap(self, item: Any) -> None:
+        if (
+            isinstance(item, dict)
+            and tuple(item) == _DELTA_SNAP_KEYS
+            and isinstance(item["id_national_chess"], str)
+        ):
+            self.out.append(_DELTA)
+            _write_varint(self.out, self.ref(item["id_national_chess"]))
+            self.value(item["match_score"])
+            self.value(item["rank"])
+            self.value(item["color"])
+            return
+        if self._generic(item, _SNAP_KEYS):
+            return
+        _write_varint(self.out, self.ref(item["id_national_chess"]))
+        self.value(item["match_score"])
+        self.value(item["tournament_score"])
+        self.value(item["rank"])
+        self.value(item["color"])
+        self.id_list(item["played_with"])
+
+    def round(self, item: Any) -> None:
+        if self._generic(item, _ROUND_KEYS):
+            return
+        self.value(item["round_number"])
+        self.value(item["start_time"])
+        self.value(item["end_time"])
+        self.records(item["matches"], self.match)
+
+    def match(self, item: Any) -> None:
+        if self._generic(item, _MATCH_KEYS):
+            return
+        self.value(item["name"])
+        self.snap(item["player_1"])
+        self.snap(item["player_2"])
+        winner = item["winner"]
+        if winner is None:
+            self.out.append(_WINNER_NONE)
+        elif winner == "draw":
+            self.out.append(_WINNER_DRAW)
+        elif isinstance(winner, dict) and list(winner) == ["id_national_chess"] and isinstance(
+                winner["id_national_chess"], str):
+            self.out.append(_WINNER_ID)
+            _write_varint(self.out, self.ref(winner["id_national_chess"]))
+        else:
+            self.out.append(_WINNER_OTHER)
+            self.value(winner)
+
+
+def _is_id_list(value: Any) -> bool:
+    return isinstance(value, list) and all(isinstance(idn, str) for idn in value)
+
+
+class _Reader:
+    """Décodage d'un tournoi au format binaire."""
+
+    def __init__(self, payload: bytes) -> None:
+        self.buf = payload
+        self.pos = len(BINARY_MAGIC)
+        self.strings: List[str] = []
+
+    def tournament(self) -> Dict[str, Any]:
+        try:
+            data = json.loads(self.blob())
+            self.strings = [self.blob().decode("utf-8") for _ in range(self.varint())]
+            flags = self.byte()
+            if flags & 1:
+                data["list_of_players"] = self.records(self.player)
+            if flags & 2:
+                data["list_of_rounds"] = self.records(self.round)
+        except (IndexError, KeyError, struct.error) as e:
+            raise ValueError(f"Tournoi binaire illisible : {e}") from e
+        if self.pos != len(self.buf):
+            raise ValueError("Tournoi binaire illisible : données en trop")
+        return data
+
+    def byte(self) -> int:
+        value = self.buf[self.pos]
+        self.pos += 1
+        return value
+
+    def varint(self) -> int:
+        buf = self.buf
+        value = buf[self.pos]
+        self.pos += 1
+        if value < 0x80:
+            return value
+        value &= 0x7F
+        shift = 7
+        while True:
+            b = buf[self.pos]
+            self.pos += 1
+            value |= (b & 0x7F) << shift
+            if b < 0x80:
+                return value
+            shift += 7
+
+    def blob(self) -> bytes:
+        length = self.varint()
+        start = self.pos
+        self.pos += length
+        if self.pos > len(self.buf):
+            raise IndexError("longueur hors limites")
+        return self.buf[start:self.pos]
+
+    def value(self) -> Any:
+        tag = self.byte()
+        if tag >= _HALF:
+            return (tag - _HALF) / 2
+        if tag >= _SMALL_INT:
+            return tag - _SMALL_INT
+        if tag == _STR:
+            return self.strings[self.varint()]
+        if tag == _NONE:
+            return None
+        if tag == _TRUE:
+            return True
+        if tag == _FALSE:
+            return False
+        if tag == _INT:
+            zigzag = self.varint()
+            return (zigzag >> 1) if not zigzag & 1 else -((zigzag + 1) >> 1)
+        if tag == _FLOAT:
+            (value,) = _DOUBLE.unpack_from(self.buf, self.pos)
+            self.pos += _DOUBLE.size
+            return value
+        if tag == _JSON:
+            return json.loads(self.blob())
+        raise ValueError(f"Tournoi binaire illisible : étiquette inconnue {tag}")
+
+    def id_list(self) -> List[str]:
+        count = self.varint()
+        chunk = self.buf[self.pos:self.pos + count]
+        strings = self.strings
+        if len(chunk) == count and (not chunk or max(chunk) < 0x80):
+            # Cas courant : chaque référence tient sur un octet
+            self.pos += count
+            return [strings[ref] for ref in chunk]
+        return [strings[self.varint()] for _ in range(count)]
+
+    def records(self, decode_record) -> Any:
+        if self.byte() == _GENERIC:
+            return self.value()
+        return [decode_record() for _ in range(self.varint())]
+
+    def player(self) -> Optional[Dict[str, Any]]:
+        if self.byte() == _GENERIC:
+            return self.value()
+        return {
+            "id_national_chess": self.strings[self.varint()],
+            "tournament_score": self.value(),
+            "rank": self.value(),
+            "played_with": self.id_list(),
+        }
+
+    def snap(self) -> Optional[Dict[str, Any]]:
+        kind = self.byte()
+        if kind == _GENERIC:
+            return self.value()
+        if kind == _DELTA:
+            return {
+                "id_national_chess": self.strings[self.varint()],
+                "match_score": self.value(),
+                "rank": self.value(),
+                "color": self.value(),
+            }
+        return {
+            "id_national_chess": self.strings[self.varint()],
+            "match_score": self.value(),
+            "tournament_score": self.value(),
+            "rank": self.value(),
+            "color": self.value(),
+            "played_with": self.id_list(),
+        }
+
+    def round(self) -> Dict[str, Any]:
+        if self.byte() == _GENERIC:
+            return self.value()
+        return {
+            "round_number": self.value(),
+            "start_time": self.value(),
+            "end_time": self.value(),
+            "matches": self.records(self.match),
+        }
+
+    def match(self) -> Dict[str, Any]:
+        if self.byte() == _GENERIC:
+            return self.value()
+        match = {"name": self.value(), "player_1": self.snap(), "player_2": self.snap()}
+        kind = self.byte()
+        if kind == _WINNER_NONE:
+            match["winner"] = None
+        elif kind == _WINNER_DRAW:
+            match["winner"] = "draw"
+        elif kind == _WINNER_ID:
+            match["winner"] = {"id_national_chess": self.strings[self.varint()]}
+        else:
+            match["winner"] = self.value()
+        return match
@@ -1,17 +1,266 @@
-import json
 import os
+import shutil
+from typing import Any, ContextManager, Dict, Iterator, List, Tuple
+
+from config import (
+    TOURNAMENT_ENCODING,
+    TOURNAMENT_GENERATIONS,
+    TOURNAMENT_JOURNAL,
+    TOURNAMENT_LAYOUT,
+    JOURNAL_CHECKPOINT_INTERVAL,
+    WRITE_BEHIND
+)
+from storage.repository import get_repository
+from storage.schema import is_current, upgrade_tournament
+from storage.tournament_archive import get_archive, is_tournament_finished
+from storage.tournament_codec import decode_tournament, encode_tournament_binary, seal
+from storage.tournament_catalog import get_catalog, summary_from_data, summary_from_tournament
+from storage.tournament_document import (
+    TournamentDocument,
+    encode_tournament,
+    get_serialization_cache,
+    index_path,
+    read_document,
+    write_index
+)
+from storage.tournament_journal import get_journal, replay_journal
+from storage.tournament_lock import REVISION_KEY, get_tournament_lock
+from storage.tournament_recovery import read_recovered
+from storage.tournament_snapshots import normalize_snapshots
+from storage.tournament_split import (
+    encode_split,
+    is_split_tournament,
+    read_split,
+    read_split_document,
+    split_path,
+    split_header_path
+)
+from storage.write_behind import (
+    drain_writes,
+    generation_paths,
+    get_saver,
+    pending_write,
+    write_atomic,
+    write_files
+)
+from storage.write_digest import get_write_digests
 
 
 def save_tournament_to_json(tournament_data, folder, filename):
     """
-    Écrit (ou réécrit) systématiquement le JSON du tournoi.
+    Écrit (ou réécrit) le checkpoint complet du tournoi, sous le verrou du tournoi
+    et avec une nouvelle révision (voir `_write_checkpoint`). Un contenu identique au
+    dernier checkpoint écrit n'est pas réécrit (voir storage/write_digest.py).
+    Avec un backend autre que "json", l'écriture est déléguée au dépôt configuré.
     """
+    repository = get_repository()
+    if repository is not None:
+        repository.save_tournament(tournament_data, filename)
+        return True
+
     os.makedirs(folder, exist_ok=True)
+    # Snapshots des matchs sans leurs champs cumulés (voir storage/tournament_snapshots.py)
+    tournament_data = normalize_snapshots(tournament_data)
     filepath = os.path.join(folder, filename)
+    cache = get_serialization_cache(filepath)
+    digest = cache.digest(tournament_data, ignored=(REVISION_KEY,))
+    lock = get_tournament_lock(folder, filename)
+    with lock.hold():
+        if get_write_digests().unchanged(_checkpoint_path(folder, filename), digest, lock.revision()):
+            return True
+        revision = lock.advance()
+        tournament_data = {**tournament_data, REVISION_KEY: revision}
+        _write_checkpoint(tournament_data, folder, filename, revision, digest)
+    return True
+
+
+def stored_revision(folder: str, filename: str) -> int:
+    """
+    Révision la plus élevée enregistrée dans les fichiers du tournoi : celle de son
+    checkpoint (REVISION_KEY) et celle du dernier événement de son journal
+    (0 si aucune). Un checkpoint illisible est ignoré.
+
+    Args:
+        folder (str): Le dossier des tournois.
+        filename (str): Le nom du fichier JSON du tournoi.
+
+    Returns:
+        int: La révision.
+    """
+    filepath = os.path.join(folder, filename)
+    pending = pending_write(filepath)
+    try:
+        if pending is not None:
+            data = decode_tournament(pending)
+        elif _reads_split(folder, filename):
+            data = read_split_document(split_path(folder, filename))
+        elif os.path.isfile(filepath):
+            data = read_document(filepath) if TOURNAMENT_ENCODING == "json" else None
+            if data is None:
+                with open(filepath, "rb") as f:
+                    data = decode_tournament(f.read())
+        else:
+            data = {}
+    except (OSError, ValueError):
+        data = {}
+    return max(data.get(REVISION_KEY, 0), get_journal(folder, filename).last_revision())
+
+
+def _checkpoint_path(folder: str, filename: str) -> str:
+    """Fichier réécrit à chaque checkpoint dans la disposition configurée (suivi par empreinte)."""
+    if TOURNAMENT_LAYOUT == "split":
+        return split_header_path(folder, filename)
+    return os.path.join(folder, filename)
+
 
-    with open(filepath, "w", encoding="utf-8") as file:
-        json.dump(tournament_data, file, ensure_ascii=False, indent=4)
+def _write_checkpoint(
+    tournament_data: Dict[str, Any],
+    folder: str,
+    filename: str,
+    revision: int,
+    digest: bytes
+) -> None:
+    """
+    Encode le checkpoint dans le format et la disposition configurés (TOURNAMENT_ENCODING,
+    TOURNAMENT_LAYOUT), met à jour le catalogue, puis l'écrit de façon atomique, ou le confie
+    au thread d'écriture différée avec WRITE_BEHIND (storage/write_behind.py). L'écriture
+    n'a pas lieu si un checkpoint plus récent a été écrit entre-temps (voir
+    TournamentLock.checkpoint_guard) ; une fois le fichier écrit, son index des offsets est
+    mis à jour, ainsi que l'éventuel enregistrement du tournoi dans l'autre disposition.
+    Chaque fichier porte une somme de contrôle et ses TOURNAMENT_GENERATIONS versions
+    précédentes sont conservées (voir storage/tournament_recovery.py) : le début du journal
+    n'est supprimé qu'une fois couvert par toutes ces versions, pour qu'une version restaurée
+    retrouve les événements écrits depuis (voir TournamentLock.retained_checkpoint).
+    """
+    filepath = os.path.join(folder, filename)
+    directory = split_path(folder, filename)
+    files, payload, index = None, None, None
+    if TOURNAMENT_LAYOUT == "split":
+        files = encode_split(tournament_data, directory)
+    elif TOURNAMENT_ENCODING == "binary":
+        payload = seal(encode_tournament_binary(tournament_data))
+    else:
+        payload, index = encode_tournament(tournament_data, get_serialization_cache(filepath))
+        payload = seal(payload)
+
+    get_catalog(folder).update(filename, summary_from_data(tournament_data))
+    journal = get_journal(folder, filename)
+    journal.mark_checkpoint()
+    digests = get_write_digests()
+    target = _checkpoint_path(folder, filename)
+    digests.expect(target, digest, revision)
+
+    def guard() -> ContextManager[bool]:
+        return get_tournament_lock(folder, filename).checkpoint_guard(revision)
+
+    def on_written() -> None:
+        if files is not None:
+            _remove_paths(filepath, index_path(filepath), *generation_paths(filepath, TOURNAMENT_GENERATIONS))
+        else:
+            if index is not None:
+                write_index(filepath, index)
+            _remove_paths(directory)
+        digests.written(target)
+        # Événements conservés tant qu'une version précédente restaurable ne les contient pas
+        covered = get_tournament_lock(folder, filename).retained_checkpoint(revision)
+        if covered is not None:
+            journal.discard_through(covered)
+
+    if WRITE_BEHIND and files is not None:
+        get_saver().submit_files(directory, files, on_written, TOURNAMENT_GENERATIONS, guard)
+    elif WRITE_BEHIND:
+        get_saver().submit(filepath, payload, on_written, TOURNAMENT_GENERATIONS, guard)
+    else:
+        with guard() as proceed:
+            if not proceed:
+                return
+            if files is not None:
+                write_files(directory, files, TOURNAMENT_GENERATIONS)
+            else:
+                write_atomic(filepath, payload, TOURNAMENT_GENERATIONS)
+            on_written()
+
+
+def _remove_paths(*paths: str) -> None:
+    """Supprime les fichiers ou dossiers donnés qui existent."""
+    for path in paths:
+        if os.path.isdir(path):
+            shutil.rmtree(path)
+        elif os.path.exists(path):
+            os.remove(path)
+
+
+def record_tournament_event(
+    tournament: Any,
+    folder: str,
+    filename: str,
+    event_type: str,
+    payload: Dict[str, Any]
+) -> bool:
+    """
+    Persiste une modification du tournoi sous la forme d'un événement typé.
 
+    Si le tournoi possède une session de persistance (`tournament.session`), l'événement
+    lui est confié : il sera écrit avec les autres modifications de la même transaction.
+
+    Args:
+        tournament: L'objet Tournament modifié.
+        folder (str): Le dossier des tournois.
+        filename (str): Le nom du fichier JSON du tournoi.
+        event_type (str): Type d'événement, ex : "result_recorded".
+        payload (dict): Données de l'événement.
+
+    Returns:
+        bool: True si l'événement a été écrit ou mis en attente.
+    """
+    session = getattr(tournament, "session", None)
+    if session is not None:
+        session.record(event_type, payload)
+        return True
+    return write_tournament_events(tournament, folder, filename, [(event_type, payload)])
+
+
+def write_tournament_events(
+    tournament: Any,
+    folder: str,
+    filename: str,
+    events: List[Tuple[str, Dict[str, Any]]]
+) -> bool:
+    """
+    Écrit une série d'événements du tournoi en une seule opération.
+
+    Avec le backend "json" et TOURNAMENT_JOURNAL activé, les événements sont ajoutés
+    au journal du tournoi (coût indépendant de la taille du tournoi) ; un checkpoint
+    complet est écrit tous les JOURNAL_CHECKPOINT_INTERVAL événements.
+    Sinon, le tournoi complet est sauvegardé une fois, comme auparavant (sauvegarde
+    évitée si son contenu n'a pas changé, voir save_tournament_to_json).
+    L'écriture a lieu sous le verrou du tournoi et reçoit une nouvelle révision ;
+    des événements sans effet (rangs inchangés) ne sont pas écrits.
+
+    Args:
+        tournament: L'objet Tournament (sérialisé seulement pour une sauvegarde complète).
+        folder (str): Le dossier des tournois.
+        filename (str): Le nom du fichier JSON du tournoi.
+        events (list): Couples (type d'événement, données), dans l'ordre.
+
+    Returns:
+        bool: True si l'écriture a réussi.
+    """
+    if get_repository() is not None or not TOURNAMENT_JOURNAL:
+        return save_tournament_to_json(tournament.get_serialized_tournament(), folder, filename)
+
+    lock = get_tournament_lock(folder, filename)
+    journal = get_journal(folder, filename)
+    with lock.hold():
+        events = journal.track(events)
+        if not events:
+            # Aucune modification effective : rien à écrire
+            get_write_digests().count_skipped()
+            return True
+        if journal.append_many(events, lock.advance()) >= JOURNAL_CHECKPOINT_INTERVAL:
+            save_tournament_to_json(tournament.get_serialized_tournament(), folder, filename)
+        else:
+            get_catalog(folder).update(filename, summary_from_tournament(tournament))
     return True
 
 
@@ -21,12 +270,285 @@ def load_tournament_from_json(filepath: str) -> dict:
 
     - `filepath` doit être le chemin complet vers un fichier .json existant.
     - Si le fichier n'existe pas, on lève FileNotFoundError.
-    - Si le contenu n'est pas un JSON valide, on lève json.JSONDecodeError.
+    - Le format binaire (voir storage/tournament_codec.py) est reconnu à sa signature.
+    - Si le contenu n'est pas un tournoi valide, on lève ValueError (json.JSONDecodeError).
+    - Une sauvegarde encore en attente d'écriture différée est prise en compte.
+    - Un tournoi en disposition "split" est assemblé depuis son dossier.
+    - Un tournoi sans fichier JSON est lu dans l'archive des tournois terminés.
+    - Un fichier corrompu (somme de contrôle invalide) est remplacé par sa version
+      précédente valide la plus récente (voir storage/tournament_recovery.py).
+    - Le contenu lu est mis à la version courante du schéma (voir storage/schema.py),
+      puis les événements du journal du tournoi sont rejoués.
+    """
+    repository = get_repository()
+    if repository is not None:
+        data = repository.load_tournament(os.path.basename(filepath))
+        if data is None:
+            raise FileNotFoundError(f"Aucun tournoi enregistré sous le nom : {filepath}")
+        return upgrade_tournament(data)
+    return _read_stored_tournament(filepath)
+
+
+def _read_stored_tournament(filepath: str) -> dict:
+    """Lecture de load_tournament_from_json dans les fichiers du backend "json"."""
+    folder, filename = os.path.split(filepath)
+    pending = pending_write(filepath)
+    if pending is not None:
+        data = decode_tournament(pending)
+    elif _reads_split(folder, filename):
+        data = read_split(split_path(folder, filename))
+    elif os.path.isfile(filepath):
+        data = read_recovered(filepath, decode_tournament)
+    else:
+        data = get_archive(folder).read(filename)
+        if data is None:
+            raise FileNotFoundError(f"Aucun fichier trouvé à l’emplacement : {filepath}")
+
+    return replay_journal(upgrade_tournament(data), folder, filename)
+
+
+def _reads_split(folder: str, filename: str) -> bool:
+    """
+    Indique si le tournoi doit être lu dans son dossier "split" plutôt que dans son fichier.
+    Les deux peuvent coexister si une conversion a été interrompue : l'enregistrement
+    dans la disposition configurée est alors le plus récent.
+    """
+    if not is_split_tournament(folder, filename):
+        return False
+    return TOURNAMENT_LAYOUT == "split" or not os.path.isfile(os.path.join(folder, filename))
+
+
+def load_tournament_document(filepath: str) -> TournamentDocument:
+    """
+    Ouvre un tournoi en lecture seule sans tout désérialiser : l'en-tête et la liste
+    des joueurs sont lus immédiatement, chaque round au premier accès.
+
+    Le document s'utilise comme le dict de load_tournament_from_json. En disposition
+    "split", chaque round est lu dans son propre fichier. Le chargement est complet
+    lorsque l'index des offsets n'est pas utilisable (journal plus récent que le checkpoint,
+    sauvegarde en attente, fichier modifié par ailleurs, format binaire), lorsque le document n'est pas
+    à la version courante du schéma (migré à la lecture) ou avec un backend autre que "json".
+
+    Args:
+        filepath (str): Chemin complet du fichier .json du tournoi.
+
+    Returns:
+        TournamentDocument: Le tournoi.
+    """
+    folder, filename = os.path.split(filepath)
+    if get_repository() is None and pending_write(filepath) is None:
+        if _reads_split(folder, filename):
+            document = read_split_document(split_path(folder, filename))
+        else:
+            document = read_document(filepath) if TOURNAMENT_ENCODING == "json" else None
+        if (
+            document is not None
+            and is_current("tournament", document)
+            and get_journal(folder, filename).last_revision() <= document.get(REVISION_KEY, 0)
+        ):
+            return document
+    return TournamentDocument.from_dict(load_tournament_from_json(filepath))
+
+
+def list_tournament_files(folder: str) -> list[str]:
+    """
+    Liste (triés) les noms de fichiers des tournois enregistrés.
+
+    Args:
+        folder (str): Le dossier des tournois (backend "json").
+
+    Returns:
+        list[str]: Noms de fichiers, ex : ['OPEN_01012025.json'].
+    """
+    repository = get_repository()
+    if repository is not None:
+        return repository.list_tournaments()
+    return [entry["filename"] for entry in list_tournament_summaries(folder)]
+
+
+def list_tournament_summaries(folder: str) -> list[dict]:
+    """
+    Retourne le résumé de chaque tournoi enregistré, sans relire les fichiers de tournoi
+    (catalogue tenu à jour à chaque sauvegarde, voir storage/tournament_catalog.py).
+
+    Args:
+        folder (str): Le dossier des tournois (backend "json").
+
+    Returns:
+        list[dict]: Résumés triés par nom de fichier : filename, tournament_name, location,
+            start_date, end_date, actual_round, number_of_rounds, description, player_count,
+            size et mtime (None avec un backend autre que "json").
     """
-    if not os.path.isfile(filepath):
-        raise FileNotFoundError(f"Aucun fichier trouvé à l’emplacement : {filepath}")
+    repository = get_repository()
+    if repository is not None:
+        return repository.list_tournament_summaries()
+    return get_catalog(folder).refresh(load_tournament_from_json)
+
+
+def load_tournament_summary(folder: str, filename: str) -> dict:
+    """
+    Retourne le résumé catalogue d'un tournoi (champs d'en-tête, nombre de joueurs).
+
+    Raises:
+        FileNotFoundError: si aucun tournoi n'est enregistré sous `filename`.
+    """
+    repository = get_repository()
+    if repository is not None:
+        summaries = repository.list_tournament_summaries()
+    else:
+        summaries = [get_catalog(folder).get(filename, load_tournament_from_json)]
+    summary = next((s for s in summaries if s and s["filename"] == filename), None)
+    if summary is None:
+        raise FileNotFoundError(f"Aucun tournoi enregistré sous le nom : {filename}")
+    return summary
+
+
+def tournament_exists(folder: str, filename: str) -> bool:
+    """
+    Indique si un tournoi est déjà enregistré sous `filename`.
+    """
+    repository = get_repository()
+    if repository is not None:
+        return repository.tournament_exists(filename)
+    filepath = os.path.join(folder, filename)
+    return (
+        os.path.exists(filepath)
+        or pending_write(filepath) is not None
+        or is_split_tournament(folder, filename)
+        or filename in get_archive(folder).members()
+    )
+
+
+def stored_tournament_files(folder: str) -> List[str]:
+    """
+    Noms de fichiers (triés) des tournois enregistrés hors de l'archive, dans l'une
+    ou l'autre disposition ("file" ou "split").
+    """
+    if not os.path.isdir(folder):
+        return []
+    names = set()
+    with os.scandir(folder) as it:
+        for entry in it:
+            if entry.name.endswith(".json") and entry.is_file():
+                names.add(entry.name)
+            elif entry.is_dir() and is_split_tournament(folder, entry.name + ".json"):
+                names.add(entry.name + ".json")
+    return sorted(names)
+
+
+def iter_stored_tournaments(folder: str) -> Iterator[Tuple[str, dict]]:
+    """
+    Produit chaque tournoi enregistré par le backend "json" (fichier, dossier "split"
+    ou archive), lu comme par load_tournament_from_json (journal rejoué), même si un
+    autre backend est configuré : sert à l'import des données dans ce backend.
+
+    Args:
+        folder (str): Le dossier des tournois.
+
+    Yields:
+        tuple: (nom de fichier, données du tournoi), triés par nom de fichier.
+    """
+    if not os.path.isdir(folder):
+        return
+    filenames = set(stored_tournament_files(folder)) | set(get_archive(folder).members())
+    for filename in sorted(filenames):
+        yield filename, _read_stored_tournament(os.path.join(folder, filename))
+
+
+def _disk_usage(*paths: str) -> int:
+    """Taille totale (en octets) des fichiers et dossiers donnés qui existent."""
+    total = 0
+    for path in paths:
+        if os.path.isdir(path):
+            for root, _, names in os.walk(path):
+                total += sum(os.path.getsize(os.path.join(root, name)) for name in names)
+        elif os.path.exists(path):
+            total += os.path.getsize(path)
+    return total
+
+
+def convert_tournaments_layout(folder: str) -> List[str]:
+    """
+    Convertit vers la disposition configurée (TOURNAMENT_LAYOUT) les tournois
+    enregistrés dans l'autre disposition. Chaque tournoi est relu (journal rejoué)
+    puis sauvegardé ; l'ancien enregistrement est supprimé une fois le nouveau écrit.
+
+    Args:
+        folder (str): Le dossier des tournois (backend "json").
+
+    Returns:
+        list[str]: Noms des tournois convertis, triés.
+    """
+    if get_repository() is not None:
+        return []
+    converted = []
+    for filename in stored_tournament_files(folder):
+        if TOURNAMENT_LAYOUT == "split":
+            other = os.path.isfile(os.path.join(folder, filename))
+        else:
+            other = is_split_tournament(folder, filename)
+        if not other:
+            continue
+        data = load_tournament_from_json(os.path.join(folder, filename))
+        save_tournament_to_json(data, folder, filename)
+        converted.append(filename)
+    drain_writes()
+    return converted
+
+
+def archive_finished_tournaments(folder: str) -> dict:
+    """
+    Range les tournois terminés du dossier dans l'archive compressée (backend "json").
+
+    Chaque tournoi terminé (journal rejoué) est ajouté à l'archive ; une fois l'archive
+    durablement écrite, son fichier JSON (ou son dossier en disposition "split"), ses
+    versions précédentes, son journal, son index des offsets et son fichier verrou sont
+    supprimés. Les tournois archivés restent
+    lisibles par load_tournament_from_json.
+
+    Args:
+        folder (str): Le dossier des tournois.
+
+    Returns:
+        dict: "files" (tournois archivés, triés), "freed_bytes" (taille des fichiers
+            supprimés) et "archive_bytes" (taille de l'archive).
+    """
+    report = {"files": [], "freed_bytes": 0, "archive_bytes": 0}
+    if get_repository() is not None or not os.path.isdir(folder):
+        return report
+
+    # Les sauvegardes en attente doivent être sur disque avant d'être archivées
+    drain_writes()
+    finished = {}
+    for filename in stored_tournament_files(folder):
+        data = load_tournament_from_json(os.path.join(folder, filename))
+        if is_tournament_finished(data):
+            finished[filename] = data
 
-    with open(filepath, "r", encoding="utf-8") as file:
-        data = json.load(file)
+    archive = get_archive(folder)
+    if finished:
+        archive.pack(finished, {filename: summary_from_data(data) for filename, data in finished.items()})
+        for filename in finished:
+            filepath = os.path.join(folder, filename)
+            journal = get_journal(folder, filename)
+            paths = (
+                filepath,
+                index_path(filepath),
+                split_path(folder, filename),
+                *generation_paths(filepath, TOURNAMENT_GENERATIONS),
+            )
+            report["freed_bytes"] += _disk_usage(journal.path, *paths)
+            lock = get_tournament_lock(folder, filename)
+            report["freed_bytes"] += _disk_usage(lock.path, lock.state_path)
+            with lock.hold():
+                journal.mark_checkpoint()
+                journal.discard_through(None)
+                _remove_paths(*paths)
+                lock.discard()
+            get_write_digests().forget(_checkpoint_path(folder, filename))
+            get_serialization_cache(filepath).clear()
 
-    return data
+    signature = archive.signature()
+    report["files"] = sorted(finished)
+    report["archive_bytes"] = signature[0] if signature is not None else 0
+    return report
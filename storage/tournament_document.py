@@ -0,0 +1,281 @@
+import json
+import os
+import threading
+from collections.abc import Mapping, Sequence
+from typing import Any, Dict, Iterator, List, Optional, Tuple, Union
+
+from config import TOURNAMENT_INDEX_EXTENSION
+from storage.tournament_codec import unseal
+from storage.tournament_snapshots import ExpandedRounds
+from storage.write_behind import write_atomic
+from storage.write_digest import content_digest
+
+_INDENT = 4
+
+
+def index_path(filepath: str) -> str:
+    """
+    Chemin de l'index des offsets associé au fichier de tournoi `filepath`
+    (ex : 'OPEN_01012025.json' -> 'OPEN_01012025.idx').
+    """
+    stem, _ = os.path.splitext(filepath)
+    return stem + TOURNAMENT_INDEX_EXTENSION
+
+
+def _nested(value: Any, level: int) -> str:
+    """Sérialise `value` comme json.dumps(indent=4) le ferait à la profondeur `level`."""
+    text = json.dumps(value, ensure_ascii=False, indent=_INDENT)
+    return text.replace("\n", "\n" + " " * _INDENT * level)
+
+
+class SerializationCache:
+    """
+    Sérialisation des rounds terminés d'un tournoi (morceau JSON et empreinte), conservée
+    d'une sauvegarde à l'autre : un round terminé ne change plus (voir encode_split),
+    seuls l'en-tête et le round en cours sont resérialisés à chaque sauvegarde.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Par position : (heure de fin, morceau JSON, empreinte du morceau)
+        self._rounds: Dict[int, Tuple[str, bytes, bytes]] = {}
+
+    def round_chunk(self, index: int, rnd: Dict[str, Any]) -> Tuple[bytes, bytes]:
+        """
+        Morceau JSON (tel qu'écrit par `encode_tournament`) et empreinte du round `index`.
+
+        Args:
+            index (int): Position du round dans list_of_rounds.
+            rnd (dict): Le round sérialisé.
+
+        Returns:
+            tuple: (morceau JSON, empreinte).
+        """
+        end_time = rnd.get("end_time")
+        with self._lock:
+            cached = self._rounds.get(index)
+        if end_time and cached is not None and cached[0] == end_time:
+            return cached[1], cached[2]
+        chunk = _nested(rnd, 2).encode("utf-8")
+        digest = content_digest([chunk])
+        if end_time:
+            with self._lock:
+                self._rounds[index] = (end_time, chunk, digest)
+        return chunk, digest
+
+    def digest(self, tournament_data: Dict[str, Any], ignored: Sequence[str] = ()) -> bytes:
+        """
+        Empreinte du tournoi sérialisé : en-tête et joueurs, puis empreinte de chaque round
+        (celle des rounds terminés n'est pas recalculée).
+
+        Args:
+            tournament_data (dict): Le tournoi sérialisé.
+            ignored (sequence): Champs de premier niveau exclus de l'empreinte.
+
+        Returns:
+            bytes: L'empreinte (voir content_digest).
+        """
+        header = {k: v for k, v in tournament_data.items() if k != "list_of_rounds" and k not in ignored}
+        rounds = tournament_data.get("list_of_rounds") or []
+        parts = [json.dumps(header, ensure_ascii=False).encode("utf-8")]
+        parts.extend(self.round_chunk(i, rnd)[1] for i, rnd in enumerate(rounds))
+        return content_digest(parts)
+
+    def clear(self) -> None:
+        """Oublie les rounds sérialisés (tournoi supprimé ou archivé)."""
+        with self._lock:
+            self._rounds = {}
+
+
+_caches: Dict[str, SerializationCache] = {}
+_caches_lock = threading.Lock()
+
+
+def get_serialization_cache(filepath: str) -> SerializationCache:
+    """Retourne le cache de sérialisation (partagé dans le processus) du tournoi `filepath`."""
+    key = os.path.abspath(filepath)
+    with _caches_lock:
+        cache = _caches.get(key)
+        if cache is None:
+            cache = SerializationCache()
+            _caches[key] = cache
+        return cache
+
+
+def encode_tournament(
+    tournament_data: Dict[str, Any],
+    cache: Optional[SerializationCache] = None
+) -> Tuple[bytes, Dict[str, Any]]:
+    """
+    Sérialise un tournoi exactement comme json.dump(..., ensure_ascii=False, indent=4)
+    en relevant la position (en octets) de chaque champ de premier niveau et de chaque round.
+
+    Args:
+        tournament_data (dict): Le tournoi sérialisé.
+        cache (SerializationCache, optional): Cache des rounds terminés déjà sérialisés.
+
+    Returns:
+        tuple: (contenu du fichier, index des offsets {"fields": {...}, "rounds": [...]}).
+    """
+    chunks: List[bytes] = []
+    position = 0
+    fields: Dict[str, List[int]] = {}
+    rounds: List[List[int]] = []
+
+    def write(text: Union[str, bytes]) -> Tuple[int, int]:
+        nonlocal position
+        chunk = text.encode("utf-8") if isinstance(text, str) else text
+        chunks.append(chunk)
+        start, position = position, position + len(chunk)
+        return start, position
+
+    items = list(tournament_data.items())
+    if not items:
+        return b"{}", {"fields": fields, "rounds": rounds}
+    write("{\n")
+    for i, (key, value) in enumerate(items):
+        write(" " * _INDENT + json.dumps(key, ensure_ascii=False) + ": ")
+        if key == "list_of_rounds" and isinstance(value, list) and value:
+            start, _ = write("[\n")
+            for j, rnd in enumerate(value):
+                write(" " * _INDENT * 2)
+                rounds.append(list(write(cache.round_chunk(j, rnd)[0] if cache is not None else _nested(rnd, 2))))
+                write(",\n" if j < len(value) - 1 else "\n")
+            _, end = write(" " * _INDENT + "]")
+        else:
+            start, end = write(_nested(value, 1))
+        fields[key] = [start, end]
+        write(",\n" if i < len(items) - 1 else "\n")
+    write("}")
+    return b"".join(chunks), {"fields": fields, "rounds": rounds}
+
+
+def write_index(filepath: str, index: Dict[str, Any]) -> None:
+    """
+    Écrit l'index des offsets du fichier `filepath`, qui vient d'être écrit.
+    L'index mémorise la taille et la date de modification du fichier : s'il est
+    réécrit par un autre moyen, l'index est ignoré.
+    """
+    st = os.stat(filepath)
+    payload = {"version": 1, "size": st.st_size, "mtime_ns": st.st_mtime_ns, **index}
+    write_atomic(index_path(filepath), json.dumps(payload).encode("utf-8"))
+
+
+def _read_index(filepath: str) -> Optional[Dict[str, Any]]:
+    """Retourne l'index de `filepath` s'il existe et correspond au fichier, sinon None."""
+    try:
+        with open(index_path(filepath), "r", encoding="utf-8") as f:
+            index = json.load(f)
+        st = os.stat(filepath)
+    except (OSError, ValueError):
+        return None
+    if index.get("size") != st.st_size or index.get("mtime_ns") != st.st_mtime_ns:
+        return None
+    return index
+
+
+class LazyRounds(Sequence):
+    """
+    Liste des rounds d'un tournoi, chaque round n'étant lu et désérialisé
+    qu'au premier accès (lecture ciblée grâce à l'index des offsets).
+    """
+
+    def __init__(self, filepath: str, spans: List[List[int]]) -> None:
+        self._filepath = filepath
+        self._spans = spans
+        self._cache: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._spans)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index not in self._cache:
+            start, end = self._spans[index]
+            with open(self._filepath, "rb") as f:
+                f.seek(start)
+                self._cache[index] = json.loads(f.read(end - start))
+        return self._cache[index]
+
+
+class TournamentDocument(Mapping):
+    """
+    Vue en lecture seule d'un tournoi enregistré, utilisable comme le dict
+    retourné par load_tournament_from_json : l'en-tête et la liste des joueurs
+    sont chargés immédiatement, les rounds à la demande.
+    """
+
+    def __init__(self, header: Dict[str, Any], rounds: Sequence) -> None:
+        """
+        Args:
+            header (dict): Champs de premier niveau, hors list_of_rounds.
+            rounds (Sequence): Rounds du tournoi (ExpandedRounds ou liste).
+        """
+        self._header = header
+        self._rounds = rounds
+
+    @classmethod
+    def from_dict(cls, tournament_data: Dict[str, Any]) -> "TournamentDocument":
+        """Enveloppe un tournoi déjà entièrement chargé."""
+        header = {k: v for k, v in tournament_data.items() if k != "list_of_rounds"}
+        return cls(header, tournament_data.get("list_of_rounds", []))
+
+    def __getitem__(self, key: str) -> Any:
+        if key == "list_of_rounds":
+            return self._rounds
+        return self._header[key]
+
+    def __iter__(self) -> Iterator[str]:
+        yield from self._header
+        yield "list_of_rounds"
+
+    def __len__(self) -> int:
+        return len(self._header) + 1
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Charge tous les rounds et retourne le tournoi complet sous forme de dict."""
+        return {**self._header, "list_of_rounds": list(self._rounds)}
+
+
+def read_document(filepath: str) -> Optional[TournamentDocument]:
+    """
+    Ouvre un fichier de tournoi de façon paresseuse à l'aide de son index des offsets.
+    Sans index valide, l'index est reconstruit si le fichier est au format standard
+    et None est retourné (l'appelant charge alors le fichier entier).
+
+    Args:
+        filepath (str): Chemin du fichier JSON du tournoi.
+
+    Returns:
+        TournamentDocument | None: Le document, ou None si l'index est indisponible.
+    """
+    index = _read_index(filepath)
+    if index is None:
+        _rebuild_index(filepath)
+        return None
+    header: Dict[str, Any] = {}
+    with open(filepath, "rb") as f:
+        for key, (start, end) in index["fields"].items():
+            if key == "list_of_rounds":
+                continue
+            f.seek(start)
+            header[key] = json.loads(f.read(end - start))
+    return TournamentDocument(header, ExpandedRounds(LazyRounds(filepath, index["rounds"])))
+
+
+def _rebuild_index(filepath: str) -> None:
+    """
+    Crée l'index d'un fichier qui n'en a pas (fichier antérieur à l'index), si son
+    contenu est identique à ce que produit `encode_tournament` (somme de contrôle mise à part).
+    """
+    try:
+        with open(filepath, "rb") as f:
+            content = unseal(f.read())
+        payload, index = encode_tournament(json.loads(content))
+        if payload == content:
+            write_index(filepath, index)
+    except (OSError, ValueError):
+        return
@@ -0,0 +1,340 @@
+import json
+import os
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config import JOURNAL_EXTENSION
+from storage.tournament_lock import REVISION_KEY
+
+
+def journal_path(folder: str, filename: str) -> str:
+    """
+    Chemin du journal associé au fichier de tournoi `filename`
+    (ex : 'OPEN_01012025.json' -> 'OPEN_01012025.journal').
+    """
+    stem, _ = os.path.splitext(filename)
+    return os.path.join(folder, stem + JOURNAL_EXTENSION)
+
+
+class TournamentJournal:
+    """
+    Journal en ajout seul des modifications d'un tournoi.
+
+    Le fichier JSON du tournoi sert de point de contrôle (checkpoint) ; chaque
+    modification ultérieure est ajoutée au journal sous la forme d'un événement
+    typé d'une ligne JSON, dont la taille ne dépend pas de celle du tournoi.
+
+    Tous les événements fixent des valeurs absolues (aucun incrément) : rejouer
+    un journal sur un checkpoint qui les contient déjà donne le même état. Le début
+    du journal n'est donc supprimé qu'une fois couvert par le checkpoint durablement écrit
+    et par ses versions précédentes conservées (restaurables si le checkpoint est corrompu).
+
+    Chaque événement porte la révision de son écriture (voir storage/tournament_lock.py) :
+    les événements déjà couverts par le checkpoint, éventuellement écrit par un autre
+    processus, sont reconnus à leur révision plutôt qu'à leur position dans le fichier.
+    """
+
+    def __init__(self, folder: str, filename: str) -> None:
+        """
+        Args:
+            folder (str): Dossier des tournois.
+            filename (str): Nom du fichier JSON du tournoi.
+        """
+        self.path = journal_path(folder, filename)
+        self._lock = threading.Lock()
+        self._count: Optional[int] = None
+        # Derniers rangs journalisés, pour n'écrire que les rangs modifiés :
+        # rangs courants des joueurs, et rangs recopiés dans les snapshots du round.
+        self._live_ranks: Dict[str, int] = {}
+        self._round_ranks: Dict[str, int] = {}
+
+    def append(self, event_type: str, payload: Dict[str, Any], revision: int = 0) -> int:
+        """
+        Ajoute un événement en fin de journal (voir `append_many`).
+
+        Args:
+            event_type (str): Type d'événement (voir `_APPLY`).
+            payload (dict): Données de l'événement.
+            revision (int): Révision de l'écriture.
+
+        Returns:
+            int: Nombre d'événements dans le journal depuis le dernier checkpoint.
+        """
+        return self.append_many([(event_type, payload)], revision)
+
+    def track(self, events: List[Tuple[str, Dict[str, Any]]]) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Prépare des événements avant leur ajout : met à jour les rangs connus, ne garde
+        dans chaque événement que les rangs modifiés, et retire les événements devenus
+        sans effet (mise à jour des rangs alors qu'aucun rang n'a changé).
+
+        Args:
+            events (list): Couples (type d'événement, données), dans l'ordre.
+
+        Returns:
+            list: Les événements à écrire (éventuellement aucun).
+        """
+        for event_type, _ in events:
+            if event_type not in _APPLY:
+                raise ValueError(f"Type d'événement inconnu : {event_type!r}")
+        tracked = []
+        with self._lock:
+            for event_type, payload in events:
+                payload = self._track_ranks(event_type, payload)
+                if event_type == "ranks_updated" and not payload["ranks"]:
+                    continue
+                tracked.append((event_type, payload))
+        return tracked
+
+    def append_many(self, events: List[Tuple[str, Dict[str, Any]]], revision: int = 0) -> int:
+        """
+        Ajoute plusieurs événements (préparés par `track`) en fin de journal en une seule écriture.
+
+        Args:
+            events (list): Couples (type d'événement, données), dans l'ordre.
+            revision (int): Révision de l'écriture, commune à tous les événements.
+
+        Returns:
+            int: Nombre d'événements dans le journal depuis le dernier checkpoint.
+        """
+        for event_type, _ in events:
+            if event_type not in _APPLY:
+                raise ValueError(f"Type d'événement inconnu : {event_type!r}")
+        with self._lock:
+            if self._count is None:
+                self._count = self._repair()
+            lines = [
+                json.dumps({"rev": revision, "event": event_type, "data": payload}, ensure_ascii=False) + "\n"
+                for event_type, payload in events
+            ]
+            with open(self.path, "a", encoding="utf-8") as f:
+                f.write("".join(lines))
+            self._count += len(events)
+            return self._count
+
+    def has_events(self) -> bool:
+        """True si le journal contient des événements (éventuellement déjà couverts par le checkpoint)."""
+        with self._lock:
+            return os.path.exists(self.path) and os.path.getsize(self.path) > 0
+
+    def last_revision(self) -> int:
+        """Révision du dernier événement complet du journal (0 si le journal est vide)."""
+        with self._lock:
+            if not os.path.exists(self.path):
+                return 0
+            revision = 0
+            with open(self.path, "rb") as f:
+                for line in f:
+                    if line.endswith(b"\n"):
+                        revision = max(revision, json.loads(line).get("rev", 0))
+            return revision
+
+    def mark_checkpoint(self) -> None:
+        """
+        Signale qu'un checkpoint complet vient d'être sérialisé : le compteur d'événements
+        repart de zéro et les rangs connus sont oubliés (les événements suivants ne
+        dépendent ainsi que du journal, pas du checkpoint encore en cours d'écriture).
+        """
+        with self._lock:
+            if self._count is None:
+                self._repair()
+            self._count = 0
+            self._live_ranks = {}
+            self._round_ranks = {}
+
+    def forget_ranks(self) -> None:
+        """
+        Oublie les rangs connus : le prochain événement écrira tous ses rangs
+        (le journal a été complété par un autre processus).
+        """
+        with self._lock:
+            self._live_ranks = {}
+            self._round_ranks = {}
+
+    def discard_through(self, revision: Optional[int]) -> None:
+        """
+        Supprime les événements couverts par un checkpoint désormais écrit sur disque
+        (révision inférieure ou égale à celle du checkpoint, ou sans révision).
+        Les événements plus récents sont conservés.
+
+        Args:
+            revision (int | None): Révision du checkpoint ; None supprime tout le journal.
+        """
+        with self._lock:
+            if not os.path.exists(self.path):
+                return
+            remainder = b""
+            if revision is not None:
+                with open(self.path, "rb") as f:
+                    remainder = b"".join(
+                        line for line in f
+                        if line.endswith(b"\n") and json.loads(line).get("rev", 0) > revision
+                    )
+            if remainder:
+                tmp_path = self.path + ".tmp"
+                with open(tmp_path, "wb") as f:
+                    f.write(remainder)
+                os.replace(tmp_path, self.path)
+            else:
+                os.remove(self.path)
+
+    def _repair(self) -> int:
+        """
+        Supprime une éventuelle ligne tronquée (arrêt brutal pendant un ajout)
+        et retourne le nombre d'événements complets du journal.
+        """
+        if not os.path.exists(self.path):
+            return 0
+        with open(self.path, "r+b") as f:
+            content = f.read()
+            end = content.rfind(b"\n") + 1
+            if end != len(content):
+                f.truncate(end)
+        return content.count(b"\n", 0, end)
+
+    def _track_ranks(self, event_type: str, payload: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Met à jour les rangs connus et ne conserve, dans le champ "ranks" de
+        l'événement, que les rangs qui ont changé depuis leur dernière écriture.
+        """
+        players = payload.get("players") or ([payload["player"]] if "player" in payload else [])
+        if event_type == "round_paired":
+            self._live_ranks = {p["id_national_chess"]: p.get("rank") for p in players}
+            self._round_ranks = dict(self._live_ranks)
+            return payload
+        if "ranks" in payload:
+            known = self._round_ranks if event_type == "ranks_updated" else self._live_ranks
+            changed = {idn: rank for idn, rank in payload["ranks"].items() if known.get(idn) != rank}
+            known.update(changed)
+            self._live_ranks.update(changed)
+            payload = {**payload, "ranks": changed}
+        for p in players:
+            self._live_ranks[p["id_national_chess"]] = p.get("rank")
+        return payload
+
+
+# --------------------------------------------------------------------------- #
+# Rejeu des événements
+# --------------------------------------------------------------------------- #
+
+def _upsert_player(data: Dict[str, Any], player: Dict[str, Any]) -> None:
+    """Remplace (ou ajoute) l'entrée d'un joueur dans list_of_players."""
+    players = data.setdefault("list_of_players", [])
+    for i, p in enumerate(players):
+        if p["id_national_chess"] == player["id_national_chess"]:
+            players[i] = player
+            return
+    players.append(player)
+
+
+def _apply_tournament_updated(data: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    data.update(payload["fields"])
+
+
+def _apply_player_registered(data: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    _upsert_player(data, payload["player"])
+
+
+def _apply_round_paired(data: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    rounds = data.setdefault("list_of_rounds", [])
+    index = payload["index"]
+    if index < len(rounds):
+        rounds[index] = payload["round"]
+    else:
+        rounds.append(payload["round"])
+    data["actual_round"] = payload["actual_round"]
+    data["list_of_players"] = payload["players"]
+
+
+def _apply_ranks(data: Dict[str, Any], payload: Dict[str, Any], snapshots: bool) -> None:
+    """
+    Applique les rangs de l'événement aux joueurs du tournoi et aux matchs du round :
+    tous les matchs si les snapshots ont été rafraîchis, sinon les seuls matchs non joués
+    (sérialisés à partir des rangs courants).
+    """
+    ranks = payload.get("ranks", {})
+    if not ranks:
+        return
+    for p in data.get("list_of_players", []):
+        if p["id_national_chess"] in ranks:
+            p["rank"] = ranks[p["id_national_chess"]]
+    for m in data["list_of_rounds"][payload["round"]]["matches"]:
+        unplayed = m.get("player_2") is not None and m["player_1"].get("match_score") is None
+        if not (snapshots or unplayed):
+            continue
+        for side in ("player_1", "player_2"):
+            snap = m.get(side)
+            if snap and snap["id_national_chess"] in ranks:
+                snap["rank"] = ranks[snap["id_national_chess"]]
+
+
+def _apply_result_recorded(data: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    data["list_of_rounds"][payload["round"]]["matches"][payload["match"]] = payload["match_data"]
+    for player in payload["players"]:
+        _upsert_player(data, player)
+    _apply_ranks(data, payload, snapshots=False)
+
+
+def _apply_ranks_updated(data: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    _apply_ranks(data, payload, snapshots=True)
+
+
+def _apply_round_closed(data: Dict[str, Any], payload: Dict[str, Any]) -> None:
+    data["list_of_rounds"][payload["index"]]["end_time"] = payload["end_time"]
+    data["actual_round"] = payload["actual_round"]
+
+
+_APPLY: Dict[str, Callable[[Dict[str, Any], Dict[str, Any]], None]] = {
+    "tournament_updated": _apply_tournament_updated,
+    "player_registered": _apply_player_registered,
+    "round_paired": _apply_round_paired,
+    "result_recorded": _apply_result_recorded,
+    "ranks_updated": _apply_ranks_updated,
+    "round_closed": _apply_round_closed,
+}
+
+
+def replay_journal(tournament_data: Dict[str, Any], folder: str, filename: str) -> Dict[str, Any]:
+    """
+    Applique au checkpoint `tournament_data` les événements du journal du tournoi
+    plus récents que lui (voir REVISION_KEY).
+    Une dernière ligne tronquée (arrêt brutal pendant un ajout) est ignorée.
+
+    Args:
+        tournament_data (dict): Contenu du fichier JSON du tournoi (modifié sur place).
+        folder (str): Dossier des tournois.
+        filename (str): Nom du fichier JSON du tournoi.
+
+    Returns:
+        dict: L'état courant du tournoi.
+    """
+    path = journal_path(folder, filename)
+    if not os.path.exists(path):
+        return tournament_data
+    covered = tournament_data.get(REVISION_KEY, 0)
+    with open(path, "r", encoding="utf-8") as f:
+        for line in f:
+            if not line.endswith("\n"):
+                break
+            event = json.loads(line)
+            if covered and event.get("rev", 0) <= covered:
+                continue
+            _APPLY[event["event"]](tournament_data, event["data"])
+    return tournament_data
+
+
+_journals: Dict[str, TournamentJournal] = {}
+_journals_lock = threading.Lock()
+
+
+def get_journal(folder: str, filename: str) -> TournamentJournal:
+    """
+    Retourne le journal (partagé dans le processus) du tournoi `filename`.
+    """
+    key = os.path.abspath(journal_path(folder, filename))
+    with _journals_lock:
+        journal = _journals.get(key)
+        if journal is None:
+            journal = TournamentJournal(folder, filename)
+            _journals[key] = journal
+        return journal
@@ -0,0 +1,292 @@
+import errno
+import json
+import os
+import threading
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+from config import TOURNAMENT_GENERATIONS, TOURNAMENT_LOCK_EXTENSION, TOURNAMENT_REVISION_EXTENSION
+from storage.write_behind import write_atomic
+
+try:
+    import fcntl
+except ImportError:  # Windows : verrouillage d'une plage d'octets (msvcrt)
+    fcntl = None
+try:
+    import msvcrt
+except ImportError:
+    msvcrt = None
+
+# Octet verrouillé sous Windows : le verrou de msvcrt est impératif, il est donc pris
+# au-delà de la fin du fichier verrou (qui reste vide).
+_WINDOWS_LOCK_OFFSET = 0x7FFFFFFF
+
+# Clé de la révision dans le checkpoint d'un tournoi : les événements du journal
+# de révision inférieure ou égale y sont déjà appliqués.
+REVISION_KEY = "revision"
+
+
+def lock_path(folder: str, filename: str) -> str:
+    """
+    Chemin du fichier verrou associé au fichier de tournoi `filename`
+    (ex : 'OPEN_01012025.json' -> 'OPEN_01012025.lock').
+    """
+    stem, _ = os.path.splitext(filename)
+    return os.path.join(folder, stem + TOURNAMENT_LOCK_EXTENSION)
+
+
+def revision_path(folder: str, filename: str) -> str:
+    """
+    Chemin du fichier qui contient la révision du tournoi `filename`
+    (ex : 'OPEN_01012025.json' -> 'OPEN_01012025.revision').
+    """
+    stem, _ = os.path.splitext(filename)
+    return os.path.join(folder, stem + TOURNAMENT_REVISION_EXTENSION)
+
+
+class TournamentLock:
+    """
+    Verrou exclusif d'un tournoi, partagé entre les threads du processus et entre les
+    processus qui travaillent sur le même dossier de données, et révision du tournoi.
+
+    Dans le processus, le verrou appartient à un thread (threading.RLock) ; entre
+    processus, il est posé sur le fichier verrou (fcntl.flock, ou msvcrt.locking sous
+    Windows). Seules les écritures prennent le verrou ; les lectures n'en ont pas besoin
+    (fichiers remplacés de façon atomique, journal en ajout seul).
+
+    La révision du tournoi, incrémentée à chaque écriture (ajout au journal ou checkpoint),
+    et celles des derniers checkpoints écrits sur disque (autant que de versions conservées,
+    voir storage/tournament_recovery.py) sont enregistrées dans le fichier de révision,
+    réécrit de façon atomique. Une session compare la révision à celle de son
+    dernier enregistrement pour détecter les écritures d'un autre processus
+    (voir storage/tournament_session.py).
+
+    La révision ne doit jamais redescendre : les événements du journal dont la révision
+    ne dépasse pas celle du checkpoint sont ignorés au rejeu. Le fichier de révision
+    n'étant pas suivi par git (et pouvant manquer après un arrêt brutal), la révision
+    enregistrée dans les fichiers du tournoi (checkpoint et journal) sert de plancher :
+    elle est relue une fois par processus, et chaque fois que le fichier de révision manque.
+    """
+
+    def __init__(self, folder: str, filename: str) -> None:
+        """
+        Args:
+            folder (str): Dossier des tournois.
+            filename (str): Nom du fichier JSON du tournoi.
+        """
+        self.folder = folder
+        self.filename = filename
+        self.path = lock_path(folder, filename)
+        self.state_path = revision_path(folder, filename)
+        self._thread_lock = threading.RLock()
+        self._io_lock = threading.Lock()
+        self._file = None
+        self._depth = 0
+        self._discard = False
+        # Révision enregistrée dans les fichiers du tournoi (voir `_stored_revision`)
+        self._stored: Optional[int] = None
+
+    @contextmanager
+    def hold(self) -> Iterator[None]:
+        """
+        Prend le verrou exclusif du tournoi pour la durée du bloc (attend que l'autre
+        thread ou l'autre processus qui le tient le relâche). Réentrant pour le thread
+        qui le tient déjà. Le thread d'écriture différée le prend pour écrire un checkpoint :
+        un thread qui tient le verrou ne doit donc pas attendre la fin des écritures différées.
+        """
+        with self._thread_lock:
+            if self._depth == 0:
+                self._file = self._lock_file()
+            self._depth += 1
+            try:
+                yield
+            finally:
+                self._depth -= 1
+                if self._depth == 0:
+                    self._unlock_file()
+
+    def discard(self) -> None:
+        """
+        Supprime le fichier verrou et le fichier de révision à la sortie du bloc
+        `hold` le plus externe, qui doit être en cours : le tournoi n'est plus écrit
+        dans ce dossier (tournoi archivé).
+        """
+        with self._thread_lock:
+            if self._depth == 0:
+                raise RuntimeError("Le verrou du tournoi doit être tenu pour supprimer son fichier.")
+            self._discard = True
+
+    def _lock_file(self):
+        """
+        Ouvre et verrouille le fichier verrou. Si un autre processus l'a supprimé pendant
+        l'attente (voir `discard`), le fichier recréé à sa place est verrouillé.
+        """
+        while True:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            file = open(self.path, "a+b")
+            try:
+                _lock_exclusive(file)
+                current = os.stat(self.path)
+            except FileNotFoundError:
+                current = None
+            except BaseException:
+                file.close()
+                raise
+            opened = os.fstat(file.fileno())
+            if current is not None and (current.st_dev, current.st_ino) == (opened.st_dev, opened.st_ino):
+                return file
+            _unlock(file)
+            file.close()
+
+    def _unlock_file(self) -> None:
+        """Relâche le verrou du fichier (et le supprime si `discard` a été appelé)."""
+        file, self._file = self._file, None
+        discard, self._discard = self._discard, False
+        if discard:
+            self._stored = None
+            if os.path.exists(self.state_path):
+                os.remove(self.state_path)
+        if discard and fcntl is not None:
+            # Supprimé avant d'être déverrouillé : un processus qui attendait verrouille un
+            # fichier qui n'est plus à cet emplacement, et recommence (voir `_lock_file`).
+            os.remove(self.path)
+        _unlock(file)
+        file.close()
+        if discard and fcntl is None:
+            try:
+                os.remove(self.path)
+            except OSError:  # Windows : fichier ouvert entre-temps par un autre processus
+                pass
+
+    def _state(self) -> Optional[Dict[str, Any]]:
+        """
+        Contenu du fichier de révision ("revision", et "checkpoints" : révisions des derniers
+        checkpoints, du plus récent au plus ancien), None s'il est absent ou illisible.
+        """
+        try:
+            with open(self.state_path, "rb") as f:
+                state = json.loads(f.read())
+        except (OSError, ValueError):
+            return None
+        return state if isinstance(state, dict) else None
+
+    def _write_state(self, revision: int, checkpoints: List[int]) -> None:
+        """Réécrit le fichier de révision de façon atomique (le verrou doit être tenu)."""
+        write_atomic(self.state_path, json.dumps({"revision": revision, "checkpoints": checkpoints}).encode("utf-8"))
+
+    def _stored_revision(self, state: Optional[Dict[str, Any]]) -> int:
+        """
+        Révision enregistrée dans les fichiers du tournoi (checkpoint et journal), relue
+        au premier appel du processus et chaque fois que le fichier de révision manque.
+        """
+        if self._stored is None or state is None:
+            # Import local : storage.tournament_data dépend de ce module
+            from storage.tournament_data import stored_revision
+            self._stored = stored_revision(self.folder, self.filename)
+        return self._stored
+
+    def revision(self) -> int:
+        """Révision courante du tournoi (lecture sans verrou)."""
+        state = self._state()
+        return state.get("revision", 0) if state is not None else 0
+
+    def advance(self) -> int:
+        """
+        Incrémente la révision avant une écriture (le verrou doit être tenu). La nouvelle
+        révision dépasse aussi celle des fichiers du tournoi (voir `_stored_revision`).
+
+        Returns:
+            int: La révision de l'écriture.
+        """
+        with self._io_lock:
+            state = self._state()
+            current = state.get("revision", 0) if state is not None else 0
+            revision = max(current, self._stored_revision(state)) + 1
+            self._write_state(revision, state.get("checkpoints", []) if state is not None else [])
+            return revision
+
+    @contextmanager
+    def checkpoint_guard(self, revision: int) -> Iterator[bool]:
+        """
+        Encadre l'écriture du checkpoint de révision `revision` : le verrou est tenu
+        pendant le bloc, qui reçoit False si un checkpoint plus récent a déjà été écrit
+        (par un autre processus) ; sinon la révision du checkpoint est enregistrée.
+        """
+        with self.hold():
+            with self._io_lock:
+                checkpoints = (self._state() or {}).get("checkpoints", [])
+                proceed = not checkpoints or checkpoints[0] < revision
+            yield proceed
+            if proceed:
+                with self._io_lock:
+                    state = self._state() or {}
+                    self._write_state(
+                        max(state.get("revision", 0), revision), self._retained(revision, state.get("checkpoints", []))
+                    )
+
+    def retained_checkpoint(self, revision: int) -> Optional[int]:
+        """
+        Révision couverte par toutes les versions conservées du checkpoint de révision
+        `revision`, qui vient d'être écrit (la plus ancienne des TOURNAMENT_GENERATIONS
+        versions précédentes) : les événements du journal de révision inférieure ou égale
+        ne servent plus, même si le checkpoint est restauré depuis une version précédente.
+
+        Returns:
+            int | None: La révision, ou None si les révisions des versions précédentes
+                ne sont pas toutes connues (fichier de révision récent ou recréé).
+        """
+        with self._io_lock:
+            checkpoints = self._retained(revision, (self._state() or {}).get("checkpoints", []))
+        return checkpoints[-1] if len(checkpoints) > TOURNAMENT_GENERATIONS else None
+
+    @staticmethod
+    def _retained(revision: int, checkpoints: List[int]) -> List[int]:
+        """Révisions des versions conservées une fois le checkpoint `revision` écrit (la plus récente d'abord)."""
+        return ([revision] + [c for c in checkpoints if c < revision])[:TOURNAMENT_GENERATIONS + 1]
+
+
+def _lock_exclusive(file) -> None:
+    """Verrou exclusif (bloquant) du fichier entre processus."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_EX)
+    elif msvcrt is not None:
+        file.seek(_WINDOWS_LOCK_OFFSET)
+        while True:
+            try:
+                msvcrt.locking(file.fileno(), msvcrt.LK_LOCK, 1)
+                return
+            except OSError as e:
+                # LK_LOCK abandonne après une dizaine de secondes d'attente : on attend encore
+                if e.errno != errno.EDEADLOCK:
+                    raise
+
+
+def _unlock(file) -> None:
+    """Relâche le verrou posé par `_lock_exclusive`."""
+    if fcntl is not None:
+        fcntl.flock(file.fileno(), fcntl.LOCK_UN)
+    elif msvcrt is not None:
+        file.seek(_WINDOWS_LOCK_OFFSET)
+        msvcrt.locking(file.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+_locks: Dict[str, TournamentLock] = {}
+_locks_lock = threading.Lock()
+
+
+def get_tournament_lock(folder: str, filename: str) -> TournamentLock:
+    """
+    Retourne le verrou (partagé dans le processus) du tournoi `filename`.
+    """
+    key = os.path.abspath(lock_path(folder, filename))
+    with _locks_lock:
+        lock = _locks.get(key)
+        if lock is None:
+            lock = TournamentLock(folder, filename)
+            _locks[key] = lock
+        return lock
+
+
+def tournament_revision(folder: str, filename: str) -> int:
+    """Révision courante du tournoi `filename` (0 s'il n'a jamais été écrit sous verrou)."""
+    return get_tournament_lock(folder, filename).revision()
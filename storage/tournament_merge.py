@@ -0,0 +1,156 @@
+import datetime
+from typing import Any, Dict, List, Optional, Set, Tuple
+
+from utils.update_ranks import update_ranks
+
+# Champs d'en-tête fusionnés un à un (voir "tournament_updated")
+HEADER_FIELDS = ("tournament_name", "location", "start_date", "end_date", "number_of_rounds", "description")
+
+
+class TournamentConflictError(Exception):
+    """Modification d'un tournoi par un autre processus qui ne peut pas être fusionnée."""
+
+
+def _pairing(match_data: Dict[str, Any]) -> Tuple[str, Optional[str]]:
+    player_2 = match_data["player_2"]
+    return match_data["player_1"]["id_national_chess"], player_2["id_national_chess"] if player_2 else None
+
+
+def _local_pairing(match: Any) -> Tuple[str, Optional[str]]:
+    return match.player_1.id_national_chess, match.player_2.id_national_chess if match.player_2 else None
+
+
+def _scores(match_data: Dict[str, Any]) -> Tuple[Optional[float], Optional[float]]:
+    player_2 = match_data["player_2"]
+    return match_data["player_1"]["match_score"], player_2["match_score"] if player_2 else None
+
+
+def _local_scores(match: Any) -> Tuple[Optional[float], Optional[float]]:
+    return match.match_score_1, match.match_score_2 if match.player_2 else None
+
+
+# Modifications locales en attente : champs d'en-tête, rounds appariés, joueurs inscrits, matchs saisis
+PendingChanges = Tuple[Set[str], Set[int], Set[str], Set[Tuple[int, int]]]
+
+
+def _pending_changes(events: List[Tuple[str, Dict[str, Any]]]) -> PendingChanges:
+    """Champs d'en-tête, rounds appariés, joueurs inscrits et matchs saisis par les événements locaux."""
+    fields: Set[str] = set()
+    paired: Set[int] = set()
+    registered: Set[str] = set()
+    recorded: Set[Tuple[int, int]] = set()
+    for event_type, payload in events:
+        if event_type == "tournament_updated":
+            fields.update(payload["fields"])
+        elif event_type == "round_paired":
+            paired.add(payload["index"])
+        elif event_type == "player_registered":
+            registered.add(payload["player"]["id_national_chess"])
+        elif event_type == "result_recorded":
+            recorded.add((payload["round"], payload["match"]))
+    return fields, paired, registered, recorded
+
+
+def _check_structure(tournament: Any, remote: Dict[str, Any], paired: Set[int], registered: Set[str]) -> None:
+    """
+    Vérifie que les joueurs inscrits et les appariements enregistrés par l'autre processus
+    sont ceux du tournoi en mémoire (modifications locales en attente mises à part).
+
+    Raises:
+        TournamentConflictError: si un joueur a été inscrit ou un round apparié ailleurs.
+    """
+    local_ids = {p.id_national_chess for p in tournament.list_of_players}
+    remote_ids = {p["id_national_chess"] for p in remote["list_of_players"]}
+    if not local_ids - registered <= remote_ids <= local_ids:
+        raise TournamentConflictError("La liste des joueurs a été modifiée par un autre poste.")
+    saved_rounds = [rnd for i, rnd in enumerate(tournament.list_of_rounds) if i not in paired]
+    if len(saved_rounds) != len(remote["list_of_rounds"]):
+        raise TournamentConflictError("Un round a été apparié par un autre poste.")
+    for rnd, remote_round in zip(saved_rounds, remote["list_of_rounds"]):
+        if [_local_pairing(m) for m in rnd.matches] != [_pairing(m) for m in remote_round["matches"]]:
+            raise TournamentConflictError(f"Les appariements du {rnd.round_number} diffèrent d'un autre poste.")
+
+
+def _adopt_result(match: Any, match_data: Dict[str, Any], players: Dict[str, Any]) -> None:
+    """Reporte sur le match en mémoire le résultat enregistré par l'autre processus."""
+    match.match_score_1, match.match_score_2 = _scores(match_data)
+    match._snap1 = dict(match_data["player_1"])
+    match._snap2 = dict(match_data["player_2"])
+    winner = match_data["winner"]
+    match.winner = players.get(winner["id_national_chess"]) if isinstance(winner, dict) else None
+
+
+def merge_remote_changes(
+    tournament: Any,
+    remote: Dict[str, Any],
+    events: List[Tuple[str, Dict[str, Any]]]
+) -> int:
+    """
+    Intègre au tournoi en mémoire les modifications enregistrées par un autre processus,
+    en conservant les modifications locales pas encore écrites.
+
+    Sont fusionnés : les résultats des matchs (un match saisi de part et d'autre doit
+    avoir le même résultat), la clôture des rounds et les champs d'en-tête (un champ
+    modifié localement garde la valeur locale). L'inscription d'un joueur ou l'appariement
+    d'un round par l'autre processus ne peuvent pas être fusionnés : le tournoi doit
+    alors être rechargé.
+
+    Args:
+        tournament: L'objet Tournament en mémoire (modifié sur place).
+        remote (dict): Le tournoi enregistré (journal rejoué), voir load_tournament_from_json.
+        events (list): Événements locaux pas encore écrits (leurs données "players" et
+            "ranks" sont mises à jour avec les scores et les rangs fusionnés).
+
+    Returns:
+        int: Nombre de résultats repris de l'autre processus.
+
+    Raises:
+        TournamentConflictError: si les modifications ne peuvent pas être fusionnées.
+    """
+    fields, paired, registered, recorded = _pending_changes(events)
+    _check_structure(tournament, remote, paired, registered)
+    players = {p.id_national_chess: p for p in tournament.list_of_players}
+    remote_rounds = remote["list_of_rounds"]
+
+    adopted = 0
+    for i, remote_round in enumerate(remote_rounds):
+        rnd = tournament.list_of_rounds[i]
+        for j, (match, match_data) in enumerate(zip(rnd.matches, remote_round["matches"])):
+            if match_data["player_2"] is None or match_data["player_1"]["match_score"] is None:
+                continue
+            if _local_scores(match) == _scores(match_data):
+                continue
+            if (i, j) in recorded:
+                raise TournamentConflictError(
+                    f"Le résultat du match « {match.name} » a été saisi différemment par un autre poste."
+                )
+            _adopt_result(match, match_data, players)
+            adopted += 1
+        if remote_round["end_time"] and rnd.end_time is None:
+            rnd.end_time = datetime.datetime.strptime(remote_round["end_time"], "%d/%m/%Y %H:%M:%S")
+
+    # Scores : ceux de l'autre processus, plus les résultats locaux pas encore écrits
+    for player_data in remote["list_of_players"]:
+        players[player_data["id_national_chess"]].tournament_score = player_data["tournament_score"]
+    for i, j in recorded:
+        match = tournament.list_of_rounds[i].matches[j]
+        if i < len(remote_rounds) and _scores(remote_rounds[i]["matches"][j]) == _local_scores(match):
+            continue
+        match.player_1.tournament_score += match.match_score_1 or 0.0
+        if match.player_2:
+            match.player_2.tournament_score += match.match_score_2 or 0.0
+
+    for field in HEADER_FIELDS:
+        if field not in fields:
+            setattr(tournament, field, remote[field])
+    tournament.actual_round = max(tournament.actual_round, remote["actual_round"])
+
+    # Rangs recalculés sur les scores fusionnés, puis reportés dans les événements en attente
+    update_ranks(tournament)
+    ranks = {p.id_national_chess: p.rank for p in tournament.list_of_players}
+    for _, payload in events:
+        if "players" in payload:
+            payload["players"] = [players[p["id_national_chess"]].get_tournament_data() for p in payload["players"]]
+        if "ranks" in payload:
+            payload["ranks"] = dict(ranks)
+    return adopted
@@ -0,0 +1,45 @@
+import os
+from typing import Any, Callable
+
+from config import TOURNAMENT_GENERATIONS
+from storage.write_behind import generation_paths, write_atomic
+
+
+def read_recovered(
+    path: str,
+    decode: Callable[[bytes], Any],
+    generations: int = TOURNAMENT_GENERATIONS,
+) -> Any:
+    """
+    Lit et décode un fichier de tournoi ; s'il est corrompu (contenu illisible ou somme
+    de contrôle invalide), la version précédente valide la plus récente est restaurée
+    à sa place (voir `write_atomic`) et son contenu est retourné.
+
+    Args:
+        path (str): Chemin du fichier.
+        decode (callable): Décode le contenu du fichier ; lève ValueError s'il est invalide.
+        generations (int): Nombre de versions précédentes à examiner.
+
+    Returns:
+        Le contenu décodé.
+
+    Raises:
+        FileNotFoundError: si le fichier n'existe pas.
+        ValueError: si le fichier est corrompu et qu'aucune version précédente n'est valide.
+    """
+    with open(path, "rb") as f:
+        payload = f.read()
+    try:
+        return decode(payload)
+    except ValueError:
+        for candidate in generation_paths(path, generations):
+            try:
+                with open(candidate, "rb") as f:
+                    previous = f.read()
+                data = decode(previous)
+            except (OSError, ValueError):
+                continue
+            write_atomic(path, previous)
+            print(f"Fichier corrompu : {os.path.basename(path)}, restauré depuis {os.path.basename(candidate)}.")
+            return data
+        raise
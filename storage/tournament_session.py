@@ -0,0 +1,164 @@
+import os
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from storage.repository import get_repository
+from storage.tournament_data import load_tournament_from_json, write_tournament_events
+from storage.tournament_journal import get_journal
+from storage.tournament_lock import get_tournament_lock
+from storage.tournament_merge import merge_remote_changes
+
+
+class TournamentSession:
+    """
+    Session de persistance attachée à un tournoi (`tournament.session`).
+
+    Hors transaction, chaque événement est écrit immédiatement. Dans une transaction
+    (éventuellement imbriquée), les événements sont mis en attente et le tournoi est
+    marqué « sale » ; ils sont écrits en une seule opération à la sortie de la
+    transaction la plus externe, ou plus tôt par un appel explicite à `flush()`.
+
+    Avec le backend "json", la session retient la révision du tournoi
+    (storage/tournament_lock.py) de son dernier enregistrement. Si un autre processus
+    a écrit depuis, ses modifications sont d'abord fusionnées avec le tournoi en mémoire
+    (storage/tournament_merge.py), sous le verrou du tournoi : aucune saisie n'est perdue.
+    """
+
+    def __init__(self, tournament: Any, folder: str, filename: str, revision: Optional[int] = None) -> None:
+        """
+        Args:
+            tournament: L'objet Tournament suivi.
+            folder (str): Le dossier des tournois.
+            filename (str): Le nom du fichier JSON du tournoi.
+            revision (int, optional): Révision du tournoi lue avant son chargement
+                (par défaut, la révision courante).
+        """
+        self.tournament = tournament
+        self.folder = folder
+        self.filename = filename
+        self._pending: List[Tuple[str, Dict[str, Any]]] = []
+        self._depth = 0
+        self._lock = get_tournament_lock(folder, filename) if get_repository() is None else None
+        self.revision = 0
+        if self._lock is not None:
+            self.revision = self._lock.revision() if revision is None else revision
+        self.stats = {"events": 0, "writes": 0, "writes_avoided": 0, "merges": 0}
+
+    @property
+    def dirty(self) -> bool:
+        """True si des modifications n'ont pas encore été écrites."""
+        return bool(self._pending)
+
+    def record(self, event_type: str, payload: Dict[str, Any]) -> None:
+        """
+        Enregistre une modification du tournoi.
+
+        Args:
+            event_type (str): Type d'événement, ex : "result_recorded".
+            payload (dict): Données de l'événement.
+        """
+        self.stats["events"] += 1
+        self._pending.append((event_type, payload))
+        if self._depth == 0:
+            self.flush()
+
+    @contextmanager
+    def transaction(self) -> Iterator["TournamentSession"]:
+        """
+        Regroupe les modifications effectuées dans le bloc en une seule écriture.
+        Les transactions imbriquées sont fusionnées avec la transaction englobante.
+        """
+        self._depth += 1
+        try:
+            yield self
+        finally:
+            self._depth -= 1
+            if self._depth == 0:
+                self.flush()
+
+    def flush(self) -> None:
+        """
+        Écrit immédiatement les modifications en attente (point de sûreté,
+        par exemple avant d'attendre une action de l'utilisateur).
+        """
+        if not self._pending:
+            return
+        events, self._pending = self._pending, []
+        try:
+            if self._lock is None:
+                write_tournament_events(self.tournament, self.folder, self.filename, events)
+            else:
+                with self._lock.hold():
+                    self._merge_remote(events)
+                    write_tournament_events(self.tournament, self.folder, self.filename, events)
+                    self.revision = self._lock.revision()
+        except Exception:
+            self._pending = events + self._pending
+            raise
+        self.stats["writes"] += 1
+        self.stats["writes_avoided"] += len(events) - 1
+
+    def sync(self) -> None:
+        """
+        Intègre au tournoi en mémoire les modifications écrites par un autre processus
+        depuis le dernier enregistrement de la session (sans effet s'il n'y en a pas).
+
+        Raises:
+            TournamentConflictError: si elles ne peuvent pas être fusionnées.
+        """
+        if self._lock is None or self._lock.revision() == self.revision:
+            return
+        with self._lock.hold():
+            self._merge_remote(self._pending)
+
+    def _merge_remote(self, events: List[Tuple[str, Dict[str, Any]]]) -> None:
+        """Fusionne les écritures d'un autre processus (le verrou du tournoi doit être tenu)."""
+        revision = self._lock.revision()
+        if revision == self.revision:
+            return
+        remote = load_tournament_from_json(os.path.join(self.folder, self.filename))
+        merge_remote_changes(self.tournament, remote, events)
+        # Le journal contient des rangs écrits par l'autre processus
+        get_journal(self.folder, self.filename).forget_ranks()
+        self.revision = revision
+        self.stats["merges"] += 1
+
+
+def sync_tournament(tournament: Any) -> None:
+    """
+    Intègre les modifications écrites par un autre processus, si le tournoi possède une session.
+
+    Args:
+        tournament: L'objet Tournament (ou None).
+    """
+    session = getattr(tournament, "session", None)
+    if session is not None:
+        session.sync()
+
+
+@contextmanager
+def tournament_transaction(tournament: Any) -> Iterator[None]:
+    """
+    Ouvre une transaction sur la session du tournoi, si le tournoi en possède une.
+
+    Args:
+        tournament: L'objet Tournament (ou None).
+    """
+    session = getattr(tournament, "session", None)
+    if session is None:
+        yield
+        return
+    with session.transaction():
+        yield
+
+
+def flush_tournament(tournament: Any) -> None:
+    """
+    Écrit les modifications en attente du tournoi, s'il possède une session.
+
+    Args:
+        tournament: L'objet Tournament (ou None).
+    """
+    session = getattr(tournament, "session", None)
+    if session is not None:
+        session.flush()
@@ -0,0 +1,195 @@
+from collections.abc import Sequence
+from typing import Any, Dict, Iterator, List, Tuple
+
+# Adversaire inscrit dans played_with pour un tour de repos (voir Round._create_bye)
+BYE_OPPONENT = "tour de repos"
+
+# Champs d'un snapshot de match, dans l'ordre de Match.snapshot() ; les champs cumulés
+# (score du tournoi, historique des adversaires) se déduisent des rounds précédents.
+SNAPSHOT_FIELDS = ("id_national_chess", "match_score", "tournament_score", "rank", "color", "played_with")
+CUMULATIVE_FIELDS = ("tournament_score", "played_with")
+
+
+def _same(value: Any, expected: Any) -> bool:
+    """Égalité stricte (un entier n'est pas remplacé par le flottant de même valeur)."""
+    return type(value) is type(expected) and value == expected
+
+
+def _points(snap: Dict[str, Any]) -> float:
+    """Score du match d'un snapshot (0 s'il n'est pas encore joué)."""
+    score = snap.get("match_score")
+    return score if isinstance(score, (int, float)) and not isinstance(score, bool) else 0.0
+
+
+def _matches(rnd: Dict[str, Any]) -> List[Any]:
+    """Matchs d'un round (liste vide si le round n'en a pas)."""
+    matches = rnd.get("matches")
+    return matches if isinstance(matches, list) else []
+
+
+def _snapshot(match: Any, side: str) -> Any:
+    """Snapshot d'un côté du match s'il a la forme attendue, sinon None."""
+    snap = match.get(side) if isinstance(match, dict) else None
+    return snap if isinstance(snap, dict) and isinstance(snap.get("id_national_chess"), str) else None
+
+
+def _snapshots(rnd: Dict[str, Any]) -> Iterator[Tuple[Dict[str, Any], str, Dict[str, Any]]]:
+    """(match, côté, snapshot) de chaque snapshot du round au format attendu."""
+    for match in _matches(rnd):
+        for side in ("player_1", "player_2"):
+            snap = _snapshot(match, side)
+            if snap is not None:
+                yield match, side, snap
+
+
+class SnapshotHistory:
+    """
+    Score cumulé et historique des adversaires de chaque joueur, rejoués round par round.
+
+    Un snapshot de match enregistre, en plus du résultat du match, le score du tournoi
+    et la liste complète des adversaires du joueur : chaque round recopie tout
+    l'historique, et la taille du fichier croît comme le carré du nombre de rounds.
+    Le document enregistré ne garde que la partie propre au match (adversaire, couleur,
+    score du match, rang) ; les champs cumulés sont reconstruits à la lecture en un seul
+    passage sur les rounds, dans l'ordre.
+
+    Un champ cumulé qui ne correspond pas à l'historique rejoué (snapshot initialisé
+    avant le match, document ancien ou modifié à la main) est conservé tel quel :
+    le document relu est toujours identique au document enregistré.
+    """
+
+    def __init__(self) -> None:
+        self._scores: Dict[str, float] = {}
+        self._played: Dict[str, List[str]] = {}
+
+    def _pair(self, rnd: Dict[str, Any]) -> None:
+        """Ajoute les adversaires du round (tous les appariements sont faits au début du round)."""
+        for match in _matches(rnd):
+            snap_1, snap_2 = _snapshot(match, "player_1"), _snapshot(match, "player_2")
+            if snap_1 is None:
+                continue
+            id_1 = snap_1["id_national_chess"]
+            id_2 = snap_2["id_national_chess"] if snap_2 is not None else BYE_OPPONENT
+            self._played.setdefault(id_1, []).append(id_2)
+            if snap_2 is not None:
+                self._played.setdefault(id_2, []).append(id_1)
+
+    def _expected(self, snap: Dict[str, Any]) -> Dict[str, Any]:
+        """Champs cumulés attendus pour un snapshot du round en cours."""
+        idn = snap["id_national_chess"]
+        return {
+            "tournament_score": self._scores.get(idn, 0.0) + _points(snap),
+            "played_with": self._played.get(idn, []),
+        }
+
+    def _close(self, rnd: Dict[str, Any]) -> None:
+        """Ajoute les scores des matchs du round aux scores cumulés."""
+        for _, _, snap in _snapshots(rnd):
+            idn = snap["id_national_chess"]
+            self._scores[idn] = self._scores.get(idn, 0.0) + _points(snap)
+
+    def normalize(self, rnd: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Retourne une copie du round suivant dont les snapshots n'ont plus les champs
+        cumulés déductibles des rounds précédents (le round d'origine n'est pas modifié).
+        """
+        if not isinstance(rnd, dict):
+            return rnd
+        self._pair(rnd)
+        matches = [dict(match) if isinstance(match, dict) else match for match in _matches(rnd)]
+        normalized = {**rnd, "matches": matches} if isinstance(rnd.get("matches"), list) else dict(rnd)
+        for match, side, snap in _snapshots(normalized):
+            expected = self._expected(snap)
+            match[side] = {
+                key: value for key, value in snap.items()
+                if key not in expected or not _same(value, expected[key])
+            }
+        self._close(rnd)
+        return normalized
+
+    def expand(self, rnd: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Complète sur place les champs cumulés absents des snapshots du round suivant.
+
+        Returns:
+            dict: Le round (le même objet).
+        """
+        if not isinstance(rnd, dict):
+            return rnd
+        self._pair(rnd)
+        for match, side, snap in _snapshots(rnd):
+            if all(key in snap for key in CUMULATIVE_FIELDS):
+                continue
+            derived = self._expected(snap)
+            derived["played_with"] = list(derived["played_with"])
+            full = {key: snap.get(key, derived.get(key)) for key in SNAPSHOT_FIELDS if key in snap or key in derived}
+            full.update(snap)
+            match[side] = full
+        self._close(rnd)
+        return rnd
+
+
+def normalize_snapshots(tournament_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Forme enregistrée d'un tournoi : copie dont les snapshots des matchs ne gardent
+    que leurs champs propres (voir SnapshotHistory). Le tournoi d'origine n'est pas modifié.
+
+    Args:
+        tournament_data (dict): Le tournoi sérialisé.
+
+    Returns:
+        dict: Le tournoi à enregistrer.
+    """
+    rounds = tournament_data.get("list_of_rounds")
+    if not isinstance(rounds, list):
+        return tournament_data
+    history = SnapshotHistory()
+    return {**tournament_data, "list_of_rounds": [history.normalize(rnd) for rnd in rounds]}
+
+
+def expand_snapshots(tournament_data: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Reconstruit sur place les champs cumulés des snapshots d'un tournoi relu
+    (sans effet sur un document enregistré sous sa forme complète).
+
+    Args:
+        tournament_data (dict): Le tournoi relu.
+
+    Returns:
+        dict: Le tournoi complet (le même objet).
+    """
+    rounds = tournament_data.get("list_of_rounds") if isinstance(tournament_data, dict) else None
+    if isinstance(rounds, list):
+        history = SnapshotHistory()
+        for rnd in rounds:
+            history.expand(rnd)
+    return tournament_data
+
+
+class ExpandedRounds(Sequence):
+    """
+    Rounds relus à la demande (voir LazyRounds, SplitRounds) dont les snapshots sont
+    complétés au premier accès : lire le round N relit d'abord les rounds précédents.
+    """
+
+    def __init__(self, rounds: Sequence) -> None:
+        """
+        Args:
+            rounds (Sequence): Rounds enregistrés, mis en cache par la séquence au premier accès.
+        """
+        self._rounds = rounds
+        self._history = SnapshotHistory()
+        self._expanded = 0
+
+    def __len__(self) -> int:
+        return len(self._rounds)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        while self._expanded <= index:
+            self._history.expand(self._rounds[self._expanded])
+            self._expanded += 1
+        return self._rounds[index]
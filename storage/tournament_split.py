@@ -0,0 +1,184 @@
+import json
+import os
+from collections.abc import Sequence
+from typing import Any, Dict, List, Optional
+
+from config import TOURNAMENT_GENERATIONS
+from storage.tournament_codec import seal, unseal
+from storage.tournament_document import TournamentDocument
+from storage.tournament_snapshots import ExpandedRounds, expand_snapshots
+from storage.tournament_recovery import read_recovered
+from storage.write_behind import pending_write, write_atomic
+
+# Fichiers d'un tournoi en disposition "split" (un dossier par tournoi)
+SPLIT_HEADER = "tournament.json"
+SPLIT_OPEN_ROUND = "open_round.json"
+_CLOSED_ROUND = "round_{:03d}.json"
+
+
+def split_path(folder: str, filename: str) -> str:
+    """
+    Dossier d'un tournoi en disposition "split"
+    (ex : 'OPEN_01012025.json' -> 'OPEN_01012025/').
+    """
+    stem, _ = os.path.splitext(filename)
+    return os.path.join(folder, stem)
+
+
+def split_header_path(folder: str, filename: str) -> str:
+    """Fichier d'en-tête d'un tournoi en disposition "split" (réécrit à chaque sauvegarde)."""
+    return os.path.join(split_path(folder, filename), SPLIT_HEADER)
+
+
+def is_split_tournament(folder: str, filename: str) -> bool:
+    """Indique si le tournoi `filename` est enregistré (ou en attente d'écriture) en disposition "split"."""
+    header = split_header_path(folder, filename)
+    return pending_write(header) is not None or os.path.isfile(header)
+
+
+def _dumps(value: Any) -> bytes:
+    """Contenu d'un fichier du tournoi, avec sa somme de contrôle (voir `seal`)."""
+    return seal(json.dumps(value, ensure_ascii=False, indent=4).encode("utf-8"))
+
+
+def _decode(payload: bytes) -> Any:
+    return json.loads(unseal(payload))
+
+
+def _read(path: str) -> Any:
+    """
+    Contenu décodé de `path` (version en attente d'écriture comprise). Un fichier
+    corrompu est remplacé par sa version précédente valide (voir `read_recovered`).
+
+    Raises:
+        FileNotFoundError: si le fichier n'existe pas.
+    """
+    pending = pending_write(path)
+    if pending is not None:
+        return _decode(pending)
+    return read_recovered(path, _decode)
+
+
+def encode_split(tournament_data: Dict[str, Any], directory: str) -> Dict[str, bytes]:
+    """
+    Prépare les fichiers à écrire pour sauvegarder un tournoi en disposition "split" :
+      - `tournament.json` : champs d'en-tête et liste des joueurs ;
+      - `round_NNN.json` : un fichier par round terminé, écrit une seule fois
+        (un round terminé ne change plus) ;
+      - `open_round.json` : le round en cours (null s'il n'y en a pas).
+
+    Args:
+        tournament_data (dict): Le tournoi sérialisé.
+        directory (str): Dossier du tournoi (voir `split_path`).
+
+    Returns:
+        dict: Contenu de chaque fichier à (ré)écrire, par nom.
+    """
+    rounds = tournament_data.get("list_of_rounds", [])
+    files = {SPLIT_HEADER: _dumps({k: v for k, v in tournament_data.items() if k != "list_of_rounds"})}
+    open_round = None
+    for number, rnd in enumerate(rounds, start=1):
+        name = _CLOSED_ROUND.format(number)
+        if rnd.get("end_time"):
+            path = os.path.join(directory, name)
+            if pending_write(path) is None and not os.path.isfile(path):
+                files[name] = _dumps(rnd)
+        elif number == len(rounds):
+            open_round = rnd
+        else:
+            # Round non terminé qui n'est pas le dernier : toujours réécrit
+            files[name] = _dumps(rnd)
+    files[SPLIT_OPEN_ROUND] = _dumps(open_round)
+    return files
+
+
+def rewrite_split(tournament_data: Dict[str, Any], directory: str) -> None:
+    """
+    Réécrit tous les fichiers d'un tournoi en disposition "split" déjà enregistré
+    (ex : migration de schéma), chacun de façon atomique : les rounds d'abord, l'en-tête
+    en dernier. Si la réécriture est interrompue, l'en-tête garde son ancien contenu.
+
+    Args:
+        tournament_data (dict): Le tournoi complet (mêmes rounds que sur le disque).
+        directory (str): Dossier du tournoi.
+    """
+    for path, rnd in zip(_round_paths(directory), tournament_data.get("list_of_rounds", [])):
+        write_atomic(path, _dumps(rnd), TOURNAMENT_GENERATIONS)
+    header = {k: v for k, v in tournament_data.items() if k != "list_of_rounds"}
+    write_atomic(os.path.join(directory, SPLIT_HEADER), _dumps(header), TOURNAMENT_GENERATIONS)
+
+
+def _round_paths(directory: str) -> List[str]:
+    """Chemins des fichiers de rounds d'un tournoi, dans l'ordre (round en cours compris)."""
+    paths = []
+    number = 1
+    while True:
+        path = os.path.join(directory, _CLOSED_ROUND.format(number))
+        if pending_write(path) is None and not os.path.isfile(path):
+            break
+        paths.append(path)
+        number += 1
+    try:
+        open_round: Optional[Dict[str, Any]] = _read(os.path.join(directory, SPLIT_OPEN_ROUND))
+    except FileNotFoundError:
+        open_round = None
+    if open_round is not None:
+        paths.append(os.path.join(directory, SPLIT_OPEN_ROUND))
+    return paths
+
+
+def _read_header(directory: str) -> Dict[str, Any]:
+    try:
+        return _read(os.path.join(directory, SPLIT_HEADER))
+    except FileNotFoundError:
+        raise FileNotFoundError(f"Aucun tournoi trouvé dans le dossier : {directory}") from None
+
+
+def read_split(directory: str) -> Dict[str, Any]:
+    """
+    Assemble un tournoi enregistré en disposition "split".
+
+    Args:
+        directory (str): Dossier du tournoi.
+
+    Returns:
+        dict: Le tournoi, tel que retourné par Tournament.get_serialized_tournament().
+
+    Raises:
+        FileNotFoundError: si le dossier ne contient pas de tournoi.
+    """
+    data = _read_header(directory)
+    data["list_of_rounds"] = [_read(path) for path in _round_paths(directory)]
+    return expand_snapshots(data)
+
+
+class SplitRounds(Sequence):
+    """
+    Rounds d'un tournoi en disposition "split", chaque fichier de round
+    n'étant lu qu'au premier accès.
+    """
+
+    def __init__(self, paths: List[str]) -> None:
+        self._paths = paths
+        self._cache: Dict[int, Dict[str, Any]] = {}
+
+    def __len__(self) -> int:
+        return len(self._paths)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        if index not in self._cache:
+            self._cache[index] = _read(self._paths[index])
+        return self._cache[index]
+
+
+def read_split_document(directory: str) -> TournamentDocument:
+    """
+    Ouvre un tournoi en disposition "split" de façon paresseuse :
+    l'en-tête est lu immédiatement, chaque round au premier accès
+    (snapshots complétés, voir ExpandedRounds).
+    """
+    return TournamentDocument(_read_header(directory), ExpandedRounds(SplitRounds(_round_paths(directory))))
@@ -0,0 +1,254 @@
+import os
+import queue
+import shutil
+import threading
+from contextlib import nullcontext
+from typing import Callable, ContextManager, Dict, Iterable, List, Optional, Tuple, Union
+
+from config import WRITE_BEHIND_QUEUE_SIZE
+
+# Contexte d'une écriture différée (ex : verrou entre processus), entré par le thread
+# d'écriture autour de l'écriture et de `on_written` ; il indique si l'écriture doit avoir lieu.
+WriteGuard = Callable[[], ContextManager[bool]]
+
+
+def generation_paths(path: str, generations: int) -> List[str]:
+    """
+    Chemins des versions précédentes de `path`, de la plus récente à la plus ancienne
+    (ex : 'OPEN.json' -> ['OPEN.json.1', 'OPEN.json.2', ...]).
+    """
+    return [f"{path}.{n}" for n in range(1, generations + 1)]
+
+
+def _rotate_generations(path: str, generations: int) -> None:
+    """
+    Décale les versions précédentes de `path` d'un cran (la plus ancienne est remplacée)
+    et fait de la version actuelle la génération 1, par un lien physique (sans copie) :
+    le os.replace qui suit remplace le nom `path`, pas le contenu de la génération.
+    """
+    if generations <= 0 or not os.path.exists(path):
+        return
+    paths = generation_paths(path, generations)
+    for older, newer in zip(reversed(paths[:-1]), reversed(paths[1:])):
+        if os.path.exists(older):
+            os.replace(older, newer)
+    if os.path.exists(paths[0]):
+        os.remove(paths[0])
+    try:
+        os.link(path, paths[0])
+    except OSError:
+        # Système de fichiers sans liens physiques
+        shutil.copy2(path, paths[0])
+
+
+def fsync_directory(directory: str) -> None:
+    """Rend durables les créations et renommages qui viennent d'avoir lieu dans `directory` (POSIX)."""
+    try:
+        fd = os.open(directory or ".", os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+def write_atomic(path: str, payload: Union[bytes, Iterable[bytes]], generations: int = 0) -> None:
+    """
+    Écrit `payload` dans `path` sans jamais laisser un fichier partiellement écrit :
+    écriture dans un fichier temporaire du même dossier, fsync, puis os.replace.
+
+    Args:
+        path (str): Chemin du fichier à (ré)écrire.
+        payload (bytes | Iterable[bytes]): Contenu complet du fichier, ou ses morceaux
+            successifs (écrits au fur et à mesure, sans être réunis en mémoire).
+        generations (int): Nombre de versions précédentes conservées à côté du fichier
+            (voir `generation_paths`) ; le renommage est alors aussi rendu durable
+            (fsync du dossier).
+    """
+    tmp_path = f"{path}.{os.getpid()}.tmp"
+    try:
+        with open(tmp_path, "wb") as f:
+            if isinstance(payload, bytes):
+                f.write(payload)
+            else:
+                for chunk in payload:
+                    f.write(chunk)
+            f.flush()
+            os.fsync(f.fileno())
+        _rotate_generations(path, generations)
+        os.replace(tmp_path, path)
+        if generations > 0:
+            fsync_directory(os.path.dirname(path))
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def write_files(directory: str, files: Dict[str, bytes], generations: int = 0) -> None:
+    """Écrit chaque fichier d'un groupe (de façon atomique, voir `write_atomic`)."""
+    os.makedirs(directory, exist_ok=True)
+    for name, payload in files.items():
+        write_atomic(os.path.join(directory, name), payload, generations)
+
+
+class WriteBehindSaver:
+    """
+    Thread d'écriture différée des fichiers de tournoi.
+
+    Les sauvegardes sont déposées (déjà sérialisées) dans une file bornée ; si une
+    version plus récente du même fichier arrive avant son écriture, elle remplace
+    l'ancienne, qui n'est jamais écrite. Chaque écriture est atomique (`write_atomic`).
+    """
+
+    def __init__(self, maxsize: int = WRITE_BEHIND_QUEUE_SIZE) -> None:
+        """
+        Args:
+            maxsize (int): Nombre maximal de fichiers distincts en attente ;
+                au-delà, `submit` bloque jusqu'à ce qu'une écriture se termine.
+        """
+        self._queue: "queue.Queue[str]" = queue.Queue(maxsize=maxsize)
+        self._lock = threading.Lock()
+        # Dernière version en attente (ou en cours d'écriture) de chaque fichier
+        # (groupes de fichiers : contenu de chaque fichier par nom)
+        # avec son rappel, le nombre de versions précédentes à conserver (voir `write_atomic`)
+        # et son contexte d'écriture
+        self._pending: Dict[
+            str, Tuple[Union[bytes, Dict[str, bytes]], Optional[Callable[[], None]], int, Optional[WriteGuard]]
+        ] = {}
+        self._inflight: Dict[str, Union[bytes, Dict[str, bytes]]] = {}
+        self._error: Optional[BaseException] = None
+        self._thread = threading.Thread(target=self._run, name="write-behind", daemon=True)
+        self._thread.start()
+
+    def submit(
+        self,
+        path: str,
+        payload: bytes,
+        on_written: Optional[Callable[[], None]] = None,
+        generations: int = 0,
+        guard: Optional[WriteGuard] = None
+    ) -> None:
+        """
+        Programme l'écriture de `payload` dans `path`.
+
+        Args:
+            path (str): Chemin du fichier.
+            payload (bytes): Contenu complet du fichier.
+            on_written (callable, optional): Appelé dans le thread d'écriture
+                une fois le fichier durablement remplacé.
+            generations (int): Nombre de versions précédentes conservées (voir `write_atomic`).
+            guard (callable, optional): Contexte de l'écriture (voir WriteGuard) ;
+                si sa valeur est False, l'écriture et `on_written` sont abandonnés.
+        """
+        with self._lock:
+            collapsed = path in self._pending
+            self._pending[path] = (payload, on_written, generations, guard)
+        if not collapsed:
+            self._queue.put(path)
+
+    def submit_files(
+        self,
+        directory: str,
+        files: Dict[str, bytes],
+        on_written: Optional[Callable[[], None]] = None,
+        generations: int = 0,
+        guard: Optional[WriteGuard] = None
+    ) -> None:
+        """
+        Programme l'écriture d'un groupe de fichiers d'un même dossier, écrits ensemble
+        (chacun de façon atomique) avant l'appel de `on_written`.
+        Si un groupe du même dossier est déjà en attente, les deux sont fusionnés :
+        aucun fichier de l'ancien groupe n'est perdu.
+
+        Args:
+            directory (str): Dossier des fichiers.
+            files (dict): Contenu de chaque fichier, par nom.
+            on_written (callable, optional): Appelé une fois tout le groupe écrit.
+            generations (int): Nombre de versions précédentes conservées de chaque fichier.
+            guard (callable, optional): Contexte de l'écriture du groupe (voir `submit`).
+        """
+        with self._lock:
+            collapsed = directory in self._pending
+            merged = dict(self._pending[directory][0]) if collapsed else {}
+            merged.update(files)
+            self._pending[directory] = (merged, on_written, generations, guard)
+        if not collapsed:
+            self._queue.put(directory)
+
+    def pending(self, path: str) -> Optional[bytes]:
+        """
+        Retourne la version de `path` pas encore écrite sur disque, ou None.
+        Permet aux lectures de voir les sauvegardes encore en attente.
+        """
+        directory, name = os.path.split(path)
+        with self._lock:
+            for key in (path, directory):
+                payload = self._pending[key][0] if key in self._pending else self._inflight.get(key)
+                if isinstance(payload, dict):
+                    payload = payload.get(name)
+                if payload is not None:
+                    return payload
+            return None
+
+    def drain(self) -> None:
+        """
+        Attend que toutes les écritures en attente soient terminées.
+
+        Raises:
+            OSError: si une écriture différée a échoué.
+        """
+        self._queue.join()
+        error, self._error = self._error, None
+        if error is not None:
+            raise OSError(f"Échec d'une sauvegarde différée : {error}") from error
+
+    def _run(self) -> None:
+        """Boucle du thread : écrit les fichiers dans l'ordre de leur première demande."""
+        while True:
+            path = self._queue.get()
+            with self._lock:
+                payload, on_written, generations, guard = self._pending.pop(path)
+                self._inflight[path] = payload
+            try:
+                with guard() if guard is not None else nullcontext(True) as proceed:
+                    if proceed:
+                        if isinstance(payload, dict):
+                            write_files(path, payload, generations)
+                        else:
+                            write_atomic(path, payload, generations)
+                        if on_written is not None:
+                            on_written()
+            except Exception as e:
+                self._error = e
+            finally:
+                with self._lock:
+                    self._inflight.pop(path, None)
+                self._queue.task_done()
+
+
+_saver: Optional[WriteBehindSaver] = None
+_saver_lock = threading.Lock()
+
+
+def get_saver() -> WriteBehindSaver:
+    """Retourne le thread d'écriture différée du processus (démarré au premier appel)."""
+    global _saver
+    with _saver_lock:
+        if _saver is None:
+            _saver = WriteBehindSaver()
+        return _saver
+
+
+def pending_write(path: str) -> Optional[bytes]:
+    """Contenu en attente d'écriture pour `path`, ou None."""
+    return _saver.pending(path) if _saver is not None else None
+
+
+def drain_writes() -> None:
+    """Attend la fin de toutes les écritures différées (à appeler avant de quitter)."""
+    if _saver is not None:
+        _saver.drain()
@@ -0,0 +1,121 @@
+import hashlib
+import os
+import threading
+from typing import Any, Dict, Hashable, Iterable, Optional, Tuple
+
+from storage.write_behind import pending_write
+
+# Taille (en octets) des empreintes blake2b
+DIGEST_SIZE = 16
+
+
+def content_digest(chunks: Iterable[bytes]) -> bytes:
+    """
+    Empreinte blake2b calculée au fil des morceaux d'un contenu (sans les réunir en mémoire).
+
+    Args:
+        chunks (Iterable[bytes]): Morceaux successifs du contenu.
+
+    Returns:
+        bytes: L'empreinte (DIGEST_SIZE octets).
+    """
+    digest = hashlib.blake2b(digest_size=DIGEST_SIZE)
+    for chunk in chunks:
+        digest.update(chunk)
+    return digest.digest()
+
+
+def _signature(path: str) -> Optional[Tuple[int, int, int]]:
+    """(inode, taille, date de modification en ns) du fichier, ou None s'il n'existe pas."""
+    try:
+        st = os.stat(path)
+    except OSError:
+        return None
+    return st.st_ino, st.st_size, st.st_mtime_ns
+
+
+class WriteDigests:
+    """
+    Empreinte de la dernière sérialisation écrite par le processus pour chaque fichier,
+    pour ne pas réécrire un contenu identique à celui qui est déjà sur disque.
+
+    L'empreinte n'est valable que tant que le fichier n'a pas été modifié par ailleurs :
+    la signature du fichier (inode, taille, date de modification) relevée après
+    l'écriture doit être inchangée. Une écriture encore en attente (écriture différée)
+    est tenue pour acquise tant qu'elle est dans la file.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        # Par chemin : (empreinte, version, signature du fichier écrit ou None si l'écriture est en attente)
+        self._entries: Dict[str, Tuple[bytes, Hashable, Optional[Tuple[int, int, int]]]] = {}
+        self.stats = {"written": 0, "skipped": 0}
+
+    def unchanged(self, path: str, digest: bytes, version: Hashable = None) -> bool:
+        """
+        Indique si `path` contient déjà la sérialisation d'empreinte `digest` (l'écriture
+        évitée est alors comptée).
+
+        Args:
+            path (str): Chemin du fichier.
+            digest (bytes): Empreinte du contenu à écrire (voir `content_digest`).
+            version (hashable): Valeur qui doit aussi être celle de la dernière écriture
+                (ex : révision du tournoi).
+
+        Returns:
+            bool: True si l'écriture peut être évitée.
+        """
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is None or entry[:2] != (digest, version):
+                return False
+            signature = entry[2]
+            if signature is None:
+                same = pending_write(path) is not None
+            else:
+                same = _signature(path) == signature
+            if same:
+                self.stats["skipped"] += 1
+            return same
+
+    def expect(self, path: str, digest: bytes, version: Hashable = None) -> None:
+        """
+        Enregistre l'empreinte d'un contenu sur le point d'être écrit dans `path`
+        (appeler `written` une fois le fichier écrit).
+        """
+        with self._lock:
+            self._entries[path] = (digest, version, None)
+            self.stats["written"] += 1
+
+    def written(self, path: str) -> None:
+        """Relève la signature de `path` après l'écriture annoncée par `expect`."""
+        with self._lock:
+            entry = self._entries.get(path)
+            if entry is not None:
+                self._entries[path] = (entry[0], entry[1], _signature(path))
+
+    def count_skipped(self) -> None:
+        """Compte une écriture évitée sans passer par une empreinte (ex : événement sans effet)."""
+        with self._lock:
+            self.stats["skipped"] += 1
+
+    def forget(self, path: str) -> None:
+        """Oublie l'empreinte de `path` (fichier supprimé ou écrit sans empreinte)."""
+        with self._lock:
+            self._entries.pop(path, None)
+
+
+_digests = WriteDigests()
+
+
+def get_write_digests() -> WriteDigests:
+    """Retourne le registre des empreintes (partagé dans le processus)."""
+    return _digests
+
+
+def write_stats() -> Dict[str, Any]:
+    """
+    Compteurs des écritures de fichiers suivies par empreinte depuis le lancement :
+    "written" (écritures effectuées) et "skipped" (écritures évitées, contenu inchangé).
+    """
+    return dict(_digests.stats)
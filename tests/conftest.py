@@ -0,0 +1,89 @@
+import itertools
+import random
+
+import pytest
+
+import controllers.match_controller as match_controller
+import controllers.round_controller as round_controller
+import storage.tournament_data as tournament_data
+from config import PLAYERS_FOLDER, TOURNAMENTS_FOLDER
+from controllers.round_controller import RoundController
+from models.player_model import Player
+from models.tournament_model import Tournament
+from storage.player_data import save_players
+from storage.tournament_data import save_tournament_to_json
+from storage.tournament_session import TournamentSession
+from storage.write_behind import drain_writes
+from views.match_view import MatchView
+from views.round_view import RoundView
+from views.tournament_view import TournamentView
+
+
+@pytest.fixture
+def data_dir(tmp_path, monkeypatch):
+    """
+    Dossier de travail vide pour les dossiers de données (chemins relatifs de config.py),
+    avec des sauvegardes de tournoi synchrones. Les écritures différées restantes
+    (catalogue, joueurs) sont terminées avant de quitter ce dossier.
+    """
+    monkeypatch.chdir(tmp_path)
+    monkeypatch.setattr(tournament_data, "WRITE_BEHIND", False)
+    yield tmp_path
+    drain_writes()
+
+
+def player_ids(count):
+    """IDN distincts et triés : AA00001, AA00002, ..."""
+    return [f"AA{number:05d}" for number in range(1, count + 1)]
+
+
+@pytest.fixture
+def play_tournament(data_dir, monkeypatch):
+    """
+    Joue un tournoi par les contrôleurs (résultats tirés au hasard, sans saisie) :
+    chaque appariement, résultat et clôture de round est journalisé.
+
+    Returns:
+        callable: play(filename, players=6, rounds=3, seed=1, stop_after=None) -> Tournament ;
+            `stop_after` arrête le tournoi après ce nombre de matchs joués.
+    """
+    for module in (match_controller, round_controller):
+        monkeypatch.setattr(module, "wait_for_enter", lambda *args: None)
+    for view, name in (
+        (MatchView, "show_match_results"),
+        (RoundView, "show_start_round"),
+        (RoundView, "show_round_report"),
+        (RoundView, "show_intermediate_ranking"),
+        (TournamentView, "show_tournament_summary"),
+    ):
+        monkeypatch.setattr(view, name, staticmethod(lambda *args: None))
+
+    class Stop(Exception):
+        pass
+
+    def play(filename, players=6, rounds=3, seed=1, stop_after=None):
+        random.seed(seed)
+        rng = random.Random(seed)
+        played = itertools.count(1)
+
+        def ask_match_result(match):
+            if stop_after is not None and next(played) > stop_after:
+                raise Stop
+            return rng.choice([1, 2, 3])
+
+        monkeypatch.setattr(MatchView, "ask_match_result", staticmethod(ask_match_result))
+        profiles = [Player(idn, "Prénom", f"Nom{idn[-2:]}", "01/01/2000") for idn in player_ids(players)]
+        save_players([p.get_serialized_player() for p in profiles], PLAYERS_FOLDER)
+        tournament = Tournament(
+            "OPEN", "PARIS", "01/01/2025", "02/01/2025",
+            number_of_rounds=rounds, list_of_players=profiles, description="Test",
+        )
+        save_tournament_to_json(tournament.get_serialized_tournament(), TOURNAMENTS_FOLDER, filename)
+        tournament.session = TournamentSession(tournament, TOURNAMENTS_FOLDER, filename)
+        try:
+            RoundController.run(tournament, filename)
+        except Stop:
+            pass
+        return tournament
+
+    return play
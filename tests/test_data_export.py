@@ -0,0 +1,53 @@
+import csv
+import io
+import json
+
+import pytest
+
+from config import PLAYERS_FOLDER, TOURNAMENTS_FOLDER
+from storage.data_export import (
+    GAME_EXPORT_FIELDS,
+    PLAYER_EXPORT_FIELDS,
+    export_rows,
+    iter_game_rows,
+    iter_player_rows,
+    write_csv,
+    write_ndjson
+)
+
+
+@pytest.mark.parametrize("write", [
+    lambda rows, file: write_csv(rows, file, ("n",)),
+    write_ndjson,
+])
+def test_rows_are_written_as_they_are_produced(write):
+    file = io.StringIO()
+
+    def rows():
+        for n in range(5):
+            # Chaque ligne précédente est déjà écrite quand la suivante est produite
+            assert file.getvalue().count("\n") >= n
+            yield {"n": n}
+
+    assert write(rows(), file) == 5
+
+
+def test_games_and_players_are_exported_by_format(play_tournament, data_dir):
+    play_tournament("OPEN.json", players=6, rounds=3)
+
+    assert export_rows(iter_game_rows(TOURNAMENTS_FOLDER), "games.csv", GAME_EXPORT_FIELDS) == 9
+    with open(data_dir / "games.csv", encoding="utf-8", newline="") as f:
+        games = list(csv.DictReader(f))
+    assert [game["round_number"] for game in games] == ["Round 1"] * 3 + ["Round 2"] * 3 + ["Round 3"] * 3
+    assert all(game["tournament"] == "OPEN.json" and game["result"] for game in games)
+
+    rows = iter_game_rows(TOURNAMENTS_FOLDER, tournaments=["open"], idns=["AA00001"])
+    assert export_rows(rows, "games.jsonl", GAME_EXPORT_FIELDS) == 3
+    lines = (data_dir / "games.jsonl").read_text(encoding="utf-8").splitlines()
+    assert all("AA00001" in (game["player_1"], game["player_2"]) for game in map(json.loads, lines))
+    assert export_rows(iter_game_rows(TOURNAMENTS_FOLDER, tournaments=["AUTRE"]), "none.ndjson", ()) == 0
+
+    rows = iter_player_rows(PLAYERS_FOLDER, idns=["AA00002", "AA00004"])
+    assert export_rows(rows, "players.txt", PLAYER_EXPORT_FIELDS, export_format="csv") == 2
+    with pytest.raises(ValueError, match="Format d'export inconnu"):
+        export_rows(iter_player_rows(PLAYERS_FOLDER), "players.txt", PLAYER_EXPORT_FIELDS)
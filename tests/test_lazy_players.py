@@ -0,0 +1,42 @@
+import storage.player_data as player_data
+from config import PLAYERS_FOLDER
+from models.player_model import Player
+from storage.player_data import hydrate_players, lazy_players, save_players
+
+
+def _entries(*ids):
+    """Entrées `list_of_players` d'un tournoi pour les IDN donnés."""
+    return [{"id_national_chess": idn, "tournament_score": 1.0, "rank": 1, "played_with": []} for idn in ids]
+
+
+def test_profiles_are_read_on_first_access_in_one_batch(data_dir, monkeypatch):
+    profiles = [Player(idn, "Prénom", f"Nom{idn[-1]}", "01/01/2000") for idn in ("AA00001", "AA00002")]
+    save_players([p.get_serialized_player() for p in profiles], PLAYERS_FOLDER)
+    read = []
+    original_read = player_data._read_player_data
+
+    def counting_read(folder, idn):
+        read.append(idn)
+        return original_read(folder, idn)
+
+    monkeypatch.setattr(player_data, "_read_player_data", counting_read)
+
+    players = lazy_players(_entries("AA00001", "AA00002", "ZZ99999"), PLAYERS_FOLDER)
+    assert [p.get_tournament_data()["id_national_chess"] for p in players] == ["AA00001", "AA00002", "ZZ99999"]
+    assert read == []
+
+    players[1].last_name = "MODIFIÉ"
+    hydrate_players(players)
+    assert sorted(read) == ["AA00001", "AA00002", "ZZ99999"]
+    assert [p.last_name for p in players] == ["Nom1", "MODIFIÉ", None]
+    assert [p.has_profile for p in players] == [True, True, False]
+    hydrate_players(players)
+    assert len(read) == 3
+
+
+def test_single_access_hydrates_only_that_player(data_dir):
+    save_players([Player("AA00001", "Jean", "DUPONT", "01/01/2000").get_serialized_player()], PLAYERS_FOLDER)
+    first, second = lazy_players(_entries("AA00001", "AA00002"), PLAYERS_FOLDER)
+
+    assert first.first_name == "Jean"
+    assert first.is_hydrated and not second.is_hydrated
@@ -0,0 +1,38 @@
+import os
+
+import storage.player_data as player_data
+from config import PLAYERS_FOLDER
+from models.player_model import Player
+from storage.player_data import load_player_from_json, player_transaction, save_player_to_json, save_players
+
+
+def _profile(idn, first_name="Prénom"):
+    return Player(idn, first_name, "Nom", "01/01/2000").get_serialized_player()
+
+
+def test_batch_syncs_each_file_and_each_new_directory(data_dir, monkeypatch):
+    monkeypatch.setattr(player_data, "PLAYERS_LAYOUT", "sharded")
+    synced = []
+    monkeypatch.setattr(player_data, "fsync_directory", synced.append)
+    os.makedirs(PLAYERS_FOLDER)
+
+    assert save_players([_profile("AB00001"), _profile("AB00002"), _profile("CD00003")], PLAYERS_FOLDER) == 3
+
+    assert sorted(synced) == sorted([
+        PLAYERS_FOLDER,
+        os.path.join(PLAYERS_FOLDER, "AB"), os.path.join(PLAYERS_FOLDER, "AB", "00"),
+        os.path.join(PLAYERS_FOLDER, "CD"), os.path.join(PLAYERS_FOLDER, "CD", "00"),
+    ])
+    synced.clear()
+    save_players([_profile("AB00001", "Autre")], PLAYERS_FOLDER)
+    assert synced == []
+    assert load_player_from_json(PLAYERS_FOLDER, "AB00001").first_name == "Autre"
+
+
+def test_transaction_writes_last_version_once(data_dir):
+    with player_transaction(PLAYERS_FOLDER):
+        save_player_to_json(_profile("AA00001"), PLAYERS_FOLDER, "AA00001.json")
+        save_player_to_json(_profile("AA00001", "Final"), PLAYERS_FOLDER, "AA00001.json")
+        assert load_player_from_json(PLAYERS_FOLDER, "AA00001").first_name == "Final"
+        assert not os.path.exists(os.path.join(PLAYERS_FOLDER, "AA00001.json"))
+    assert load_player_from_json(PLAYERS_FOLDER, "AA00001").first_name == "Final"
@@ -0,0 +1,45 @@
+import json
+import os
+
+from storage.player_data import PlayerCache
+
+
+def _write(path, last_name):
+    """Écrit un profil dans `path` par un autre moyen que les sauvegardes du processus."""
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({"id_national_chess": "AA00001", "last_name": last_name, "played_with": []}, f)
+
+
+def test_cache_hits_until_the_file_changes(tmp_path):
+    path = str(tmp_path / "AA00001.json")
+    _write(path, "DUPONT")
+    cache = PlayerCache()
+
+    assert cache.get(path)["last_name"] == "DUPONT"
+    assert cache.get(path)["last_name"] == "DUPONT"
+    assert (cache.stats()["hits"], cache.stats()["misses"]) == (1, 1)
+
+    _write(path, "DURAND")
+    os.utime(path, ns=(1, 1))
+    assert cache.get(path)["last_name"] == "DURAND"
+    os.remove(path)
+    assert cache.get(path) is None
+    assert cache.stats() == {"hits": 1, "misses": 3, "size": 0}
+
+
+def test_cache_returns_copies_and_evicts_least_recently_used(tmp_path):
+    paths = [str(tmp_path / f"AA0000{n}.json") for n in range(1, 4)]
+    for path in paths:
+        _write(path, "DUPONT")
+    cache = PlayerCache(maxsize=2)
+
+    cache.get(paths[0])["played_with"].append("AA00002")
+    assert cache.get(paths[0])["played_with"] == []
+    cache.get(paths[1])
+    cache.get(paths[0])
+    cache.get(paths[2])  # évince paths[1], le moins récemment lu
+    hits = cache.stats()["hits"]
+    cache.get(paths[0])
+    cache.get(paths[1])
+    assert cache.stats()["hits"] == hits + 1
+    assert cache.stats()["size"] == 2
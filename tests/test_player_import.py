@@ -0,0 +1,84 @@
+import csv
+
+import pytest
+
+from config import PLAYERS_FOLDER
+from storage.player_data import iter_players_from_json
+from storage.player_import import import_players
+
+# Ligne NDJSON d'un joueur valide
+JEAN = '{"id_national_chess": "AB12345", "last_name": "Dupont", "first_name": "Jean", "date_of_birth": "01/02/1990"}'
+
+
+def _rejects(path):
+    """(ligne, raison) de chaque rejet du fichier des rejets."""
+    with open(path, encoding="utf-8", newline="") as f:
+        return [(int(row["line"]), row["reason"]) for row in csv.DictReader(f)]
+
+
+def _imported():
+    """(IDN, nom, date de naissance) des joueurs enregistrés, triés par IDN."""
+    return sorted((p.id_national_chess, p.last_name, p.date_of_birth) for p in iter_players_from_json(PLAYERS_FOLDER))
+
+
+def test_csv_import_saves_valid_rows_and_rejects_the_others(data_dir):
+    source = data_dir / "ffe.csv"
+    source.write_text(
+        "id_national_chess;last_name;first_name;date_of_birth\n"
+        "ab12345;dupont;jean;01/02/1990\n"
+        "XX1;Martin;Paul;01/02/1990\n"
+        "CD23456;;Marie;01/02/1990\n"
+        "EF34567;Durand;Luc;31/02/1990\n"
+        "GH45678;Petit;Anne;15/06/1985\n"
+        "IJ56789;Moreau;Léa;20/11/2001\n",
+        encoding="utf-8",
+    )
+
+    report = import_players(str(source), PLAYERS_FOLDER, batch_size=2)
+
+    assert (report["imported"], report["rejected"]) == (3, 3)
+    assert report["rejects_path"] == str(data_dir / "ffe.rejects.csv")
+    assert _rejects(report["rejects_path"]) == [
+        (3, "id_national_chess invalide (format attendu : XX00000)"),
+        (4, "last_name manquant"),
+        (5, "date_of_birth invalide"),
+    ]
+    assert [idn for idn, _, _ in _imported()] == ["AB12345", "GH45678", "IJ56789"]
+
+
+def test_ndjson_import_rejects_unreadable_lines(data_dir):
+    source = data_dir / "ffe.ndjson"
+    source.write_text(
+        JEAN + "\n"
+        "\n"
+        '{"id_national_chess": "CD23456", "last_name": \n'
+        '["CD23456", "Martin"]\n'
+        '{"id_national_chess": "EF34567", "last_name": "Durand", "first_name": "Luc"}\n',
+        encoding="utf-8",
+    )
+    rejects_path = str(data_dir / "rejets.csv")
+
+    report = import_players(str(source), PLAYERS_FOLDER, rejects_path=rejects_path)
+
+    assert (report["imported"], report["rejected"], report["rejects_path"]) == (1, 3, rejects_path)
+    lines, reasons = zip(*_rejects(rejects_path))
+    assert lines == (3, 4, 5)
+    assert reasons[0].startswith("JSON invalide")
+    assert reasons[1:] == ("un objet JSON est attendu", "date_of_birth manquant")
+    assert _imported() == [("AB12345", "DUPONT", "01/02/1990")]
+
+
+def test_import_without_rejects_creates_no_rejects_file(data_dir):
+    source = data_dir / "ffe.jsonl"
+    source.write_text(JEAN + "\n", encoding="utf-8")
+
+    assert import_players(str(source), PLAYERS_FOLDER)["rejects_path"] is None
+    assert not (data_dir / "ffe.rejects.csv").exists()
+
+
+def test_unknown_format_is_refused(data_dir):
+    source = data_dir / "ffe.xlsx"
+    source.write_text("", encoding="utf-8")
+
+    with pytest.raises(ValueError):
+        import_players(str(source), PLAYERS_FOLDER)
@@ -0,0 +1,53 @@
+import os
+import shutil
+
+import pytest
+
+import storage.player_data as player_data
+from config import PLAYERS_FOLDER
+from models.player_model import Player
+from storage.player_data import (
+    iter_players_from_json,
+    load_player_from_json,
+    migrate_player_files,
+    player_file_path,
+    save_players
+)
+
+
+def _interrupt_after(monkeypatch, moves):
+    """Fait échouer le renommage de fichier qui suit les `moves` premiers (migration interrompue)."""
+    replace = os.replace
+    done = []
+
+    def interrupted(src, dst):
+        if len(done) == moves:
+            raise KeyboardInterrupt
+        done.append(dst)
+        replace(src, dst)
+
+    monkeypatch.setattr(player_data.os, "replace", interrupted)
+
+
+def test_interrupted_sharded_migration_resumes(data_dir, monkeypatch):
+    ids = [f"AA{n:05d}" for n in range(1, 9)]
+    save_players([Player(idn, "Prénom", "Nom", "01/01/2000").get_serialized_player() for idn in ids], PLAYERS_FOLDER)
+    monkeypatch.setattr(player_data, "PLAYERS_LAYOUT", "sharded")
+
+    with monkeypatch.context() as patch:
+        _interrupt_after(patch, 3)
+        with pytest.raises(KeyboardInterrupt):
+            migrate_player_files(PLAYERS_FOLDER)
+    assert os.path.isfile(player_file_path(PLAYERS_FOLDER, "AA00003.json"))
+    assert not os.path.exists(player_file_path(PLAYERS_FOLDER, "AA00004.json"))
+    # Profils lisibles pendant la migration, à l'ancien comme au nouvel emplacement
+    assert [load_player_from_json(PLAYERS_FOLDER, idn).id_national_chess for idn in ids] == ids
+    # Profil déjà présent au nouvel emplacement (réenregistré entre-temps)
+    target = player_file_path(PLAYERS_FOLDER, "AA00008.json")
+    os.makedirs(os.path.dirname(target), exist_ok=True)
+    shutil.copy(os.path.join(PLAYERS_FOLDER, "AA00008.json"), target)
+
+    assert migrate_player_files(PLAYERS_FOLDER) == {"moved": 4, "duplicates": 1}
+    assert not [name for name in os.listdir(PLAYERS_FOLDER) if name.endswith(".json")]
+    assert sorted(p.id_national_chess for p in iter_players_from_json(PLAYERS_FOLDER)) == ids
+    assert migrate_player_files(PLAYERS_FOLDER) == {"moved": 0, "duplicates": 0}
@@ -0,0 +1,37 @@
+import os
+import shutil
+
+import pytest
+
+import storage.player_data as player_data
+from config import PLAYERS_FOLDER, PLAYERS_MANIFEST
+from models.player_model import Player
+from storage.player_data import _parallel_map, iter_players_from_json, save_players
+
+
+def _load(folder, workers):
+    """(IDN des joueurs chargés, erreurs) d'un dossier lu par `workers` threads."""
+    errors = []
+    ids = [p.id_national_chess for p in iter_players_from_json(folder, errors=errors, workers=workers)]
+    return ids, errors
+
+
+def test_parallel_map_keeps_the_order_of_items():
+    items = list(range(1000))
+    assert list(_parallel_map(lambda n: n * n, items, workers=8, batch_size=7)) == [n * n for n in items]
+
+
+@pytest.mark.parametrize("layout", ["flat", "sharded"])
+def test_parallel_load_matches_sequential_load(data_dir, monkeypatch, layout):
+    monkeypatch.setattr(player_data, "PLAYERS_LAYOUT", layout)
+    ids = [f"AA{n:05d}" for n in range(1, 151)]
+    save_players([Player(idn, "Prénom", "Nom", "01/01/2000").get_serialized_player() for idn in ids], PLAYERS_FOLDER)
+    with open(os.path.join(PLAYERS_FOLDER, "ZZ99999.json"), "w", encoding="utf-8") as f:
+        f.write('{"id_national_chess": "ZZ')
+    # Copie sans manifeste : tous les fichiers de la copie sont relus
+    shutil.copytree(PLAYERS_FOLDER, "copie", ignore=shutil.ignore_patterns(PLAYERS_MANIFEST))
+
+    loaded, errors = _load(PLAYERS_FOLDER, workers=8)
+    assert loaded == ids
+    assert [filename for filename, _ in errors] == ["ZZ99999.json"]
+    assert _load("copie", workers=1) == (loaded, errors)
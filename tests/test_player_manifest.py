@@ -0,0 +1,45 @@
+import json
+import os
+
+import storage.player_data as player_data
+import storage.player_manifest as player_manifest
+from config import PLAYERS_FOLDER
+from models.player_model import Player
+from storage.player_data import iter_players_from_json, save_players
+
+
+def _scan(monkeypatch):
+    """(IDN des joueurs chargés, noms des fichiers relus) d'un parcours du dossier des joueurs."""
+    read = []
+
+    def counting_read(path):
+        read.append(os.path.basename(path))
+        return original_read(path)
+
+    original_read = player_data._read_player
+    monkeypatch.setattr(player_data, "_read_player", counting_read)
+    ids = [p.id_national_chess for p in iter_players_from_json(PLAYERS_FOLDER, workers=1)]
+    monkeypatch.setattr(player_data, "_read_player", original_read)
+    return ids, read
+
+
+def test_rescan_reads_only_new_or_modified_files(data_dir, monkeypatch):
+    profiles = [Player(f"AA0000{n}", "Prénom", "Nom", "01/01/2000").get_serialized_player() for n in (1, 2, 3)]
+    save_players(profiles, PLAYERS_FOLDER)
+
+    # Fichiers écrits par le processus : déjà dans le manifeste
+    assert _scan(monkeypatch) == (["AA00001", "AA00002", "AA00003"], [])
+
+    # Fichier modifié et fichier supprimé par un autre moyen
+    path = os.path.join(PLAYERS_FOLDER, "AA00002.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump({**profiles[1], "last_name": "AUTRE"}, f)
+    os.utime(path, ns=(1, 1))
+    os.remove(os.path.join(PLAYERS_FOLDER, "AA00003.json"))
+    assert _scan(monkeypatch) == (["AA00001", "AA00002"], ["AA00002.json"])
+    assert _scan(monkeypatch) == (["AA00001", "AA00002"], [])
+
+    # Manifeste relu depuis le disque (nouveau processus)
+    monkeypatch.setattr(player_manifest, "_manifests", {})
+    assert _scan(monkeypatch) == (["AA00001", "AA00002"], [])
+    assert [p.last_name for p in iter_players_from_json(PLAYERS_FOLDER)] == ["Nom", "AUTRE"]
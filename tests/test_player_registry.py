@@ -0,0 +1,77 @@
+import json
+import os
+
+import pytest
+
+import storage.player_registry as player_registry
+from config import PLAYERS_FOLDER
+from models.player_model import Player
+from storage.player_data import player_file_path
+from storage.player_registry import PlayerRegistry
+
+
+def _profile(idn, first_name="Prénom"):
+    return Player(idn, first_name, "Nom", "01/01/2000").get_serialized_player()
+
+
+def _write_file(idn, layout="flat", first_name="Prénom"):
+    path = player_file_path(PLAYERS_FOLDER, f"{idn}.json", layout)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(_profile(idn, first_name), f)
+
+
+@pytest.fixture
+def registry(data_dir):
+    registry = PlayerRegistry(PLAYERS_FOLDER)
+    yield registry
+    registry.close()
+
+
+def test_lookup_update_and_reopen(registry):
+    registry.put_many([_profile("AA00001"), _profile("BB00002")])
+    registry.put(_profile("AA00001", "Nouveau"))
+
+    assert registry.get("AA00001")["first_name"] == "Nouveau"
+    assert registry.contains("BB00002") and not registry.contains("CC00003")
+    assert registry.get("CC00003") is None
+    registry.close()
+
+    reopened = PlayerRegistry(PLAYERS_FOLDER)
+    assert reopened.get("AA00001")["first_name"] == "Nouveau"
+    assert sorted(p["id_national_chess"] for p in reopened.iter_players()) == ["AA00001", "BB00002"]
+    reopened.close()
+
+
+def test_reopen_rebuilds_a_missing_index(registry):
+    registry.put(_profile("AA00001"))
+    registry.put(_profile("AA00001", "Nouveau"))
+    registry.close()
+    os.remove(registry.index_path)
+
+    reopened = PlayerRegistry(PLAYERS_FOLDER)
+    assert reopened.get("AA00001")["first_name"] == "Nouveau"
+    reopened.close()
+
+
+def test_import_reads_sharded_files_and_resumes_until_marked(data_dir, monkeypatch):
+    _write_file("AA00001")
+    _write_file("BB00002", "sharded")
+
+    def interrupted(self):
+        raise OSError("disque plein")
+
+    with monkeypatch.context() as patch:
+        patch.setattr(player_registry.PlayerRegistry, "sync", interrupted)
+        with pytest.raises(OSError):
+            PlayerRegistry(PLAYERS_FOLDER)
+    assert not os.path.exists(os.path.join(PLAYERS_FOLDER, "registry.dat.imported"))
+
+    _write_file("AA00001", first_name="Fichier")
+    _write_file("CC00003", "sharded")
+    registry = PlayerRegistry(PLAYERS_FOLDER)
+    assert os.path.exists(registry.import_marker_path)
+    assert sorted(p["id_national_chess"] for p in registry.iter_players()) == ["AA00001", "BB00002", "CC00003"]
+    # Un joueur déjà importé garde sa version du registre
+    assert registry.get("AA00001")["first_name"] == "Prénom"
+    registry.close()
@@ -0,0 +1,47 @@
+from config import PLAYERS_FOLDER
+from models.player_model import Player
+from storage.player_data import save_players, search_players
+from storage.player_search import PlayerNameIndex
+
+
+def _save(*names):
+    """Enregistre un joueur (IDN AA00001, AA00002, ...) par couple (nom, prénom)."""
+    save_players(
+        [Player(f"AA{n:05d}", first, last, "01/01/2000").get_serialized_player()
+         for n, (last, first) in enumerate(names, start=1)],
+        PLAYERS_FOLDER,
+    )
+
+
+def _ids(query, **kwargs):
+    """IDN des joueurs trouvés par `search_players`."""
+    return [p["id_national_chess"] for p in search_players(PLAYERS_FOLDER, query, **kwargs)]
+
+
+def test_search_ignores_accents_and_case_and_matches_every_word(data_dir):
+    _save(("DUPONT", "Jean-Éric"), ("DUPUIS", "Jérôme"), ("MARTIN", "Jean"), ("DURAND", "Zoé"))
+
+    assert _ids("dup") == ["AA00001", "AA00002"]
+    assert _ids("dup je") == ["AA00001", "AA00002"]
+    assert _ids("ERIC") == ["AA00001"]
+    assert _ids("jean") == ["AA00001", "AA00003"]
+    assert _ids("du", limit=2) == ["AA00001", "AA00002"]
+    assert _ids("durand martin") == []
+
+
+def test_saves_update_the_index_on_disk(data_dir):
+    _save(("DUPONT", "Jean"), ("MARTIN", "Paul"))
+    assert _ids("dupont") == ["AA00001"]
+
+    _save(("LEFEVRE", "Jean"))
+    assert _ids("dupont") == []
+    assert _ids("lef") == ["AA00001"]
+
+    # Index relu depuis le disque (autre processus), avec une dernière ligne tronquée
+    reopened = PlayerNameIndex(PLAYERS_FOLDER)
+    with open(reopened.path, "a", encoding="utf-8") as f:
+        f.write('["AA00003", "DUR')
+    assert [p["id_national_chess"] for p in reopened.search("lef")] == ["AA00001"]
+    assert [p["id_national_chess"] for p in reopened.search("martin")] == ["AA00002"]
+    with open(reopened.path, encoding="utf-8") as f:
+        assert f.read().endswith("\n")
@@ -0,0 +1,50 @@
+import pytest
+
+from config import MAX_LAST_NAME_LENGTH, PLAYERS_FOLDER
+from models.player_model import Player
+from storage.player_data import build_player_table, save_players
+from storage.player_table import PlayerTable, get_player_table
+
+
+def _profile(idn, first_name, last_name, date_of_birth):
+    return {"id_national_chess": idn, "first_name": first_name, "last_name": last_name, "date_of_birth": date_of_birth}
+
+
+def test_records_round_trip_through_the_mapped_files(tmp_path):
+    profiles = [
+        _profile("BB00002", "Zoé", "Lefèvre-Ångström", "29/02/2000"),
+        _profile("AA99999", None, "Nom", None),
+        _profile("AA00001", "Prénom", "Nom", "01/01/2000"),
+    ]
+    table = PlayerTable(str(tmp_path))
+    table.put_many(profiles)
+    table.flush()
+    table.close()
+
+    reopened = PlayerTable(str(tmp_path))
+    assert reopened.get("BB00002").to_dict() == profiles[0]
+    assert bytes(reopened.get("AA00001").last_name_bytes) == b"Nom"
+    assert [record.to_dict() for record in reopened.scan()] == sorted(profiles, key=lambda p: p["id_national_chess"])
+    assert reopened.get("AA00002") is None and "CC00003" not in reopened
+    with pytest.raises(ValueError):
+        reopened.get("A123")
+    with pytest.raises(ValueError):
+        reopened.put(_profile("AA00003", "Prénom", "X" * (4 * MAX_LAST_NAME_LENGTH + 1), None))
+    reopened.close()
+
+
+def test_built_table_follows_player_saves(data_dir):
+    def profile(idn, last_name):
+        return Player(idn, "Prénom", last_name, "01/01/2000").get_serialized_player()
+
+    save_players([profile("AA00001", "Avant"), profile("AA00002", "Avant")], PLAYERS_FOLDER)
+    assert build_player_table(PLAYERS_FOLDER) == 2
+    save_players([profile("AA00002", "Après"), profile("AA00003", "Nouveau")], PLAYERS_FOLDER)
+
+    table = get_player_table(PLAYERS_FOLDER)
+    try:
+        assert [(r.id_national_chess, r.last_name) for r in table.scan()] == [
+            ("AA00001", "Avant"), ("AA00002", "Après"), ("AA00003", "Nouveau"),
+        ]
+    finally:
+        table.close()
@@ -0,0 +1,95 @@
+import json
+import os
+import sqlite3
+
+import storage.repository as repository
+from config import PLAYER_SCHEMA_VERSION, PLAYERS_FOLDER, TOURNAMENT_SCHEMA_VERSION, TOURNAMENTS_FOLDER
+from storage.player_data import iter_players_from_json, load_player_from_json
+from storage.schema import upgrade_player, upgrade_tournament
+from storage.schema_migration import migrate_schema
+from storage.sqlite_repository import SqliteRepository
+from storage.tournament_data import load_tournament_from_json
+
+
+def _v0_player(idn):
+    """Profil antérieur au versionnement (sans schema_version ni champs de tournoi)."""
+    return {"id_national_chess": idn, "first_name": "Prénom", "last_name": "Nom"}
+
+
+def _v0_tournament():
+    """Tournoi antérieur au versionnement : un round dont un match sans couleur ni vainqueur."""
+    player = _v0_player("AA00001")
+    return {
+        "tournament_name": "OPEN",
+        "list_of_players": [player],
+        "list_of_rounds": [{"round_number": 1, "matches": [{"name": "Match 1", "player_1": dict(player)}]}],
+    }
+
+
+def _assert_current_tournament(data):
+    assert data["schema_version"] == TOURNAMENT_SCHEMA_VERSION
+    assert data["actual_round"] == 0 and data["description"] is None
+    assert data["list_of_players"][0]["played_with"] == []
+    match = data["list_of_rounds"][0]["matches"][0]
+    assert match["player_2"] is None and match["winner"] is None
+    assert match["player_1"]["color"] is None
+
+
+def test_upgrade_v0_documents_to_current_version():
+    player = upgrade_player(_v0_player("AA00001"))
+    assert player["schema_version"] == PLAYER_SCHEMA_VERSION
+    assert (player["date_of_birth"], player["tournament_score"], player["rank"]) == (None, 0.0, 0)
+    _assert_current_tournament(upgrade_tournament(_v0_tournament()))
+
+
+def test_v0_files_load_at_current_version(data_dir):
+    os.makedirs(PLAYERS_FOLDER)
+    with open(os.path.join(PLAYERS_FOLDER, "AA00001.json"), "w", encoding="utf-8") as f:
+        json.dump(_v0_player("AA00001"), f)
+    os.makedirs(TOURNAMENTS_FOLDER)
+    with open(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json"), "w", encoding="utf-8") as f:
+        json.dump(_v0_tournament(), f)
+
+    assert load_player_from_json(PLAYERS_FOLDER, "AA00001").date_of_birth is None
+    _assert_current_tournament(load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")))
+
+
+def test_repository_reads_are_upgraded(data_dir, monkeypatch):
+    sqlite = SqliteRepository(str(data_dir / "chess.sqlite3"))
+    sqlite.save_players([_v0_player("AA00001"), _v0_player("BB00002")])
+    sqlite.save_tournament(_v0_tournament(), "OPEN.json")
+    monkeypatch.setattr(repository, "STORAGE_BACKEND", "sqlite")
+    monkeypatch.setattr(repository, "_repository", sqlite)
+
+    assert load_player_from_json(PLAYERS_FOLDER, "AA00001").date_of_birth is None
+    assert [p.id_national_chess for p in iter_players_from_json(PLAYERS_FOLDER)] == ["AA00001", "BB00002"]
+    _assert_current_tournament(load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")))
+
+
+def test_pre_versioning_database_is_upgraded_and_migrated(data_dir, monkeypatch):
+    database = str(data_dir / "chess.sqlite3")
+    sqlite = SqliteRepository(database)
+    sqlite.save_players([_v0_player("AA00001"), _v0_player("BB00002")])
+    sqlite.save_tournament(_v0_tournament(), "OPEN.json")
+    sqlite._conn.close()
+    with sqlite3.connect(database) as conn:
+        # Structure de la base avant le versionnement des documents
+        for table in ("players", "tournaments"):
+            conn.execute(f"ALTER TABLE {table} DROP COLUMN schema_version")
+        conn.execute("PRAGMA user_version = 0")
+
+    sqlite = SqliteRepository(database)
+    monkeypatch.setattr(repository, "STORAGE_BACKEND", "sqlite")
+    monkeypatch.setattr(repository, "_repository", sqlite)
+    assert sqlite._conn.execute("PRAGMA user_version").fetchone()[0] == 1
+    assert sqlite.load_player("AA00001")["schema_version"] == 0
+    _assert_current_tournament(load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")))
+
+    report = migrate_schema(PLAYERS_FOLDER, TOURNAMENTS_FOLDER)
+    assert report == {
+        "players": {"upgraded": 2, "current": 0, "errors": []},
+        "tournaments": {"upgraded": 1, "current": 0, "errors": []},
+    }
+    assert sqlite.load_player("BB00002")["schema_version"] == PLAYER_SCHEMA_VERSION
+    _assert_current_tournament(sqlite.load_tournament("OPEN.json"))
+    assert migrate_schema(PLAYERS_FOLDER, TOURNAMENTS_FOLDER)["tournaments"]["current"] == 1
@@ -0,0 +1,49 @@
+import os
+
+import storage.player_data as player_data
+import storage.tournament_data as tournament_data
+from config import PLAYERS_FOLDER, TOURNAMENTS_FOLDER
+from models.player_model import Player
+from storage.player_registry import get_registry
+from storage.sqlite_repository import SqliteRepository
+from storage.tournament_data import archive_finished_tournaments, load_tournament_from_json
+from storage.tournament_journal import get_journal
+
+
+def _stored_fields(data):
+    """Champs du tournoi enregistrés par le dépôt (sans la révision)."""
+    return {key: value for key, value in data.items() if key != "revision"}
+
+
+def test_import_replays_journal_and_reads_every_layout(play_tournament, data_dir, monkeypatch):
+    play_tournament("FINI.json", rounds=2)
+    assert archive_finished_tournaments(TOURNAMENTS_FOLDER)["files"] == ["FINI.json"]
+    monkeypatch.setattr(tournament_data, "TOURNAMENT_LAYOUT", "split")
+    play_tournament("SPLIT.json", seed=2, stop_after=4)
+    monkeypatch.setattr(tournament_data, "TOURNAMENT_LAYOUT", "file")
+    play_tournament("OPEN.json", seed=3, stop_after=5)
+    assert get_journal(TOURNAMENTS_FOLDER, "OPEN.json").has_events()
+
+    repository = SqliteRepository(str(data_dir / "chess.sqlite3"))
+    _, imported = repository.import_json_folders(PLAYERS_FOLDER, TOURNAMENTS_FOLDER)
+
+    assert imported == 3
+    for filename in ("FINI.json", "SPLIT.json", "OPEN.json"):
+        expected = load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, filename))
+        assert repository.load_tournament(filename) == _stored_fields(expected)
+
+
+def test_import_reads_flat_sharded_and_registry_players(data_dir, monkeypatch):
+    def profile(idn):
+        return Player(idn, "Prénom", "Nom", "01/01/2000").get_serialized_player()
+
+    player_data.save_players([profile("AA00001")], PLAYERS_FOLDER)
+    monkeypatch.setattr(player_data, "PLAYERS_LAYOUT", "sharded")
+    player_data.save_players([profile("BB00002")], PLAYERS_FOLDER)
+    get_registry(PLAYERS_FOLDER).put(profile("CC00003"))
+
+    repository = SqliteRepository(str(data_dir / "chess.sqlite3"))
+    players, _ = repository.import_json_folders(PLAYERS_FOLDER, TOURNAMENTS_FOLDER)
+
+    assert players == 3
+    assert [p["id_national_chess"] for p in repository.load_players()] == ["AA00001", "BB00002", "CC00003"]
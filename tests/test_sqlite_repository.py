@@ -0,0 +1,27 @@
+import pytest
+
+from benchmarks.tournament_encoding import build_tournament
+from models.player_model import Player
+from storage.repository import Repository
+from storage.sqlite_repository import SqliteRepository
+
+
+def test_repository_interface_is_abstract():
+    with pytest.raises(TypeError):
+        Repository()
+
+
+def test_players_and_tournaments_round_trip(tmp_path):
+    database = str(tmp_path / "chess.sqlite3")
+    repository = SqliteRepository(database)
+    repository.save_players([Player(idn, "Prénom", "Nom", "01/01/2000").get_serialized_player()
+                             for idn in ("AA00001", "BB00002")])
+    tournament = build_tournament(players=6, rounds=3, seed=1).get_serialized_tournament()
+    repository.save_tournament(tournament, "OPEN.json")
+
+    reopened = SqliteRepository(database)
+    assert reopened.player_exists("AA00001") and not reopened.player_exists("CC00003")
+    assert reopened.load_player("BB00002")["first_name"] == "Prénom"
+    assert reopened.list_tournaments() == ["OPEN.json"]
+    assert reopened.load_tournament("OPEN.json") == tournament
+    assert reopened.list_tournament_summaries()[0]["player_count"] == 6
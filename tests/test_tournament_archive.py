@@ -0,0 +1,80 @@
+import os
+import subprocess
+import sys
+import time
+
+import pytest
+
+import storage.tournament_data as tournament_data
+from config import TOURNAMENT_ARCHIVE, TOURNAMENTS_FOLDER
+from storage.tournament_data import (
+    archive_finished_tournaments,
+    list_tournament_files,
+    list_tournament_summaries,
+    load_tournament_from_json,
+    save_tournament_to_json
+)
+from storage.tournament_lock import fcntl, get_tournament_lock
+
+
+def test_archive_removes_every_file_of_the_tournament(play_tournament):
+    play_tournament("FINI.json", rounds=2)
+    finished = load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "FINI.json"))
+    # Plusieurs checkpoints : versions précédentes conservées
+    save_tournament_to_json({**finished, "description": "Version 2"}, TOURNAMENTS_FOLDER, "FINI.json")
+    save_tournament_to_json(finished, TOURNAMENTS_FOLDER, "FINI.json")
+    assert {"FINI.json.1", "FINI.lock"} <= set(os.listdir(TOURNAMENTS_FOLDER))
+
+    report = archive_finished_tournaments(TOURNAMENTS_FOLDER)
+
+    assert report["files"] == ["FINI.json"]
+    assert [name for name in os.listdir(TOURNAMENTS_FOLDER) if name.startswith("FINI")] == []
+    archived = load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "FINI.json"))
+    assert archived["list_of_rounds"] == finished["list_of_rounds"]
+
+
+def test_split_tournament_is_archived_without_leftovers(play_tournament, monkeypatch):
+    monkeypatch.setattr(tournament_data, "TOURNAMENT_LAYOUT", "split")
+    play_tournament("FINI.json", rounds=2)
+
+    assert archive_finished_tournaments(TOURNAMENTS_FOLDER)["files"] == ["FINI.json"]
+    assert [name for name in os.listdir(TOURNAMENTS_FOLDER) if name.startswith("FINI")] == []
+
+
+def test_damaged_archive_does_not_hide_live_tournaments(play_tournament, capsys):
+    play_tournament("FINI.json", rounds=2)
+    archive_finished_tournaments(TOURNAMENTS_FOLDER)
+    play_tournament("OPEN.json", seed=2, stop_after=3)
+    assert list_tournament_files(TOURNAMENTS_FOLDER) == ["FINI.json", "OPEN.json"]
+    capsys.readouterr()
+
+    archive_path = os.path.join(TOURNAMENTS_FOLDER, TOURNAMENT_ARCHIVE)
+    with open(archive_path, "r+b") as f:
+        f.truncate(os.path.getsize(archive_path) - 10)
+
+    assert list_tournament_files(TOURNAMENTS_FOLDER) == ["OPEN.json"]
+    assert [s["tournament_name"] for s in list_tournament_summaries(TOURNAMENTS_FOLDER)] == ["OPEN"]
+    assert "Archive de tournois illisible" in capsys.readouterr().out
+
+
+@pytest.mark.skipif(fcntl is None, reason="verrou fcntl (POSIX)")
+def test_waiting_process_locks_the_recreated_file_after_discard(data_dir):
+    lock = get_tournament_lock(TOURNAMENTS_FOLDER, "OPEN.json")
+    waiter = (
+        "import os, sys\n"
+        "from storage.tournament_lock import fcntl, get_tournament_lock\n"
+        "lock = get_tournament_lock(*os.path.split(sys.argv[1]))\n"
+        "print('waiting', flush=True)\n"
+        "with lock.hold():\n"
+        "    print(os.fstat(lock._file.fileno()).st_ino == os.stat(lock.path).st_ino)\n"
+    )
+    env = {**os.environ, "PYTHONPATH": os.path.dirname(os.path.dirname(os.path.abspath(__file__)))}
+    with lock.hold():
+        process = subprocess.Popen(
+            [sys.executable, "-c", waiter, os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")],
+            stdout=subprocess.PIPE, text=True, env=env,
+        )
+        assert process.stdout.readline() == "waiting\n"
+        time.sleep(0.2)
+        lock.discard()
+    assert process.communicate(timeout=10)[0] == "True\n"
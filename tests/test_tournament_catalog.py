@@ -0,0 +1,46 @@
+import json
+import os
+
+import storage.tournament_catalog as tournament_catalog
+from config import JOURNAL_EXTENSION
+from storage.tournament_catalog import TournamentCatalog
+
+
+def _write(folder, filename, location):
+    data = {"tournament_name": filename[:-5], "location": location, "list_of_players": [{}, {}]}
+    (folder / filename).write_text(json.dumps(data), encoding="utf-8")
+
+
+def _refresh(folder):
+    """Synchronise un nouveau catalogue (comme au démarrage d'un processus) : (entrées, fichiers relus)."""
+    read = []
+
+    def loader(path):
+        read.append(os.path.basename(path))
+        with open(path, "r", encoding="utf-8") as f:
+            return json.load(f)
+
+    entries = TournamentCatalog(str(folder)).refresh(loader)
+    return {entry["filename"]: entry for entry in entries}, sorted(read)
+
+
+def test_catalog_rereads_only_changed_tournaments(tmp_path, monkeypatch):
+    monkeypatch.setattr(tournament_catalog, "WRITE_BEHIND", False)
+    for filename in ("A.json", "B.json", "C.json"):
+        _write(tmp_path, filename, "PARIS")
+
+    entries, read = _refresh(tmp_path)
+    assert read == ["A.json", "B.json", "C.json"]
+    assert entries["B.json"]["player_count"] == 2
+    assert _refresh(tmp_path)[1] == []
+
+    _write(tmp_path, "B.json", "LYON - CENTRE")
+    (tmp_path / "C.json").unlink()
+    _write(tmp_path, "D.json", "NICE")
+    (tmp_path / ("A" + JOURNAL_EXTENSION)).write_text("{}\n", encoding="utf-8")
+
+    entries, read = _refresh(tmp_path)
+    assert read == ["A.json", "B.json", "D.json"]
+    assert sorted(entries) == ["A.json", "B.json", "D.json"]
+    assert entries["B.json"]["location"] == "LYON - CENTRE"
+    assert _refresh(tmp_path)[1] == []
@@ -0,0 +1,46 @@
+import json
+import os
+
+import storage.tournament_data as tournament_data
+from benchmarks.tournament_encoding import build_tournament
+from config import TOURNAMENTS_FOLDER
+from storage.tournament_codec import BINARY_MAGIC, decode_tournament, encode_tournament_binary, seal
+from storage.tournament_document import encode_tournament
+
+
+def _exact(data):
+    """Forme JSON du tournoi : distingue un entier du flottant de même valeur."""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+
+def test_binary_round_trip_of_simulated_tournament():
+    # Nombre impair de joueurs : chaque round a un tour de repos (player_2 à None)
+    data = build_tournament(9, 4, seed=3).get_serialized_tournament()
+    payload = encode_tournament_binary(data)
+
+    assert _exact(decode_tournament(payload)) == _exact(data)
+    assert _exact(decode_tournament(seal(payload))) == _exact(data)
+    assert len(payload) < len(encode_tournament(data)[0])
+
+
+def test_binary_round_trip_keeps_irregular_values():
+    data = build_tournament(4, 2, seed=1).get_serialized_tournament()
+    data["arbitre"] = "Élise Dupré"
+    player = data["list_of_players"][0]
+    player["rank"], player["tournament_score"] = 100000, 2.25
+    player["played_with"].append("ZZ99999")
+    data["list_of_rounds"][0]["matches"][0]["player_1"]["match_score"] = 1
+
+    assert _exact(decode_tournament(encode_tournament_binary(data))) == _exact(data)
+
+
+def test_binary_file_round_trip(data_dir, monkeypatch):
+    monkeypatch.setattr(tournament_data, "TOURNAMENT_ENCODING", "binary")
+    data = build_tournament(6, 3, seed=2).get_serialized_tournament()
+    tournament_data.save_tournament_to_json(data, TOURNAMENTS_FOLDER, "OPEN.json")
+    filepath = os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")
+
+    with open(filepath, "rb") as f:
+        assert f.read(len(BINARY_MAGIC)) == BINARY_MAGIC
+    loaded = tournament_data.load_tournament_from_json(filepath)
+    assert {key: loaded[key] for key in data} == data
@@ -0,0 +1,49 @@
+import json
+import os
+
+from benchmarks.tournament_encoding import build_tournament
+from config import TOURNAMENTS_FOLDER
+from storage.tournament_data import load_tournament_document, load_tournament_from_json, save_tournament_to_json
+from storage.tournament_document import LazyRounds, index_path, read_document
+
+
+def _spy_round_reads(monkeypatch):
+    """Index des rounds lus dans le fichier (voir LazyRounds)."""
+    reads = []
+    read_round = LazyRounds.__getitem__
+
+    def getitem(self, index):
+        reads.append(index)
+        return read_round(self, index)
+
+    monkeypatch.setattr(LazyRounds, "__getitem__", getitem)
+    return reads
+
+
+def test_rounds_are_read_on_demand_through_the_index(data_dir, monkeypatch):
+    data = build_tournament(6, 4, seed=2).get_serialized_tournament()
+    save_tournament_to_json(data, TOURNAMENTS_FOLDER, "OPEN.json")
+    filepath = os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")
+    assert os.path.isfile(index_path(filepath))
+    reads = _spy_round_reads(monkeypatch)
+
+    document = load_tournament_document(filepath)
+    assert (document["tournament_name"], len(document["list_of_rounds"])) == (data["tournament_name"], 4)
+    assert reads == []
+    assert document["list_of_rounds"][0] == data["list_of_rounds"][0]
+    assert set(reads) == {0}
+    assert document.to_dict() == load_tournament_from_json(filepath)
+
+
+def test_index_of_a_file_rewritten_elsewhere_is_ignored_then_rebuilt(data_dir):
+    data = build_tournament(4, 3, seed=3).get_serialized_tournament()
+    save_tournament_to_json(data, TOURNAMENTS_FOLDER, "OPEN.json")
+    filepath = os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")
+    stored = load_tournament_from_json(filepath)
+    with open(filepath, "w", encoding="utf-8") as f:
+        json.dump({**stored, "description": "Réécrit à la main"}, f, ensure_ascii=False, indent=4)
+
+    assert read_document(filepath) is None
+    document = read_document(filepath)
+    assert document is not None and document["description"] == "Réécrit à la main"
+    assert document.to_dict()["list_of_rounds"] == stored["list_of_rounds"]
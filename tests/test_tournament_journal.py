@@ -0,0 +1,40 @@
+import os
+
+from config import TOURNAMENTS_FOLDER
+from storage.tournament_data import load_tournament_from_json, record_tournament_event
+from storage.tournament_journal import get_journal
+from storage.tournament_session import tournament_transaction
+
+
+def _stored_fields(data):
+    """Champs du tournoi comparables à l'état en mémoire (sans la révision ni la version du schéma)."""
+    return {key: value for key, value in data.items() if key not in ("revision", "schema_version")}
+
+
+def _reload(filename):
+    """Tournoi relu depuis le disque (checkpoint et journal)."""
+    return _stored_fields(load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, filename)))
+
+
+def test_replayed_journal_matches_tournament_in_memory(play_tournament):
+    for filename, stop_after in (("ROUND1.json", 2), ("ROUND2.json", 4), ("FINI.json", None)):
+        tournament = play_tournament(filename, players=7, stop_after=stop_after)
+        assert get_journal(TOURNAMENTS_FOLDER, filename).has_events()
+        assert _reload(filename) == _stored_fields(tournament.get_serialized_tournament())
+
+
+def test_transaction_coalesces_events_into_one_write(play_tournament):
+    tournament = play_tournament("OPEN.json", stop_after=1)
+    session = tournament.session
+    writes = session.stats["writes"]
+
+    with tournament_transaction(tournament):
+        for field, value in (("location", "LYON"), ("description", "Modifié")):
+            setattr(tournament, field, value)
+            record_tournament_event(
+                tournament, TOURNAMENTS_FOLDER, "OPEN.json", "tournament_updated", {"fields": {field: value}}
+            )
+        assert session.dirty and session.stats["writes"] == writes
+
+    assert (session.stats["writes"], session.dirty) == (writes + 1, False)
+    assert _reload("OPEN.json") == _stored_fields(tournament.get_serialized_tournament())
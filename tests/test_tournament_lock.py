@@ -0,0 +1,86 @@
+import os
+import subprocess
+import sys
+import threading
+
+import pytest
+
+from benchmarks.tournament_encoding import build_tournament
+from config import TOURNAMENTS_FOLDER
+from storage.tournament_data import load_tournament_from_json, save_tournament_to_json, write_tournament_events
+from storage.tournament_journal import journal_path
+from storage.tournament_lock import fcntl, get_tournament_lock
+
+
+def test_hold_excludes_other_threads_and_is_reentrant(data_dir):
+    lock = get_tournament_lock(TOURNAMENTS_FOLDER, "OPEN.json")
+    entered = threading.Event()
+    events = []
+
+    def writer():
+        with lock.hold():
+            events.append("other")
+        entered.set()
+
+    with lock.hold():
+        with lock.hold():
+            thread = threading.Thread(target=writer)
+            thread.start()
+            assert not entered.wait(0.2)
+            events.append("owner")
+        assert not entered.is_set()
+    thread.join(5)
+    assert events == ["owner", "other"]
+
+
+def test_revision_advances_under_lock(data_dir):
+    lock = get_tournament_lock(TOURNAMENTS_FOLDER, "OPEN.json")
+    with lock.hold():
+        assert [lock.advance(), lock.advance()] == [1, 2]
+    assert lock.revision() == 2
+
+
+@pytest.mark.skipif(fcntl is None, reason="verrou fcntl (POSIX)")
+def test_hold_excludes_other_processes(data_dir):
+    lock = get_tournament_lock(TOURNAMENTS_FOLDER, "OPEN.json")
+    probe = (
+        "import fcntl, sys\n"
+        "f = open(sys.argv[1], 'a+b')\n"
+        "try:\n"
+        "    fcntl.flock(f.fileno(), fcntl.LOCK_EX | fcntl.LOCK_NB)\n"
+        "except BlockingIOError:\n"
+        "    sys.exit(1)\n"
+    )
+    with lock.hold():
+        assert subprocess.run([sys.executable, "-c", probe, lock.path]).returncode == 1
+    assert subprocess.run([sys.executable, "-c", probe, lock.path]).returncode == 0
+
+
+@pytest.mark.parametrize("lost", ["revision", "revision+journal"])
+def test_revision_never_goes_back_when_the_revision_file_is_lost(data_dir, lost):
+    tournament = build_tournament(4, 1, seed=1)
+    save_tournament_to_json(tournament.get_serialized_tournament(), TOURNAMENTS_FOLDER, "OPEN.json")
+    for n in range(5):
+        tournament.description = f"d{n}"
+        write_tournament_events(
+            tournament, TOURNAMENTS_FOLDER, "OPEN.json", [("tournament_updated", {"fields": {"description": f"d{n}"}})]
+        )
+    save_tournament_to_json(tournament.get_serialized_tournament(), TOURNAMENTS_FOLDER, "OPEN.json")
+    tournament.description = "d5"
+    write_tournament_events(
+        tournament, TOURNAMENTS_FOLDER, "OPEN.json", [("tournament_updated", {"fields": {"description": "d5"}})]
+    )
+
+    # Fichier de révision absent (nouveau clone du dépôt, arrêt brutal), journal éventuellement aussi
+    lock = get_tournament_lock(TOURNAMENTS_FOLDER, "OPEN.json")
+    os.remove(lock.state_path)
+    if lost == "revision+journal":
+        os.remove(journal_path(TOURNAMENTS_FOLDER, "OPEN.json"))
+    tournament.description = "NEW"
+    write_tournament_events(
+        tournament, TOURNAMENTS_FOLDER, "OPEN.json", [("tournament_updated", {"fields": {"description": "NEW"}})]
+    )
+
+    assert load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json"))["description"] == "NEW"
+    assert lock.revision() == (9 if lost == "revision" else 8)
+    assert not [name for name in os.listdir(TOURNAMENTS_FOLDER) if name.endswith(".tmp")]
@@ -0,0 +1,48 @@
+import os
+
+from config import TOURNAMENTS_FOLDER
+from controllers.match_controller import MatchController
+from controllers.tournament_controller import TournamentController
+from storage.tournament_data import load_tournament_from_json
+from storage.tournament_lock import tournament_revision
+from storage.tournament_session import TournamentSession
+from utils.update_ranks import update_ranks
+from views.match_view import MatchView
+
+
+def _open(filename):
+    """Charge le tournoi comme un autre poste (session à la révision lue)."""
+    revision = tournament_revision(TOURNAMENTS_FOLDER, filename)
+    tournament = TournamentController._build_from_data(
+        load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, filename))
+    )
+    tournament.session = TournamentSession(tournament, TOURNAMENTS_FOLDER, filename, revision)
+    return tournament
+
+
+def _standings(players):
+    return sorted((p["id_national_chess"], p["tournament_score"], p["rank"]) for p in players)
+
+
+def test_two_boards_merge_and_replay_with_merged_ranks(play_tournament, monkeypatch):
+    play_tournament("OPEN.json", players=4, rounds=2, stop_after=0)
+    first, second = _open("OPEN.json"), _open("OPEN.json")
+
+    monkeypatch.setattr(MatchView, "ask_match_result", staticmethod(lambda match: 1))
+    rnd = first.list_of_rounds[0]
+    MatchController.run(rnd.matches[0], rnd, first, "OPEN.json")
+    rnd = second.list_of_rounds[0]
+    MatchController.run(rnd.matches[1], rnd, second, "OPEN.json")
+
+    assert second.session.stats["merges"] == 1
+    expected = second.get_serialized_tournament()["list_of_players"]
+    update_ranks(second)
+    assert _standings(expected) == _standings(second.get_serialized_tournament()["list_of_players"])
+    assert sorted(p[1] for p in _standings(expected)) == [0.0, 0.0, 1.0, 1.0]
+
+    replayed = load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json"))
+    assert _standings(replayed["list_of_players"]) == _standings(expected)
+    for match in replayed["list_of_rounds"][0]["matches"]:
+        for side in ("player_1", "player_2"):
+            snap = match[side]
+            assert snap["rank"] == {p[0]: p[2] for p in _standings(expected)}[snap["id_national_chess"]]
@@ -0,0 +1,84 @@
+import os
+
+import pytest
+
+import storage.tournament_data as tournament_data
+from config import TOURNAMENT_SCHEMA_VERSION, TOURNAMENTS_FOLDER
+from storage.tournament_data import load_tournament_from_json, save_tournament_to_json
+from storage.tournament_journal import journal_path
+
+FILEPATH = os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")
+
+
+def _tournament(actual_round):
+    """Tournoi sans joueurs dont les `actual_round` premiers rounds sont clos."""
+    return {
+        "schema_version": TOURNAMENT_SCHEMA_VERSION, "tournament_name": "OPEN", "location": "PARIS",
+        "start_date": None, "end_date": None, "number_of_rounds": 4, "description": "",
+        "actual_round": actual_round, "list_of_players": [],
+        "list_of_rounds": [
+            {"round_number": n, "start_time": "début", "end_time": "fin", "matches": []}
+            for n in range(1, actual_round + 1)
+        ],
+    }
+
+
+def _save_generations(count):
+    """Enregistre `count` versions successives du tournoi (la dernière a `count` rounds)."""
+    for actual_round in range(1, count + 1):
+        save_tournament_to_json(_tournament(actual_round), TOURNAMENTS_FOLDER, "OPEN.json")
+
+
+@pytest.mark.parametrize("damage", ["truncate", "flip"])
+def test_corrupted_file_is_restored_from_previous_generation(data_dir, capsys, damage):
+    _save_generations(3)
+    with open(FILEPATH, "r+b") as f:
+        if damage == "truncate":
+            f.truncate(os.path.getsize(FILEPATH) // 2)
+        else:
+            f.seek(40)
+            f.write(b"X")
+
+    assert load_tournament_from_json(FILEPATH)["actual_round"] == 2
+    assert "restauré depuis OPEN.json.1" in capsys.readouterr().out
+    # Le fichier restauré se relit sans nouvelle restauration
+    assert load_tournament_from_json(FILEPATH)["actual_round"] == 2
+    assert capsys.readouterr().out == ""
+
+
+def test_corrupted_file_without_valid_generation_raises(data_dir):
+    _save_generations(2)
+    for name in os.listdir(TOURNAMENTS_FOLDER):
+        if name.startswith("OPEN.json"):
+            with open(os.path.join(TOURNAMENTS_FOLDER, name), "wb") as f:
+                f.write(b'{"tournament_name": "OP')
+
+    with pytest.raises(ValueError):
+        load_tournament_from_json(FILEPATH)
+
+
+def test_truncated_journal_line_is_ignored(play_tournament):
+    tournament = play_tournament("OPEN.json", stop_after=2)
+    expected = load_tournament_from_json(FILEPATH)
+    with open(journal_path(TOURNAMENTS_FOLDER, "OPEN.json"), "a", encoding="utf-8") as f:
+        f.write('{"event": "result_recorded", "rev": 999, "data": {"rou')
+
+    assert load_tournament_from_json(FILEPATH) == expected
+    assert expected["actual_round"] == tournament.actual_round
+
+
+def test_journaled_results_survive_a_corrupted_newest_checkpoint(play_tournament, monkeypatch, capsys):
+    # Un checkpoint toutes les 4 écritures : plusieurs versions du fichier pendant le tournoi
+    monkeypatch.setattr(tournament_data, "JOURNAL_CHECKPOINT_INTERVAL", 4)
+    tournament = play_tournament("OPEN.json", players=8, stop_after=9)
+    assert os.path.exists(FILEPATH + ".3")
+    with open(FILEPATH, "r+b") as f:
+        f.truncate(os.path.getsize(FILEPATH) // 2)
+
+    restored = load_tournament_from_json(FILEPATH)
+
+    assert "restauré depuis OPEN.json.1" in capsys.readouterr().out
+    expected = tournament.get_serialized_tournament()
+    assert {key: restored[key] for key in expected if key != "schema_version"} == {
+        key: value for key, value in expected.items() if key != "schema_version"
+    }
@@ -0,0 +1,54 @@
+import copy
+import json
+
+from benchmarks.tournament_encoding import build_tournament
+from storage.tournament_codec import decode_tournament, encode_tournament_binary
+from storage.tournament_document import encode_tournament
+from storage.tournament_snapshots import ExpandedRounds, expand_snapshots, normalize_snapshots
+
+
+def _exact(data):
+    """Forme JSON du tournoi : distingue un entier du flottant de même valeur."""
+    return json.dumps(data, ensure_ascii=False, sort_keys=True)
+
+
+def _snapshots(data):
+    """Snapshots des matchs du tournoi (sans le côté vide des tours de repos)."""
+    for rnd in data["list_of_rounds"]:
+        for match in rnd["matches"]:
+            for side in ("player_1", "player_2"):
+                if match[side] is not None:
+                    yield match[side]
+
+
+def test_normalized_snapshots_expand_to_the_same_tournament():
+    data = build_tournament(9, 5, seed=4).get_serialized_tournament()
+    original = copy.deepcopy(data)
+    normalized = normalize_snapshots(data)
+
+    assert _exact(data) == _exact(original)
+    assert all("played_with" not in snap and "tournament_score" not in snap for snap in _snapshots(normalized))
+    assert _exact(expand_snapshots(copy.deepcopy(normalized))) == _exact(data)
+    rounds = ExpandedRounds(copy.deepcopy(normalized["list_of_rounds"]))
+    assert _exact(rounds[-1]) == _exact(data["list_of_rounds"][-1])
+
+
+def test_normalized_snapshots_decode_from_json_and_binary():
+    data = build_tournament(8, 4, seed=5).get_serialized_tournament()
+    normalized = normalize_snapshots(data)
+
+    for payload in (encode_tournament(normalized)[0], encode_tournament_binary(normalized)):
+        assert _exact(decode_tournament(payload)) == _exact(data)
+    assert len(encode_tournament(normalized)[0]) < len(encode_tournament(data)[0])
+
+
+def test_unexpected_cumulative_fields_are_kept():
+    data = build_tournament(4, 3, seed=6).get_serialized_tournament()
+    snap = data["list_of_rounds"][1]["matches"][0]["player_1"]
+    snap["tournament_score"] += 10
+    snap["played_with"] = ["ZZ99999"]
+    normalized = normalize_snapshots(data)
+
+    kept = normalized["list_of_rounds"][1]["matches"][0]["player_1"]
+    assert (kept["tournament_score"], kept["played_with"]) == (snap["tournament_score"], ["ZZ99999"])
+    assert _exact(decode_tournament(encode_tournament(normalized)[0])) == _exact(data)
@@ -0,0 +1,45 @@
+import os
+
+import storage.tournament_data as tournament_data
+from config import TOURNAMENTS_FOLDER
+from storage.tournament_data import convert_tournaments_layout, load_tournament_document, load_tournament_from_json
+from storage.tournament_split import SPLIT_HEADER, SPLIT_OPEN_ROUND, encode_split, split_path
+
+
+def _stored_fields(data):
+    """Champs du tournoi comparables à l'état en mémoire (sans la révision ni la version du schéma)."""
+    return {key: value for key, value in dict(data).items() if key not in ("revision", "schema_version")}
+
+
+def test_split_tournament_is_written_round_by_round(play_tournament, monkeypatch):
+    monkeypatch.setattr(tournament_data, "TOURNAMENT_LAYOUT", "split")
+    monkeypatch.setattr(tournament_data, "JOURNAL_CHECKPOINT_INTERVAL", 1)
+    tournament = play_tournament("OPEN.json", players=6, rounds=3, stop_after=7)
+    directory = split_path(TOURNAMENTS_FOLDER, "OPEN.json")
+
+    assert not os.path.exists(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json"))
+    assert {SPLIT_HEADER, "round_001.json", "round_002.json", SPLIT_OPEN_ROUND} <= set(os.listdir(directory))
+    expected = tournament.get_serialized_tournament()
+    stored = load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json"))
+    assert _stored_fields(stored) == _stored_fields(expected)
+    document = load_tournament_document(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json"))
+    assert list(document["list_of_rounds"]) == expected["list_of_rounds"]
+    # Les rounds terminés déjà écrits ne sont plus réécrits
+    assert set(encode_split(stored, directory)) == {SPLIT_HEADER, SPLIT_OPEN_ROUND}
+
+
+def test_layout_conversion_round_trip(play_tournament, monkeypatch):
+    tournament = play_tournament("OPEN.json", players=6, rounds=3, stop_after=5)
+    filepath = os.path.join(TOURNAMENTS_FOLDER, "OPEN.json")
+    expected = _stored_fields(tournament.get_serialized_tournament())
+
+    monkeypatch.setattr(tournament_data, "TOURNAMENT_LAYOUT", "split")
+    assert convert_tournaments_layout(TOURNAMENTS_FOLDER) == ["OPEN.json"]
+    assert not os.path.exists(filepath) and os.path.isdir(split_path(TOURNAMENTS_FOLDER, "OPEN.json"))
+    assert _stored_fields(load_tournament_from_json(filepath)) == expected
+    assert convert_tournaments_layout(TOURNAMENTS_FOLDER) == []
+
+    monkeypatch.setattr(tournament_data, "TOURNAMENT_LAYOUT", "file")
+    assert convert_tournaments_layout(TOURNAMENTS_FOLDER) == ["OPEN.json"]
+    assert os.path.isfile(filepath) and not os.path.exists(split_path(TOURNAMENTS_FOLDER, "OPEN.json"))
+    assert _stored_fields(load_tournament_from_json(filepath)) == expected
@@ -0,0 +1,54 @@
+import threading
+from contextlib import contextmanager
+
+import pytest
+
+from storage.write_behind import WriteBehindSaver
+
+
+def _blocking_guard(started, release):
+    """Contexte d'écriture qui retient le thread d'écriture jusqu'à `release`."""
+    @contextmanager
+    def guard():
+        started.set()
+        release.wait(5)
+        yield True
+    return guard
+
+
+def test_pending_versions_of_a_file_are_collapsed(tmp_path):
+    saver = WriteBehindSaver(maxsize=4)
+    started, release = threading.Event(), threading.Event()
+    saver.submit(str(tmp_path / "first.json"), b"first", guard=_blocking_guard(started, release))
+    assert started.wait(5)
+
+    written = []
+    path = str(tmp_path / "OPEN.json")
+    for version in (b"v1", b"v2", b"v3"):
+        saver.submit(path, version, on_written=lambda version=version: written.append(version))
+    saver.submit_files(str(tmp_path / "SPLIT"), {"header.json": b"h1", "round_1.json": b"r1"})
+    saver.submit_files(str(tmp_path / "SPLIT"), {"header.json": b"h2"})
+    assert saver.pending(path) == b"v3"
+    assert saver.pending(str(tmp_path / "SPLIT" / "round_1.json")) == b"r1"
+
+    release.set()
+    saver.drain()
+    assert written == [b"v3"]
+    assert (tmp_path / "OPEN.json").read_bytes() == b"v3"
+    assert (tmp_path / "SPLIT" / "header.json").read_bytes() == b"h2"
+    assert (tmp_path / "SPLIT" / "round_1.json").read_bytes() == b"r1"
+    assert saver.pending(path) is None
+    assert not list(tmp_path.glob("*.tmp"))
+
+
+def test_failed_write_is_reported_once_by_drain(tmp_path):
+    saver = WriteBehindSaver()
+    written = []
+    saver.submit(str(tmp_path / "missing" / "OPEN.json"), b"lost", on_written=lambda: written.append("lost"))
+    saver.submit(str(tmp_path / "OPEN.json"), b"kept")
+
+    with pytest.raises(OSError, match="Échec d'une sauvegarde différée"):
+        saver.drain()
+    assert (tmp_path / "OPEN.json").read_bytes() == b"kept"
+    assert written == [] and not list(tmp_path.glob("*.tmp"))
+    saver.drain()
@@ -0,0 +1,74 @@
+import os
+
+import pytest
+
+import storage.tournament_data as tournament_data
+from benchmarks.tournament_encoding import build_tournament
+from config import PLAYERS_FOLDER, TOURNAMENTS_FOLDER
+from models.player_model import Player
+from storage.player_data import save_players
+from storage.tournament_lock import get_tournament_lock
+from storage.write_behind import drain_writes
+from storage.write_digest import write_stats
+
+
+def _counts(before):
+    """(écritures effectuées, écritures évitées) depuis le relevé `before` de write_stats()."""
+    after = write_stats()
+    return after["written"] - before["written"], after["skipped"] - before["skipped"]
+
+
+def _save(data):
+    """Enregistre le tournoi et attend la fin de son écriture."""
+    tournament_data.save_tournament_to_json(data, TOURNAMENTS_FOLDER, "OPEN.json")
+    drain_writes()
+
+
+@pytest.mark.parametrize("layout", ["file", "split"])
+@pytest.mark.parametrize("write_behind", [False, True])
+def test_identical_tournament_save_is_skipped(data_dir, monkeypatch, layout, write_behind):
+    monkeypatch.setattr(tournament_data, "TOURNAMENT_LAYOUT", layout)
+    monkeypatch.setattr(tournament_data, "WRITE_BEHIND", write_behind)
+    data = build_tournament(6, 2, seed=1).get_serialized_tournament()
+    before = write_stats()
+
+    tournament_data.save_tournament_to_json(data, TOURNAMENTS_FOLDER, "OPEN.json")
+    _save(data)  # encore en attente d'écriture (écriture différée) ou déjà écrit
+    _save(data)  # déjà sur disque
+    assert _counts(before) == (1, 2)
+
+    data["description"] = "Modifié"
+    _save(data)
+    assert _counts(before) == (2, 2)
+    loaded = tournament_data.load_tournament_from_json(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json"))
+    assert loaded["description"] == "Modifié"
+
+
+def test_tournament_written_elsewhere_is_saved_again(data_dir):
+    data = build_tournament(4, 1, seed=2).get_serialized_tournament()
+    _save(data)
+
+    # Révision avancée par un autre processus
+    lock = get_tournament_lock(TOURNAMENTS_FOLDER, "OPEN.json")
+    with lock.hold():
+        lock.advance()
+    before = write_stats()
+    _save(data)
+    assert _counts(before) == (1, 0)
+
+    # Fichier réécrit par ailleurs (date de modification différente)
+    os.utime(os.path.join(TOURNAMENTS_FOLDER, "OPEN.json"), ns=(1, 1))
+    before = write_stats()
+    _save(data)
+    assert _counts(before) == (1, 0)
+
+
+def test_unchanged_player_files_are_not_rewritten(data_dir):
+    players = [Player(idn, "Prénom", "Nom", "01/01/2000").get_serialized_player() for idn in ("AA00001", "AA00002")]
+    save_players(players, PLAYERS_FOLDER)
+    before = write_stats()
+
+    players[1]["last_name"] = "AUTRE"
+    save_players(players, PLAYERS_FOLDER)
+
+    assert _counts(before) == (1, 1)
@@ -4,7 +4,10 @@ from rich.console import Console
 from config import TOURNAMENTS_FOLDER, ENTER_FOR_MAIN_MENU
 from controllers.player_controller import PlayerController
 from controllers.tournament_controller import TournamentController
-from storage.tournament_data import load_tournament_from_json
+from storage.tournament_data import load_tournament_from_json, list_tournament_files
+from storage.tournament_lock import tournament_revision
+from storage.tournament_merge import TournamentConflictError
+from storage.write_behind import drain_writes
 from utils.console import clear_screen, wait_for_enter
 from utils.info_messages import prompt_file_to_load
 from views.reports_view import ReportsView
@@ -36,37 +39,42 @@ class MenuView:
         """
         Boucle principale du menu :
         affiche le menu, lit le choix et appelle la méthode associée.
+        À la sortie, attend la fin des sauvegardes différées.
         """
-        while True:
-            clear_screen()
-            cls.display_main_menu()
-            choix = input("Votre Choix → ").strip()
-
-            if choix == "1":
-                clear_screen()
-                PlayerController.create_player()
-
-            elif choix == "2":
-                clear_screen()
-                tournoi = TournamentController()
-                tournoi.run()
-
-            elif choix == "3":
-                clear_screen()
-                cls._load_tournament_flow()
-
-            elif choix == "4":
-                clear_screen()
-                cls._show_reports_menu()
-
-            elif choix == "0":
+        try:
+            while True:
                 clear_screen()
-                print("👋 Fin du programme, au revoir")
-                break
-
-            else:
-                clear_screen()
-                print("Choix invalide, veuillez réessayer.")
+                cls.display_main_menu()
+                choix = input("Votre Choix → ").strip()
+
+                if choix == "1":
+                    clear_screen()
+                    PlayerController.create_player()
+
+                elif choix == "2":
+                    clear_screen()
+                    tournoi = TournamentController()
+                    tournoi.run()
+
+                elif choix == "3":
+                    clear_screen()
+                    cls._load_tournament_flow()
+
+                elif choix == "4":
+                    clear_screen()
+                    cls._show_reports_menu()
+
+                elif choix == "0":
+                    clear_screen()
+                    print("👋 Fin du programme, au revoir")
+                    break
+
+                else:
+                    clear_screen()
+                    print("Choix invalide, veuillez réessayer.")
+        finally:
+            # Termine les sauvegardes différées avant de quitter (y compris sur Ctrl+C)
+            drain_writes()
 
     @staticmethod
     def _show_reports_menu() -> None:
@@ -109,38 +117,31 @@ class MenuView:
         Gère l'expérience utilisateur de chargement de tournoi :
         liste les fichiers disponibles, demande un choix, puis charge ou redirige.
         """
-        if not os.path.isdir(TOURNAMENTS_FOLDER):
-            print(f"Aucun dossier '{TOURNAMENTS_FOLDER}' trouvé.")
-            print("Créez d’abord un tournoi (option 2).")
-            wait_for_enter(ENTER_FOR_MAIN_MENU)
-            return
-
-        files = cls._list_json_files()
+        files = list_tournament_files(TOURNAMENTS_FOLDER)
         if not files:
             print(f"Aucun tournoi enregistré dans {TOURNAMENTS_FOLDER}.")
             print("Créez d’abord un tournoi (option 2).")
             wait_for_enter(ENTER_FOR_MAIN_MENU)
             return
 
+        cls._list_json_files(files)
         file_choice = cls._prompt_for_file(files)
         if file_choice:
             cls._handle_file_choice(file_choice, files)
 
     @classmethod
-    def _list_json_files(cls) -> list[str]:
+    def _list_json_files(cls, files: list[str]) -> None:
         """
-        Liste et affiche tous les fichiers .json du dossier TOURNAMENTS_FOLDER.
+        Affiche les fichiers de tournois enregistrés.
 
-        Returns:
-            Liste des fichiers .json trouvés.
+        Args:
+            files: Liste des fichiers retournée par list_tournament_files.
         """
-        files = [f for f in os.listdir(TOURNAMENTS_FOLDER) if f.endswith(".json")]
         clear_screen()
         print("\nFichiers de tournois disponibles :\n")
         for filename in files:
             print(f"  • {filename}")
         cls.console.print(prompt_file_to_load())
-        return files
 
     @staticmethod
     def _prompt_for_file(files: list[str]) -> str | None:
@@ -175,6 +176,14 @@ class MenuView:
             return
 
         chemin = os.path.join(TOURNAMENTS_FOLDER, file_choice)
+        # Révision lue avant le chargement : toute écriture ultérieure d'un autre terminal sera fusionnée
+        revision = tournament_revision(TOURNAMENTS_FOLDER, file_choice)
         tournoi_data = load_tournament_from_json(chemin)
-        tournoi = TournamentController.load_existing_tournament(tournoi_data, file_choice)
-        tournoi.resume()
+        tournoi = TournamentController.load_existing_tournament(tournoi_data, file_choice, revision)
+        try:
+            tournoi.resume()
+        except TournamentConflictError as e:
+            clear_screen()
+            print(f"❌ {e}")
+            print("Rechargez le tournoi pour reprendre avec les saisies de l'autre poste.")
+            wait_for_enter(ENTER_FOR_MAIN_MENU)
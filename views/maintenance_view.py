@@ -0,0 +1,148 @@
+class MaintenanceView:
+    """
+    Vue des opérations de maintenance : affiche le bilan de chaque opération.
+    """
+
+    @staticmethod
+    def show_archive_report(report: dict) -> None:
+        """
+        Affiche le bilan de l'archivage des tournois terminés.
+
+        Args:
+            report (dict): Bilan retourné par archive_finished_tournaments.
+        """
+        print("\n" + "=" * 40)
+        print("🗄️       ARCHIVAGE DES TOURNOIS      🗄️")
+        print("=" * 40 + "\n")
+        if not report["files"]:
+            print("Aucun tournoi terminé à archiver.")
+        else:
+            for filename in report["files"]:
+                print(f"  • {filename}")
+            print(f"\n{len(report['files'])} tournoi(s) archivé(s), {report['freed_bytes']} octets libérés.")
+        print(f"Taille de l'archive : {report['archive_bytes']} octets.")
+
+    @staticmethod
+    def show_layout_report(converted: list[str], layout: str) -> None:
+        """
+        Affiche les tournois convertis vers la disposition `layout`.
+
+        Args:
+            converted (list[str]): Tournois convertis.
+            layout (str): Disposition cible ("file" ou "split").
+        """
+        print("\n" + "=" * 40)
+        print("🗂️     CONVERSION DES TOURNOIS      🗂️")
+        print("=" * 40 + "\n")
+        if not converted:
+            print(f"Tous les tournois sont déjà en disposition « {layout} ».")
+            return
+        for filename in converted:
+            print(f"  • {filename}")
+        print(f"\n{len(converted)} tournoi(s) converti(s) en disposition « {layout} ».")
+
+    @staticmethod
+    def show_players_migration_report(report: dict, layout: str) -> None:
+        """
+        Affiche le bilan de la migration des fichiers joueurs vers la disposition `layout`.
+
+        Args:
+            report (dict): Bilan retourné par migrate_player_files.
+            layout (str): Disposition cible ("flat" ou "sharded").
+        """
+        print("\n" + "=" * 40)
+        print("🗂️      MIGRATION DES JOUEURS       🗂️")
+        print("=" * 40 + "\n")
+        if not report["moved"] and not report["duplicates"]:
+            print(f"Tous les fichiers joueurs sont déjà en disposition « {layout} ».")
+            return
+        print(f"{report['moved']} fichier(s) joueur déplacé(s) en disposition « {layout} ».")
+        if report["duplicates"]:
+            print(f"{report['duplicates']} ancien(s) fichier(s) supprimé(s) (déjà présents au nouvel emplacement).")
+
+    @staticmethod
+    def show_schema_migration_report(report: dict) -> None:
+        """
+        Affiche le bilan de la migration du schéma des documents.
+
+        Args:
+            report (dict): Bilan retourné par migrate_schema.
+        """
+        print("\n" + "=" * 40)
+        print("🧬       MIGRATION DU SCHÉMA        🧬")
+        print("=" * 40 + "\n")
+        for kind, label in (("players", "joueur(s)"), ("tournaments", "tournoi(s)")):
+            counts = report[kind]
+            print(f"{counts['upgraded']} {label} migré(s), {counts['current']} déjà à jour.")
+            for filename, error in counts["errors"]:
+                print(f"  • {filename} ignoré : {error}")
+
+    @staticmethod
+    def show_import_report(source: str, report: dict) -> None:
+        """
+        Affiche le bilan de l'import des joueurs.
+
+        Args:
+            source (str): Le fichier importé.
+            report (dict): Bilan retourné par import_players.
+        """
+        print("\n" + "=" * 40)
+        print("📥        IMPORT DES JOUEURS        📥")
+        print("=" * 40 + "\n")
+        print(f"Fichier : {source}")
+        print(f"{report['imported']} joueur(s) importé(s).")
+        if report["rejected"]:
+            print(f"{report['rejected']} ligne(s) rejetée(s), détail dans : {report['rejects_path']}")
+
+    @staticmethod
+    def show_import_error(source: str, error: Exception) -> None:
+        """
+        Affiche l'erreur qui a empêché l'import du fichier `source`.
+
+        Args:
+            source (str): Le fichier à importer.
+            error (Exception): L'erreur rencontrée.
+        """
+        print(f"Import impossible de {source} : {error}")
+
+    @staticmethod
+    def show_player_table_report(count: int) -> None:
+        """
+        Affiche le bilan de la construction de la table des joueurs.
+
+        Args:
+            count (int): Nombre de profils écrits dans la table.
+        """
+        print(f"{count} profil(s) joueur écrit(s) dans la table des joueurs.")
+
+    @staticmethod
+    def show_player_table_error(error: Exception) -> None:
+        """
+        Affiche l'erreur qui a interrompu la construction de la table des joueurs.
+
+        Args:
+            error (Exception): L'erreur rencontrée.
+        """
+        print(f"Construction de la table des joueurs impossible : {error}")
+
+    @staticmethod
+    def show_export_report(destination: str, count: int) -> None:
+        """
+        Affiche le bilan d'un export.
+
+        Args:
+            destination (str): Le fichier écrit.
+            count (int): Nombre de lignes exportées.
+        """
+        print(f"{count} ligne(s) exportée(s) dans {destination}.")
+
+    @staticmethod
+    def show_export_error(destination: str, error: Exception) -> None:
+        """
+        Affiche l'erreur qui a empêché l'export vers `destination`.
+
+        Args:
+            destination (str): Le fichier à écrire.
+            error (Exception): L'erreur rencontrée.
+        """
+        print(f"Export impossible vers {destination} : {error}")
@@ -1,6 +1,7 @@
 from rich.console import Console
 
 from models.player_model import Player
+from storage.player_data import hydrate_players
 from utils.input_formatters import (
     format_first_name,
     format_name,
@@ -89,6 +90,7 @@ class PlayerView:
         """
         Tri la liste des joueurs par nom (MAJ) puis prénom (Capitalisé).
         """
+        hydrate_players(players)
         # Tri par nom (MAJ) puis prénom (Capitalisé)
         sorted_list = sorted(
             players,
@@ -189,3 +191,33 @@ class PlayerView:
             id_national (str): Identifiant national du joueur dupliqué.
         """
         PlayerView.console.print(player_already_in_tournament_text(id_national))
+
+    @staticmethod
+    def display_no_search_result(query: str) -> None:
+        """
+        Informe qu'aucun joueur ne correspond au nom recherché.
+
+        Args:
+            query (str): Le texte recherché.
+        """
+        if query.strip():
+            PlayerView.console.print(f"Aucun joueur ne correspond à « {query.strip()} ».\n")
+
+    @staticmethod
+    def choose_player_from_search(matches: list[dict]) -> str | None:
+        """
+        Affiche les joueurs trouvés par une recherche par nom et demande d'en choisir un.
+
+        Args:
+            matches (list[dict]): Joueurs trouvés (id_national_chess, last_name, first_name).
+
+        Returns:
+            str | None: L'IDN du joueur choisi, ou None pour faire une nouvelle recherche.
+        """
+        PlayerView.console.print("\n[b]Joueurs trouvés :[/b]")
+        for idx, match in enumerate(matches, start=1):
+            print(f"{idx}. {match['last_name']} {match['first_name']} (IDN : {match['id_national_chess']})")
+        choice = input("\nNuméro du joueur (Entrée pour une nouvelle recherche) : ").strip()
+        if choice.isdigit() and 1 <= int(choice) <= len(matches):
+            return matches[int(choice) - 1]["id_national_chess"]
+        return None
@@ -4,8 +4,13 @@ from rich.console import Console
 from config import PLAYERS_FOLDER, TOURNAMENTS_FOLDER, ENTER_FOR_RAPPORT
 from controllers.tournament_controller import TournamentController
 from models.player_model import Player
-from storage.player_data import load_players_from_json, load_player_from_json
-from storage.tournament_data import load_tournament_from_json
+from storage.player_data import hydrate_players, lazy_players, load_players_from_json
+from storage.tournament_data import (
+    load_tournament_document,
+    load_tournament_summary,
+    list_tournament_files,
+    list_tournament_summaries
+)
 from utils.console import clear_screen, wait_for_enter
 from utils.info_messages import prompt_file_to_load
 from utils.ui_helpers import show_tournament_information
@@ -27,36 +32,43 @@ class ReportsView:
     @staticmethod
     def list_all_tournaments():
         clear_screen()
-        if not os.path.isdir(TOURNAMENTS_FOLDER):
-            print(f"Aucun dossier '{TOURNAMENTS_FOLDER}' trouvé.")
+        summaries = list_tournament_summaries(TOURNAMENTS_FOLDER)
+        if not summaries:
+            print(f"Aucun tournoi enregistré dans {TOURNAMENTS_FOLDER}.")
         else:
-            files = sorted(f for f in os.listdir(TOURNAMENTS_FOLDER) if f.endswith('.json'))
-            if not files:
-                print(f"Aucun tournoi enregistré dans {TOURNAMENTS_FOLDER}.")
-            else:
-                print("\n" + "=" * 40)
-                print("🏆   LISTE DES TOURNOIS ENREGISTRÉS   🏆")
-                print("=" * 40 + "\n")
-                for idx, filename in enumerate(files, start=1):
-                    print(f"{idx}. {filename}")
+            print("\n" + "=" * 40)
+            print("🏆   LISTE DES TOURNOIS ENREGISTRÉS   🏆")
+            print("=" * 40 + "\n")
+            for idx, summary in enumerate(summaries, start=1):
+                print(f"{idx}. {summary['filename']}")
+                print(f"   {ReportsView._format_summary(summary)}")
         print()
         wait_for_enter(ENTER_FOR_RAPPORT)
         clear_screen()
 
+    @staticmethod
+    def _format_summary(summary: dict) -> str:
+        """
+        Ligne de résumé d'un tournoi du catalogue : lieu, dates, avancement, joueurs
+        et mention des tournois archivés.
+        """
+        miss_info = "?"
+        rounds = summary.get("number_of_rounds")
+        return (
+            f"{summary.get('location') or miss_info} · "
+            f"{summary.get('start_date') or miss_info} → {summary.get('end_date') or miss_info} · "
+            f"round {summary.get('actual_round') or 0}/{rounds if rounds is not None else miss_info} · "
+            f"{summary.get('player_count', 0)} joueur(s)"
+            f"{' · archivé' if summary.get('archived') else ''}"
+        )
+
     @staticmethod
     def _choose_tournament_file() -> str:
         """
         Affiche la liste des fichiers JSON dans TOURNAMENTS_FOLDER et demande de choisir.
         Renvoie le chemin complet du fichier sélectionné, ou vide si l'utilisateur annule.
         """
-        if not os.path.isdir(TOURNAMENTS_FOLDER):
-            clear_screen()
-            print(f"Aucun dossier '{TOURNAMENTS_FOLDER}' trouvé.")
-            wait_for_enter(ENTER_FOR_RAPPORT)
-            clear_screen()
-            return ""
-
-        files = sorted(f for f in os.listdir(TOURNAMENTS_FOLDER) if f.endswith('.json'))
+        files = list_tournament_files(TOURNAMENTS_FOLDER)
         if not files:
             clear_screen()
             print(f"Aucun tournoi enregistré dans {TOURNAMENTS_FOLDER}.")
@@ -94,7 +106,8 @@ class ReportsView:
         if not chemin:
             return
 
-        data = load_tournament_from_json(chemin)
+        # Les champs affichés proviennent du catalogue : le fichier du tournoi n'est pas relu
+        data = load_tournament_summary(TOURNAMENTS_FOLDER, os.path.basename(chemin))
         miss_info = "[Info manquante]"
         no_desc = "[Pas de description]"
 
@@ -149,7 +162,8 @@ class ReportsView:
         if not chemin:
             return
 
-        data = load_tournament_from_json(chemin)
+        # Seule la liste des joueurs est lue : les rounds ne sont pas désérialisés
+        data = load_tournament_document(chemin)
         players, missing_ids = ReportsView._load_players_from_tournament_data(data)
 
         clear_screen()
@@ -163,27 +177,16 @@ class ReportsView:
     @staticmethod
     def _load_players_from_tournament_data(data: dict) -> tuple[list[Player], list[str]]:
         """
-        Charge les profils joueurs d'un tournoi à partir du JSON.
+        Charge les profils joueurs d'un tournoi à partir du JSON
+        (tous les profils sont lus en un seul lot, voir hydrate_players).
 
         Returns:
             Tuple : (liste des joueurs valides, liste des ID manquants)
         """
-        players_data = data.get("list_of_players", [])
-        players: list[Player] = []
-        missing: list[str] = []
-
-        for p in players_data:
-            idn = p.get("id_national_chess", "")
-            try:
-                player = load_player_from_json(PLAYERS_FOLDER, idn)
-            except FileNotFoundError:
-                missing.append(idn)
-            else:
-                player.tournament_score = p.get("tournament_score", 0.0)
-                player.rank = p.get("rank", 0)
-                player.played_with = p.get("played_with", [])
-                players.append(player)
-
+        all_players = lazy_players(data.get("list_of_players", []), PLAYERS_FOLDER)
+        hydrate_players(all_players)
+        players = [p for p in all_players if p.has_profile]
+        missing = [p.id_national_chess for p in all_players if not p.has_profile]
         return players, missing
 
     @staticmethod
@@ -216,13 +219,9 @@ class ReportsView:
         if not chemin:
             return
 
-        # Récupérer le nom de fichier (ex. "mon_tournoi_20250605.json")
-        filename = os.path.basename(chemin)
-
-        # Charger les données JSON et reconstruire un TournamentController temporaire
-        data = load_tournament_from_json(chemin)
-        controller = TournamentController.load_existing_tournament(data, filename)
-        tournoi = controller.tournament
+        # Charger le tournoi (rounds lus à la demande) et reconstruire le modèle
+        data = load_tournament_document(chemin)
+        tournoi = TournamentController._build_from_data(data)
 
         clear_screen()
         # show_tournament_summary affiche automatiquement tous les rounds et matchs
@@ -5,6 +5,7 @@ from rich.text import Text
 
 from models.round_model import Round
 from models.player_model import Player
+from storage.player_data import hydrate_players
 from utils.console import clear_screen
 
 
@@ -23,6 +24,7 @@ class RoundView:
         avec alignement des IDN et des scores.
         """
         RoundView.console.print("\n[b yellow]Classement intermédiaire[/b yellow]\n")
+        hydrate_players(players)
 
         # Préparer deux listes :
         # - left_parts contiendra "1. Prénom NOM"
@@ -69,6 +71,7 @@ class RoundView:
         Retourne un rapport textuel aligné des matchs de ce round,
         plaçant les byes en premier et espaçant par des lignes vides.
         """
+        hydrate_players(p for m in rnd.matches for p in (m.player_1, m.player_2) if p is not None)
         # tri : byes d'abord
         ordered = sorted(rnd.matches, key=lambda m: m.player_2 is not None)
         groups: List[List[tuple]] = []
@@ -1,11 +1,11 @@
-import os
 from rich.console import Console
 from rich.table import Table
 from rich import box
 
-from config import PLAYERS_FOLDER, PLAYERS_FILENAME, ENTER_FOR_CONTINUE, DEFAULT_NUMBER_OF_ROUND
+from config import PLAYERS_FOLDER, ENTER_FOR_CONTINUE, DEFAULT_NUMBER_OF_ROUND
 from controllers.player_controller import PlayerController
 from models.tournament_model import Tournament
+from storage.player_data import hydrate_players, player_exists, search_players
 from utils.console import wait_for_enter
 from utils.console import clear_screen
 from utils.input_manager import get_valid_input
@@ -139,28 +139,18 @@ class TournamentView:
         Inscrit un seul joueur (joueur #idx sur max_players) et le retourne.
         1. Affiche l’en-tête d’inscription (sans retomber sur la liste).
         2. Appelle display_player_registration_text(idx, max_players).
-        3. Demande l’IDN via get_valid_input.
+        3. Demande l’IDN, ou retrouve le joueur par son nom (voir ask_player_idn_or_name).
         4. Appelle PlayerController.create_player_with_id pour charger/créer/compléter le profil.
         5. Renvoie l’objet Player complet.
         """
         # 1. Afficher uniquement l’en-tête d’inscription (juste le compteur, sans la liste)
         TournamentView.show_registration_header(idx - 1, max_players)
 
-        # 2. Lecture de l’IDN
-        id_input = get_valid_input(
-            prompt="IDN (XX00000) du joueur : ",
-            formatter=format_id_national_chess,
-            validator=is_valid_id_national_chess,
-            message_error=invalid_id_national_chess,
-        )
-
-        filepath = os.path.join(
-            PLAYERS_FOLDER,
-            PLAYERS_FILENAME.format(id_input=id_input)
-        )
+        # 2. Lecture de l’IDN (ou recherche du joueur par nom)
+        id_input = TournamentView.ask_player_idn_or_name()
 
-        # 3. Si le fichier n'existe pas, afficher le message “Aucun profil trouvé…”, attendre Entrée
-        if not os.path.exists(filepath):
+        # 3. Si le profil n'existe pas, afficher le message “Aucun profil trouvé…”, attendre Entrée
+        if not player_exists(PLAYERS_FOLDER, id_input):
             PlayerView.display_nonexistent_player(id_input)
             print()
             wait_for_enter(ENTER_FOR_CONTINUE)
@@ -171,6 +161,31 @@ class TournamentView:
         # 5. Retourner le Player complet
         return player
 
+    @staticmethod
+    def ask_player_idn_or_name() -> str:
+        """
+        Demande l’IDN du joueur à inscrire. Une saisie qui n’est pas un IDN valide est
+        cherchée dans l’index des noms (début du nom et/ou du prénom, sans accents) :
+        l’arbitre choisit alors le joueur dans la liste des résultats.
+
+        Returns:
+            str: L’IDN du joueur.
+        """
+        while True:
+            raw_input = input("IDN (XX00000) ou nom du joueur : ")
+            id_input = format_id_national_chess(raw_input)
+            if is_valid_id_national_chess(id_input):
+                return id_input
+
+            matches = search_players(PLAYERS_FOLDER, raw_input)
+            if not matches:
+                invalid_id_national_chess()
+                PlayerView.display_no_search_result(raw_input)
+                continue
+            choice = PlayerView.choose_player_from_search(matches)
+            if choice is not None:
+                return choice
+
     @staticmethod
     def display_player_already_in_tournament_text(id_national: str):
         TournamentView.console.print(player_already_in_tournament_text(id_national))
@@ -195,6 +210,8 @@ class TournamentView:
         clear_screen()
         console = TournamentView.console
 
+        # Profils de tous les joueurs lus en un seul lot avant l'affichage des tableaux
+        hydrate_players(tournament.list_of_players)
         players_map = TournamentView._build_players_map(tournament)
 
         if tournament.actual_round == 0:
@@ -216,8 +233,8 @@ class TournamentView:
                         f"Le round {tournament.actual_round} est en cours...[/italic yellow]"
                     )
 
-    console.print()
-    console.print("[bold green]»» Résumé du tournoi affiché.[/bold green]\n")
+        console.print()
+        console.print("[bold green]»» Résumé du tournoi affiché.[/bold green]\n")
 
     @staticmethod
     def _build_players_map(tournament: Tournament) -> dict: